@@ -13,8 +13,11 @@ from app.models import (  # noqa: F401
     ChatMessage,
     CoverLetter,
     Job,
+    JobCandidateMatch,
+    JobEmbedding,
     JobMatchResult,
     Resume,
+    ResumeEmbedding,
     ResumeFeedback,
     ResumeParseResult,
     User,
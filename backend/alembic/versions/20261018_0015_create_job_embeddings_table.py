@@ -0,0 +1,38 @@
+"""create job embeddings table
+
+Revision ID: 20261018_0015
+Revises: 20260225_0014
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_0015"
+down_revision = "20260225_0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_embeddings",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("job_id", sa.String(length=36), nullable=False),
+        sa.Column("model_name", sa.String(length=120), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("job_id", "model_name", name="uq_job_embeddings_job_model"),
+    )
+    op.create_index("ix_job_embeddings_job_id", "job_embeddings", ["job_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_embeddings_job_id", table_name="job_embeddings")
+    op.drop_table("job_embeddings")
@@ -0,0 +1,52 @@
+"""create resume embeddings table
+
+Revision ID: 20261018_0016
+Revises: 20261018_0015
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_0016"
+down_revision = "20261018_0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "resume_embeddings",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("resume_id", sa.String(length=36), nullable=False),
+        sa.Column("model_name", sa.String(length=120), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["resume_id"], ["resumes.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("resume_id", "model_name", name="uq_resume_embeddings_resume_model"),
+    )
+    op.create_index("ix_resume_embeddings_resume_id", "resume_embeddings", ["resume_id"], unique=False)
+    op.create_index(
+        "ix_resume_embeddings_model_updated_at",
+        "resume_embeddings",
+        ["model_name", "updated_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_job_embeddings_model_updated_at",
+        "job_embeddings",
+        ["model_name", "updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_embeddings_model_updated_at", table_name="job_embeddings")
+    op.drop_index("ix_resume_embeddings_model_updated_at", table_name="resume_embeddings")
+    op.drop_index("ix_resume_embeddings_resume_id", table_name="resume_embeddings")
+    op.drop_table("resume_embeddings")
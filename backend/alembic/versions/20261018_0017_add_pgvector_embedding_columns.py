@@ -0,0 +1,39 @@
+"""add pgvector embedding columns
+
+Revision ID: 20261018_0017
+Revises: 20261018_0016
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_0017"
+down_revision = "20261018_0016"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("job_embeddings", "resume_embeddings")
+# Fixed here rather than read from the environment so the schema does not
+# depend on whoever runs the migration; a model with another size needs its
+# own migration. The app reads the dimension back from the column.
+_DIMENSIONS = 1536
+
+
+def upgrade() -> None:
+    # pgvector is optional: without the extension the NumPy index stays in use.
+    available = op.get_bind().scalar(sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'vector'"))
+    if not available:
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ADD COLUMN embedding vector({_DIMENSIONS})")
+        op.execute(f"CREATE INDEX ix_{table}_embedding ON {table} USING hnsw (embedding vector_cosine_ops)")
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_embedding")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS embedding")
@@ -0,0 +1,32 @@
+"""version job match results
+
+Revision ID: 20261018_0018
+Revises: 20261018_0017
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_0018"
+down_revision = "20261018_0017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("job_match_results", sa.Column("model_name", sa.String(length=120), nullable=True))
+    op.add_column("job_match_results", sa.Column("resume_content_hash", sa.String(length=64), nullable=True))
+    op.add_column("job_match_results", sa.Column("catalog_version", sa.DateTime(), nullable=True))
+    op.add_column(
+        "job_match_results",
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("job_match_results", "updated_at")
+    op.drop_column("job_match_results", "catalog_version")
+    op.drop_column("job_match_results", "resume_content_hash")
+    op.drop_column("job_match_results", "model_name")
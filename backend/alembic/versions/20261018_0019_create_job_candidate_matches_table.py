@@ -0,0 +1,43 @@
+"""create job candidate matches table
+
+Revision ID: 20261018_0019
+Revises: 20261018_0018
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_0019"
+down_revision = "20261018_0018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_candidate_matches",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("job_id", sa.String(length=36), nullable=False),
+        sa.Column("resume_id", sa.String(length=36), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("model_name", sa.String(length=120), nullable=False),
+        sa.Column("similarity_score", sa.Float(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("notified_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["resume_id"], ["resumes.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("job_id", "resume_id", name="uq_job_candidate_match_job_resume"),
+    )
+    op.create_index("ix_job_candidate_matches_job_id", "job_candidate_matches", ["job_id"], unique=False)
+    op.create_index("ix_job_candidate_matches_user_id", "job_candidate_matches", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_candidate_matches_user_id", table_name="job_candidate_matches")
+    op.drop_index("ix_job_candidate_matches_job_id", table_name="job_candidate_matches")
+    op.drop_table("job_candidate_matches")
@@ -0,0 +1,42 @@
+"""add jobs search vector
+
+Revision ID: 20261018_0020
+Revises: 20261018_0019
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261018_0020"
+down_revision = "20261018_0019"
+branch_labels = None
+depends_on = None
+
+# Kept literal so later model edits cannot change what this revision creates.
+_SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(jsonb_to_tsvector('simple', coalesce(skills, '[]'::jsonb), '[\"string\"]'), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(location, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "jobs",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(_SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index("ix_jobs_search_vector", "jobs", ["search_vector"], unique=False, postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_search_vector", table_name="jobs")
+    op.drop_column("jobs", "search_vector")
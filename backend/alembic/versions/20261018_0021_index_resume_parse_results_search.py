@@ -0,0 +1,83 @@
+"""index resume parse results search
+
+Revision ID: 20261018_0021
+Revises: 20261018_0020
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261018_0021"
+down_revision = "20261018_0020"
+branch_labels = None
+depends_on = None
+
+_JSON_COLUMNS = ("skills", "experience", "education", "entities")
+# Kept literal so later model edits cannot change what this revision creates.
+_SEARCH_VECTOR_EXPRESSION = (
+    "setweight(jsonb_to_tsvector('simple', skills, '[\"string\"]'), 'A') || "
+    "setweight(jsonb_to_tsvector('simple', experience, '[\"string\"]'), 'B') || "
+    "setweight(jsonb_to_tsvector('simple', education, '[\"string\"]'), 'C')"
+)
+_SEARCH_TEXT_EXPRESSION = "skills::text || ' ' || experience::text || ' ' || education::text"
+
+
+def upgrade() -> None:
+    for column in _JSON_COLUMNS:
+        op.alter_column(
+            "resume_parse_results",
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+    op.add_column(
+        "resume_parse_results",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(_SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "resume_parse_results",
+        sa.Column("search_text", sa.Text(), sa.Computed(_SEARCH_TEXT_EXPRESSION, persisted=True), nullable=True),
+    )
+    op.create_index(
+        "ix_resume_parse_results_search_vector",
+        "resume_parse_results",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+    # pg_trgm is a contrib module; without it substring search still works, just unindexed.
+    available = op.get_bind().scalar(sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"))
+    if available:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX ix_resume_parse_results_search_text ON resume_parse_results "
+            "USING gin (search_text gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_resume_parse_results_search_text")
+    op.drop_index("ix_resume_parse_results_search_vector", table_name="resume_parse_results")
+    op.drop_column("resume_parse_results", "search_text")
+    op.drop_column("resume_parse_results", "search_vector")
+    for column in _JSON_COLUMNS:
+        op.alter_column(
+            "resume_parse_results",
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::json",
+        )
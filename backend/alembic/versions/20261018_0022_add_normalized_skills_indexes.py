@@ -0,0 +1,45 @@
+"""add normalized skills indexes
+
+Revision ID: 20261018_0022
+Revises: 20261018_0021
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261018_0022"
+down_revision = "20261018_0021"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("jobs", "resume_parse_results")
+_SKILLS_NORMALIZED_EXPRESSION = "lower(skills::text)::jsonb"
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "skills_normalized",
+                postgresql.JSONB(),
+                sa.Computed(_SKILLS_NORMALIZED_EXPRESSION, persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(
+            f"ix_{table}_skills_normalized",
+            table,
+            ["skills_normalized"],
+            unique=False,
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.drop_index(f"ix_{table}_skills_normalized", table_name=table)
+        op.drop_column(table, "skills_normalized")
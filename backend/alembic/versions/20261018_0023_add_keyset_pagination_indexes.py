@@ -0,0 +1,35 @@
+"""add keyset pagination indexes
+
+Revision ID: 20261018_0023
+Revises: 20261018_0022
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+
+revision = "20261018_0023"
+down_revision = "20261018_0022"
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    ("ix_jobs_created_at_id", "jobs", ["created_at", "id"]),
+    ("ix_jobs_recruiter_id_created_at_id", "jobs", ["recruiter_id", "created_at", "id"]),
+    ("ix_users_created_at_id", "users", ["created_at", "id"]),
+    ("ix_audit_logs_created_at_id", "audit_logs", ["created_at", "id"]),
+    ("ix_audit_logs_user_id_created_at_id", "audit_logs", ["user_id", "created_at", "id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns, unique=False)
+    # The composite index serves every query the single-column one did.
+    op.drop_index("ix_audit_logs_created_at", table_name="audit_logs")
+
+
+def downgrade() -> None:
+    op.create_index("ix_audit_logs_created_at", "audit_logs", ["created_at"], unique=False)
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
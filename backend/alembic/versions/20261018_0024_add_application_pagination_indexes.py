@@ -0,0 +1,30 @@
+"""add application pagination indexes
+
+Revision ID: 20261018_0024
+Revises: 20261018_0023
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+
+revision = "20261018_0024"
+down_revision = "20261018_0023"
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    ("ix_applications_created_at_id", ["created_at", "id"]),
+    ("ix_applications_user_id_created_at_id", ["user_id", "created_at", "id"]),
+    ("ix_applications_job_id_created_at_id", ["job_id", "created_at", "id"]),
+)
+
+
+def upgrade() -> None:
+    for name, columns in _INDEXES:
+        op.create_index(name, "applications", columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name="applications")
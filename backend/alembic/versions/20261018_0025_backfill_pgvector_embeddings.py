@@ -0,0 +1,63 @@
+"""backfill pgvector embeddings
+
+Revision ID: 20261018_0025
+Revises: 20261018_0024
+Create Date: 2026-10-18
+"""
+
+from array import array
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_0025"
+down_revision = "20261018_0024"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("job_embeddings", "resume_embeddings")
+_BATCH_SIZE = 1000
+
+
+def _vector_literal(raw: bytes) -> str:
+    # The bytea column holds packed float32 values (similarity_service.encode_vector).
+    return "[" + ",".join(f"{value:.7g}" for value in array("f", raw)) + "]"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table in _TABLES:
+        # atttypmod of a vector(n) column is n; no row means pgvector was not installed.
+        dimensions = bind.scalar(
+            sa.text(
+                "SELECT atttypmod FROM pg_attribute "
+                "WHERE attrelid = to_regclass(:table) AND attname = 'embedding' AND NOT attisdropped"
+            ),
+            {"table": table},
+        )
+        if not dimensions or dimensions < 0:
+            continue
+
+        last_id = ""
+        while True:
+            rows = bind.execute(
+                sa.text(
+                    f"SELECT id, vector FROM {table} "
+                    "WHERE embedding IS NULL AND octet_length(vector) = :size AND id > :last_id "
+                    "ORDER BY id LIMIT :limit"
+                ),
+                {"size": dimensions * 4, "last_id": last_id, "limit": _BATCH_SIZE},
+            ).all()
+            if not rows:
+                break
+            bind.execute(
+                sa.text(f"UPDATE {table} SET embedding = CAST(:embedding AS vector) WHERE id = :id"),
+                [{"id": row.id, "embedding": _vector_literal(bytes(row.vector))} for row in rows],
+            )
+            last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    # The bytea column is untouched, so there is nothing to undo.
+    pass
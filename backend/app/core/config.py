@@ -39,11 +39,63 @@ class Settings:
         self.ai_api_key = os.getenv("AI_API_KEY", "")
         self.embedding_api_key = os.getenv("EMBEDDING_API_KEY", self.ai_api_key)
         self.embedding_api_url = os.getenv("EMBEDDING_API_URL", "https://api.openai.com/v1/embeddings")
-        self.embedding_model = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+        self.embedding_provider = os.getenv("EMBEDDING_PROVIDER", "http").lower()
+        # Vectors are stored per model name, so the local backend gets its own label.
+        default_embedding_model = "local-hashing-v1" if self.embedding_provider == "local" else "text-embedding-3-small"
+        self.embedding_model = os.getenv("EMBEDDING_MODEL", default_embedding_model)
         self.embedding_timeout_seconds = float(os.getenv("EMBEDDING_TIMEOUT_SECONDS", "15"))
+        self.embedding_http_max_connections = int(os.getenv("EMBEDDING_HTTP_MAX_CONNECTIONS", "20"))
+        self.embedding_http_max_keepalive_connections = int(os.getenv("EMBEDDING_HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+        self.embedding_http_keepalive_expiry_seconds = float(os.getenv("EMBEDDING_HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+        self.embedding_http2 = os.getenv("EMBEDDING_HTTP2", "false").lower() == "true"
+        self.embedding_batch_size = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))
+        self.embedding_batch_max_tokens = int(os.getenv("EMBEDDING_BATCH_MAX_TOKENS", "100000"))
+        self.embedding_max_concurrency = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "4"))
+        self.embedding_max_retries = int(os.getenv("EMBEDDING_MAX_RETRIES", "4"))
+        self.embedding_retry_base_seconds = float(os.getenv("EMBEDDING_RETRY_BASE_SECONDS", "0.5"))
+        self.embedding_retry_max_seconds = float(os.getenv("EMBEDDING_RETRY_MAX_SECONDS", "20"))
+        self.embedding_dimensions = int(os.getenv("EMBEDDING_DIMENSIONS", "1536"))
+        self.vector_backend = os.getenv("VECTOR_BACKEND", "numpy").lower()
+        self.vector_index_dir = os.getenv("VECTOR_INDEX_DIR", str(BASE_DIR / "storage" / "vector_index"))
+        self.vector_index_nprobe = int(os.getenv("VECTOR_INDEX_NPROBE", "16"))
+        self.vector_index_min_train_size = int(os.getenv("VECTOR_INDEX_MIN_TRAIN_SIZE", "2048"))
+        self.vector_index_sync_seconds = float(os.getenv("VECTOR_INDEX_SYNC_SECONDS", "5"))
+        self.embedding_backfill_seconds = float(os.getenv("EMBEDDING_BACKFILL_SECONDS", "60"))
+        self.candidate_match_top_n = int(os.getenv("CANDIDATE_MATCH_TOP_N", "50"))
+        self.candidate_match_min_score = float(os.getenv("CANDIDATE_MATCH_MIN_SCORE", "0.3"))
+        self.match_matrix_resume_block_size = int(os.getenv("MATCH_MATRIX_RESUME_BLOCK_SIZE", "1024"))
+        self.match_matrix_job_block_size = int(os.getenv("MATCH_MATRIX_JOB_BLOCK_SIZE", "8192"))
+        self.match_matrix_schedule_hour = int(os.getenv("MATCH_MATRIX_SCHEDULE_HOUR", "2"))
+        self.search_query_cache_ttl_seconds = float(os.getenv("SEARCH_QUERY_CACHE_TTL_SECONDS", "600"))
+        self.search_result_cache_ttl_seconds = float(os.getenv("SEARCH_RESULT_CACHE_TTL_SECONDS", "120"))
+        self.search_result_cache_depth = int(os.getenv("SEARCH_RESULT_CACHE_DEPTH", "500"))
+        self.search_cache_max_entries = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1024"))
+        self.hybrid_search_candidates = int(os.getenv("HYBRID_SEARCH_CANDIDATES", "100"))
+        self.search_count_estimate_threshold = int(os.getenv("SEARCH_COUNT_ESTIMATE_THRESHOLD", "1000"))
         self.storage_backend = os.getenv("STORAGE_BACKEND", "local").lower()
         self.resume_upload_dir = os.getenv("RESUME_UPLOAD_DIR", str(BASE_DIR / "storage" / "resumes"))
         self.max_resume_file_size = int(os.getenv("MAX_RESUME_FILE_SIZE", str(5 * 1024 * 1024)))
+        self.resume_parse_workers = int(os.getenv("RESUME_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+        self.resume_parse_max_pending = int(os.getenv("RESUME_PARSE_MAX_PENDING", "16"))
+        self.resume_parse_timeout_seconds = float(os.getenv("RESUME_PARSE_TIMEOUT_SECONDS", "60"))
+        self.skills_taxonomy_path = os.getenv(
+            "SKILLS_TAXONOMY_PATH", str(BASE_DIR / "app" / "data" / "skills_taxonomy.json")
+        )
+        self.ner_backend = os.getenv("NER_BACKEND", "onnx").lower()
+        self.ner_model = os.getenv("NER_MODEL", "dslim/bert-base-NER")
+        self.ner_model_path = os.getenv("NER_MODEL_PATH", str(BASE_DIR / "storage" / "models" / "ner"))
+        self.ner_max_tokens = int(os.getenv("NER_MAX_TOKENS", "512"))
+        self.ner_stride_tokens = int(os.getenv("NER_STRIDE_TOKENS", "128"))
+        self.ner_batch_size = int(os.getenv("NER_BATCH_SIZE", "16"))
+        self.ner_num_threads = int(os.getenv("NER_NUM_THREADS", "0"))
+        self.ner_remote_window_chars = int(os.getenv("NER_REMOTE_WINDOW_CHARS", "4000"))
+        self.ner_remote_overlap_chars = int(os.getenv("NER_REMOTE_OVERLAP_CHARS", "200"))
+        self.ner_remote_concurrency = int(os.getenv("NER_REMOTE_CONCURRENCY", "4"))
+        self.ner_timeout_seconds = float(os.getenv("NER_TIMEOUT_SECONDS", "30"))
+        self.resume_text_char_budget = int(os.getenv("RESUME_TEXT_CHAR_BUDGET", "50000"))
+        self.resume_pdf_parallel_min_pages = int(os.getenv("RESUME_PDF_PARALLEL_MIN_PAGES", "24"))
+        self.resume_pdf_page_workers = int(os.getenv("RESUME_PDF_PAGE_WORKERS", "1"))
+        self.resume_pdf_pages_per_task = int(os.getenv("RESUME_PDF_PAGES_PER_TASK", "8"))
         self.allowed_resume_content_types = {
             "application/pdf",
             "application/msword",
@@ -55,6 +107,10 @@ class Settings:
         self.aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY", "")
         self.celery_broker_url = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
         self.celery_result_backend = os.getenv("CELERY_RESULT_BACKEND", self.celery_broker_url)
+        self.embedding_cache_enabled = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+        self.embedding_cache_memory_bytes = int(os.getenv("EMBEDDING_CACHE_MEMORY_BYTES", str(64 * 1024 * 1024)))
+        self.embedding_cache_redis_url = os.getenv("EMBEDDING_CACHE_REDIS_URL", self.celery_broker_url)
+        self.embedding_cache_redis_ttl_seconds = int(os.getenv("EMBEDDING_CACHE_REDIS_TTL_SECONDS", str(7 * 24 * 3600)))
         self.smtp_host = os.getenv("SMTP_HOST", "")
         self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
         self.smtp_username = os.getenv("SMTP_USERNAME", "")
@@ -70,6 +126,16 @@ class Settings:
 
         if self.storage_backend not in {"local", "s3"}:
             raise ValueError("STORAGE_BACKEND must be either 'local' or 's3'")
+        if self.embedding_provider not in {"http", "local"}:
+            raise ValueError("EMBEDDING_PROVIDER must be either 'http' or 'local'")
+        if self.ner_backend not in {"huggingface", "onnx", "none"}:
+            raise ValueError("NER_BACKEND must be one of 'huggingface', 'onnx' or 'none'")
+        if self.ner_stride_tokens >= self.ner_max_tokens - 2:
+            raise ValueError("NER_STRIDE_TOKENS must be smaller than NER_MAX_TOKENS - 2")
+        if self.ner_remote_concurrency < 1:
+            raise ValueError("NER_REMOTE_CONCURRENCY must be at least 1")
+        if self.vector_backend not in {"numpy", "pgvector"}:
+            raise ValueError("VECTOR_BACKEND must be either 'numpy' or 'pgvector'")
 
 
 @lru_cache
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(row_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from None
+
+
+def wants_total(cursor: str | None, include_total: bool | None) -> bool:
+    # Counting is the expensive part of deep pagination, so cursor pages skip it unless asked.
+    return cursor is None if include_total is None else include_total
+
+
+def keyset_order(stmt: Select, created_col, id_col, cursor: str | None) -> Select:
+    # (created_at, id) is unique and matches a composite index, so each page is an
+    # index range scan from the previous page's last row instead of an OFFSET skip.
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(created_col, id_col) < tuple_(created_at, row_id))
+    return stmt.order_by(created_col.desc(), id_col.desc())
+
+
+def next_cursor(rows: list, size: int, key) -> tuple[list, str | None]:
+    # Callers fetch size + 1 rows; the extra one only signals that another page exists.
+    if len(rows) <= size:
+        return rows, None
+    rows = rows[:size]
+    return rows, encode_cursor(*key(rows[-1]))
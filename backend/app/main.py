@@ -24,6 +24,10 @@ from app.routes.search_routes import router as search_router
 from app.routes.settings_routes import router as settings_router
 from app.routes.task_routes import router as task_router
 from app.routes.user_routes import router as user_router
+from app.services.ann_index_service import load_vector_indexes, persist_vector_indexes
+from app.services.embedding_cache_service import close_embedding_cache
+from app.services.embedding_service import close_embedding_client, start_embedding_client
+from app.services.parse_pool_service import shutdown_parse_pool, start_parse_pool
 
 
 @asynccontextmanager
@@ -31,9 +35,17 @@ async def lifespan(_: FastAPI):
     # Validate DB connectivity on startup and close engine on shutdown.
     async with engine.connect() as connection:
         await connection.execute(text("SELECT 1"))
+    # Warm-start vector indexes from disk; they catch up with the database on first use.
+    load_vector_indexes()
+    start_embedding_client()
+    start_parse_pool()
     try:
         yield
     finally:
+        await shutdown_parse_pool()
+        await close_embedding_client()
+        await close_embedding_cache()
+        persist_vector_indexes()
         await engine.dispose()
 
 
@@ -51,6 +63,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 app.add_middleware(SlowAPIMiddleware)
 app.add_middleware(AuditLogMiddleware)
@@ -3,10 +3,13 @@ from app.models.audit_log_model import AuditLog
 from app.models.chat_message_model import ChatMessage
 from app.models.cover_letter_model import CoverLetter
 from app.models.job_model import Job
+from app.models.job_embedding_model import JobEmbedding
+from app.models.job_candidate_match_model import JobCandidateMatch
 from app.models.job_match_model import JobMatchResult
 from app.models.resume_feedback_model import ResumeFeedback
 from app.models.resume_parse_model import ResumeParseResult
 from app.models.resume_model import Resume
+from app.models.resume_embedding_model import ResumeEmbedding
 from app.models.user_model import User
 from app.models.user_profile_model import UserProfile
 from app.models.user_security_settings_model import UserSecuritySettings
@@ -19,9 +22,12 @@ __all__ = [
     "User",
     "Resume",
     "ResumeParseResult",
+    "ResumeEmbedding",
     "ResumeFeedback",
     "Job",
+    "JobEmbedding",
     "JobMatchResult",
+    "JobCandidateMatch",
     "CoverLetter",
     "Application",
     "AuditLog",
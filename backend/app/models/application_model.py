@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -9,7 +9,12 @@ from app.core.database import Base
 
 class Application(Base):
     __tablename__ = "applications"
-    __table_args__ = (UniqueConstraint("job_id", "user_id", name="uq_application_job_user"),)
+    __table_args__ = (
+        UniqueConstraint("job_id", "user_id", name="uq_application_job_user"),
+        Index("ix_applications_created_at_id", "created_at", "id"),
+        Index("ix_applications_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_applications_job_id_created_at_id", "job_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     job_id: Mapped[str] = mapped_column(String(36), ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, index=True)
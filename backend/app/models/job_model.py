@@ -1,15 +1,30 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
 
 
+JOB_SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(jsonb_to_tsvector('simple', coalesce(skills, '[]'::jsonb), '[\"string\"]'), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(location, '')), 'D')"
+)
+SKILLS_NORMALIZED_EXPRESSION = "lower(skills::text)::jsonb"
+
+
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_jobs_skills_normalized", "skills_normalized", postgresql_using="gin"),
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+        Index("ix_jobs_recruiter_id_created_at_id", "recruiter_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     recruiter_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -17,6 +32,17 @@ class Job(Base):
     description: Mapped[str] = mapped_column(Text, nullable=False)
     skills: Mapped[list[str]] = mapped_column(JSONB, nullable=False, default=list)
     location: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Lowercased copy of skills for indexed exact-skill containment (@>, ?|) filters.
+    skills_normalized: Mapped[list[str] | None] = mapped_column(
+        JSONB,
+        Computed(SKILLS_NORMALIZED_EXPRESSION, persisted=True),
+        deferred=True,
+    )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(JOB_SEARCH_VECTOR_EXPRESSION, persisted=True),
+        deferred=True,
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
@@ -1,14 +1,28 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import JSON, DateTime, ForeignKey, String
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
+from app.models.job_model import SKILLS_NORMALIZED_EXPRESSION
+
+
+RESUME_SEARCH_VECTOR_EXPRESSION = (
+    "setweight(jsonb_to_tsvector('simple', skills, '[\"string\"]'), 'A') || "
+    "setweight(jsonb_to_tsvector('simple', experience, '[\"string\"]'), 'B') || "
+    "setweight(jsonb_to_tsvector('simple', education, '[\"string\"]'), 'C')"
+)
+RESUME_SEARCH_TEXT_EXPRESSION = "skills::text || ' ' || experience::text || ' ' || education::text"
 
 
 class ResumeParseResult(Base):
     __tablename__ = "resume_parse_results"
+    __table_args__ = (
+        Index("ix_resume_parse_results_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_resume_parse_results_skills_normalized", "skills_normalized", postgresql_using="gin"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     resume_id: Mapped[str] = mapped_column(
@@ -18,10 +32,26 @@ class ResumeParseResult(Base):
         unique=True,
         index=True,
     )
-    skills: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
-    experience: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
-    education: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
-    entities: Mapped[list[dict]] = mapped_column(JSON, nullable=False, default=list)
+    skills: Mapped[list[str]] = mapped_column(JSONB, nullable=False, default=list)
+    experience: Mapped[list[str]] = mapped_column(JSONB, nullable=False, default=list)
+    education: Mapped[list[str]] = mapped_column(JSONB, nullable=False, default=list)
+    entities: Mapped[list[dict]] = mapped_column(JSONB, nullable=False, default=list)
+    skills_normalized: Mapped[list[str] | None] = mapped_column(
+        JSONB,
+        Computed(SKILLS_NORMALIZED_EXPRESSION, persisted=True),
+        deferred=True,
+    )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(RESUME_SEARCH_VECTOR_EXPRESSION, persisted=True),
+        deferred=True,
+    )
+    # Trigram-indexed (when pg_trgm is available) for substring matches the tsvector misses.
+    search_text: Mapped[str | None] = mapped_column(
+        Text,
+        Computed(RESUME_SEARCH_TEXT_EXPRESSION, persisted=True),
+        deferred=True,
+    )
     parser_source: Mapped[str] = mapped_column(String(60), nullable=False, default="heuristic", server_default="heuristic")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
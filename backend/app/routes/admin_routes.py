@@ -5,8 +5,12 @@ from app.core.database import get_db
 from app.core.dependencies import require_admin
 from app.models.user_model import User
 from app.schemas.audit_log_schema import AuditLogListResponse
+from app.schemas.resume_schema import ReparseStatus
 from app.schemas.user_admin_schema import UserListResponse, UserUpdateRequest, UserUpdateResponse
 from app.services.audit_log_service import list_audit_logs
+from app.services.embedding_service import get_embedding_client_metrics
+from app.services.parse_pool_service import get_parse_pool_metrics
+from app.services.resume_service import requeue_resume_parsing
 from app.services.user_admin_service import list_users, update_user
 
 
@@ -20,10 +24,21 @@ async def get_users(
     role: str | None = Query(default=None),
     is_active: bool | None = Query(default=None),
     q: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    include_total: bool | None = Query(default=None),
     _: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> UserListResponse:
-    return await list_users(db=db, page=page, size=size, role=role, is_active=is_active, q=q)
+    return await list_users(
+        db=db,
+        page=page,
+        size=size,
+        role=role,
+        is_active=is_active,
+        q=q,
+        cursor=cursor,
+        include_total=include_total,
+    )
 
 
 @router.patch("/users/{user_id}", response_model=UserUpdateResponse)
@@ -43,6 +58,8 @@ async def get_audit_logs(
     user_id: str | None = Query(default=None),
     method: str | None = Query(default=None),
     status_code: int | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    include_total: bool | None = Query(default=None),
     _: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> AuditLogListResponse:
@@ -53,4 +70,26 @@ async def get_audit_logs(
         user_id=user_id,
         method=method,
         status_code=status_code,
+        cursor=cursor,
+        include_total=include_total,
     )
+
+
+@router.get("/metrics/embedding")
+async def get_embedding_metrics(_: User = Depends(require_admin)) -> dict:
+    return get_embedding_client_metrics()
+
+
+@router.get("/metrics/parse-pool")
+async def get_parse_metrics(_: User = Depends(require_admin)) -> dict:
+    return get_parse_pool_metrics()
+
+
+@router.post("/resumes/reparse")
+async def reparse_resumes(
+    processing_status: ReparseStatus = Query(default="failed"),
+    limit: int = Query(default=500, ge=1, le=5000),
+    _: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    return await requeue_resume_parsing(db=db, processing_status=processing_status, limit=limit)
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -6,11 +7,18 @@ from app.core.dependencies import get_current_user
 from app.models.user_model import User
 from app.schemas.application_schema import (
     ApplicationCreateRequest,
+    ApplicationListResponse,
     ApplicationResponse,
     ApplicationStatus,
     ApplicationUpdateStatusRequest,
 )
-from app.services.application_service import create_application, list_applications, update_application_status
+from app.services.application_service import (
+    create_application,
+    list_applications,
+    list_applications_page,
+    stream_applications,
+    update_application_status,
+)
 
 
 router = APIRouter(prefix="/application", tags=["application"])
@@ -42,16 +50,62 @@ async def update_status(
 
 @router.get("/list", response_model=list[ApplicationResponse])
 async def list_all(
+    response: Response,
+    limit: int = Query(default=500, ge=1, le=500),
+    cursor: str | None = Query(default=None),
     status: ApplicationStatus | None = Query(default=None),
     job_id: str | None = Query(default=None),
     user_id: str | None = Query(default=None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> list[ApplicationResponse]:
-    return await list_applications(
+    items, next_cursor = await list_applications(
         current_user=current_user,
         db=db,
         status_filter=status,
         job_id=job_id,
         user_id=user_id,
+        limit=limit,
+        cursor=cursor,
+    )
+    if next_cursor:
+        # More rows match; pass this back as ?cursor= (or use /page) for the next slice.
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
+
+
+@router.get("/page", response_model=ApplicationListResponse)
+async def list_page(
+    size: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    include_total: bool | None = Query(default=None),
+    status: ApplicationStatus | None = Query(default=None),
+    job_id: str | None = Query(default=None),
+    user_id: str | None = Query(default=None),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> ApplicationListResponse:
+    return await list_applications_page(
+        current_user=current_user,
+        db=db,
+        size=size,
+        cursor=cursor,
+        include_total=include_total,
+        status_filter=status,
+        job_id=job_id,
+        user_id=user_id,
+    )
+
+
+@router.get("/export")
+async def export(
+    status: ApplicationStatus | None = Query(default=None),
+    job_id: str | None = Query(default=None),
+    user_id: str | None = Query(default=None),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_applications(current_user=current_user, status_filter=status, job_id=job_id, user_id=user_id),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="applications.ndjson"'},
     )
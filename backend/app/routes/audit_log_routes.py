@@ -18,6 +18,8 @@ async def get_audit_logs(
     user_id: str | None = Query(default=None),
     method: str | None = Query(default=None),
     status_code: int | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    include_total: bool | None = Query(default=None),
     _: User = Depends(require_roles("admin")),
     db: AsyncSession = Depends(get_db),
 ) -> AuditLogListResponse:
@@ -28,4 +30,6 @@ async def get_audit_logs(
         user_id=user_id,
         method=method,
         status_code=status_code,
+        cursor=cursor,
+        include_total=include_total,
     )
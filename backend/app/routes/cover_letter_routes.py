@@ -1,23 +1,30 @@
 from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
 from app.models.user_model import User
 from app.schemas.cover_letter_schema import CoverLetterGenerateRequest, CoverLetterResponse
+from app.schemas.resume_schema import ResumeUploadResponse
 from app.services.cover_letter_service import generate_cover_letter, get_cover_letter, upload_cover_letter
+from app.services.resume_service import ResumeParsePending, parse_pending_response
 
 
 router = APIRouter(prefix="/cover-letter", tags=["cover-letter"])
 
 
-@router.post("/generate", response_model=CoverLetterResponse)
+@router.post("/generate", response_model=CoverLetterResponse, responses={202: {"model": ResumeUploadResponse}})
 async def generate(
     payload: CoverLetterGenerateRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> CoverLetterResponse:
-    return await generate_cover_letter(payload=payload, current_user=current_user, db=db)
+) -> CoverLetterResponse | JSONResponse:
+    try:
+        return await generate_cover_letter(payload=payload, current_user=current_user, db=db)
+    except ResumeParsePending as pending:
+        # Returned rather than raised so get_db commits and the deferred parse starts.
+        return parse_pending_response(pending.resume)
 
 
 @router.post("/upload", response_model=CoverLetterResponse)
@@ -14,6 +14,7 @@ from app.services.job_service import (
     list_public_jobs,
     update_job_posting,
 )
+from app.services.skill_filter_service import SkillMatch
 
 
 router = APIRouter(prefix="/job", tags=["job"])
@@ -32,9 +33,12 @@ async def create_job(
 async def get_job_list(
     page: int = Query(default=1, ge=1),
     size: int = Query(default=10, ge=1, le=100),
-    skill: str | None = Query(default=None),
+    skill: list[str] | None = Query(default=None),
+    skill_match: SkillMatch = Query(default="all"),
     location: str | None = Query(default=None),
     q: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    include_total: bool | None = Query(default=None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> JobListResponse:
@@ -44,8 +48,11 @@ async def get_job_list(
         page=page,
         size=size,
         skill=skill,
+        skill_match=skill_match,
         location=location,
         q=q,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -53,9 +60,12 @@ async def get_job_list(
 async def get_public_job_list(
     page: int = Query(default=1, ge=1),
     size: int = Query(default=10, ge=1, le=100),
-    skill: str | None = Query(default=None),
+    skill: list[str] | None = Query(default=None),
+    skill_match: SkillMatch = Query(default="all"),
     location: str | None = Query(default=None),
     q: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    include_total: bool | None = Query(default=None),
     db: AsyncSession = Depends(get_db),
 ) -> JobListResponse:
     return await list_public_jobs(
@@ -63,8 +73,11 @@ async def get_public_job_list(
         page=page,
         size=size,
         skill=skill,
+        skill_match=skill_match,
         location=location,
         q=q,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
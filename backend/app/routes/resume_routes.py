@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, File, UploadFile
+from fastapi import APIRouter, Depends, File, Response, UploadFile, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -8,7 +9,14 @@ from app.schemas.resume_feedback_schema import ResumeFeedbackRequest, ResumeFeed
 from app.schemas.resume_parse_schema import ResumeParseResultResponse
 from app.schemas.resume_schema import ResumeUploadResponse
 from app.services.resume_feedback_service import generate_resume_feedback
-from app.services.resume_service import get_my_latest_resume, get_my_resume_parse_result, upload_resume
+from app.services.resume_service import (
+    ResumeParsePending,
+    get_my_latest_resume,
+    get_my_resume_parse_result,
+    get_my_resume_status,
+    parse_pending_response,
+    upload_resume,
+)
 from app.tasks import enqueue_resume_feedback_generation
 
 
@@ -17,11 +25,26 @@ router = APIRouter(prefix="/resume", tags=["resume"])
 
 @router.post("/upload", response_model=ResumeUploadResponse)
 async def upload_resume_file(
+    response: Response,
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> ResumeUploadResponse:
-    return await upload_resume(file=file, current_user=current_user, db=db)
+    result = await upload_resume(file=file, current_user=current_user, db=db)
+    if result.processing_status == "pending":
+        # The parse pool was saturated; poll /resume/{id}/status until it is parsed.
+        response.status_code = status.HTTP_202_ACCEPTED
+        response.headers["Location"] = f"/resume/{result.id}/status"
+    return result
+
+
+@router.get("/{resume_id}/status", response_model=ResumeUploadResponse)
+async def get_resume_status(
+    resume_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> ResumeUploadResponse:
+    return await get_my_resume_status(resume_id=resume_id, current_user=current_user, db=db)
 
 
 @router.get("/{resume_id}/parsed", response_model=ResumeParseResultResponse)
@@ -41,13 +64,17 @@ async def get_latest_resume(
     return await get_my_latest_resume(current_user=current_user, db=db)
 
 
-@router.post("/feedback", response_model=ResumeFeedbackResponse)
+@router.post("/feedback", response_model=ResumeFeedbackResponse, responses={202: {"model": ResumeUploadResponse}})
 async def create_resume_feedback(
     payload: ResumeFeedbackRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> ResumeFeedbackResponse:
-    return await generate_resume_feedback(resume_id=payload.resume_id, current_user=current_user, db=db)
+) -> ResumeFeedbackResponse | JSONResponse:
+    try:
+        return await generate_resume_feedback(resume_id=payload.resume_id, current_user=current_user, db=db)
+    except ResumeParsePending as pending:
+        # Returned rather than raised so get_db commits and the deferred parse starts.
+        return parse_pending_response(pending.resume)
 
 
 @router.post("/feedback/async", response_model=ResumeFeedbackTaskResponse)
@@ -4,8 +4,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.dependencies import require_roles
 from app.models.user_model import User
-from app.schemas.search_schema import SearchJobsResponse, SearchResumesResponse
+from app.schemas.search_schema import CountMode, SearchJobsResponse, SearchMode, SearchResumesResponse
 from app.services.search_service import search_jobs, search_resumes
+from app.services.skill_filter_service import SkillMatch
 
 
 router = APIRouter(prefix="/search", tags=["search"])
@@ -17,9 +18,11 @@ async def search_jobs_endpoint(
     page: int = Query(default=1, ge=1),
     size: int = Query(default=10, ge=1, le=100),
     semantic: bool = Query(default=False),
+    mode: SearchMode | None = Query(default=None),
+    count: CountMode = Query(default="exact"),
     db: AsyncSession = Depends(get_db),
 ) -> SearchJobsResponse:
-    return await search_jobs(db=db, query=q, page=page, size=size, semantic=semantic)
+    return await search_jobs(db=db, query=q, page=page, size=size, semantic=semantic, mode=mode, count=count)
 
 
 @router.get("/resumes", response_model=SearchResumesResponse)
@@ -28,7 +31,17 @@ async def search_resumes_endpoint(
     page: int = Query(default=1, ge=1),
     size: int = Query(default=10, ge=1, le=100),
     semantic: bool = Query(default=False),
+    skill: list[str] | None = Query(default=None),
+    skill_match: SkillMatch = Query(default="all"),
     _: User = Depends(require_roles("recruiter", "admin")),
     db: AsyncSession = Depends(get_db),
 ) -> SearchResumesResponse:
-    return await search_resumes(db=db, query=q, page=page, size=size, semantic=semantic)
+    return await search_resumes(
+        db=db,
+        query=q,
+        page=page,
+        size=size,
+        semantic=semantic,
+        skill=skill,
+        skill_match=skill_match,
+    )
@@ -36,3 +36,10 @@ class ApplicationResponse(BaseModel):
     status: ApplicationStatus
     created_at: datetime
     updated_at: datetime
+
+
+class ApplicationListResponse(BaseModel):
+    size: int
+    total: int | None
+    next_cursor: str | None = None
+    items: list[ApplicationResponse]
@@ -21,5 +21,6 @@ class AuditLogResponse(BaseModel):
 class AuditLogListResponse(BaseModel):
     page: int
     size: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
     items: list[AuditLogResponse]
@@ -35,5 +35,6 @@ class JobResponse(BaseModel):
 class JobListResponse(BaseModel):
     page: int
     size: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
     items: list[JobResponse]
@@ -1,7 +1,11 @@
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict
 
+# Statuses a resume can be requeued from; "queued", "pending" and "processing" are still in flight.
+ReparseStatus = Literal["uploaded", "failed", "parsed"]
+
 
 class ResumeUploadResponse(BaseModel):
     id: str
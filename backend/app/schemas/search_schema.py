@@ -1,5 +1,10 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
+SearchMode = Literal["lexical", "semantic", "hybrid"]
+CountMode = Literal["exact", "estimated"]
+
 
 class SearchJobItem(BaseModel):
     id: str
@@ -19,9 +24,13 @@ class SearchResumeItem(BaseModel):
 class SearchJobsResponse(BaseModel):
     query: str
     semantic: bool
+    mode: SearchMode = "lexical"
     page: int
     size: int
     total: int
+    total_estimated: bool = False
+    # Semantic and hybrid results are ranked to a bounded depth; when set, pages past it come back empty.
+    total_is_capped: bool = False
     items: list[SearchJobItem]
 
 
@@ -31,4 +40,5 @@ class SearchResumesResponse(BaseModel):
     page: int
     size: int
     total: int
+    total_is_capped: bool = False
     items: list[SearchResumeItem]
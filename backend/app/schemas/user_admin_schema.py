@@ -20,7 +20,8 @@ class UserAdminResponse(BaseModel):
 class UserListResponse(BaseModel):
     page: int
     size: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
     items: list[UserAdminResponse]
 
 
@@ -1,6 +1,4 @@
-from collections import Counter
-
-from sqlalchemy import func, select
+from sqlalchemy import func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.application_model import Application
@@ -34,20 +32,20 @@ async def get_analytics(db: AsyncSession, current_user: User, top_skills: int =
         for row in application_rows
     ]
 
-    jobs_stmt = select(Job.skills)
+    skill = func.jsonb_array_elements_text(Job.skills_normalized).table_valued("value").render_derived()
+    skill_name = func.btrim(skill.c.value)
+    skills_stmt = select(skill_name.label("skill"), func.count().label("count")).select_from(Job).join(skill, true())
     if current_user.role == "recruiter":
-        jobs_stmt = jobs_stmt.where(Job.recruiter_id == current_user.id)
-    jobs = (await db.scalars(jobs_stmt)).all()
-    counter: Counter[str] = Counter()
-    for skills in jobs:
-        for skill in skills or []:
-            normalized = skill.strip().lower()
-            if normalized:
-                counter[normalized] += 1
-
+        skills_stmt = skills_stmt.where(Job.recruiter_id == current_user.id)
+    skills_stmt = (
+        skills_stmt.where(skill_name != "")
+        .group_by(skill_name)
+        .order_by(func.count().desc(), skill_name)
+        .limit(top_skills)
+    )
     popular_skills = [
-        PopularSkillItem(skill=skill, count=count)
-        for skill, count in counter.most_common(top_skills)
+        PopularSkillItem(skill=row.skill, count=int(row.count))
+        for row in (await db.execute(skills_stmt)).all()
     ]
 
     return AnalyticsResponse(
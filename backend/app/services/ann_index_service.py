@@ -0,0 +1,493 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import os
+import threading
+import time
+import weakref
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.job_embedding_model import JobEmbedding
+from app.models.resume_embedding_model import ResumeEmbedding
+from app.services.similarity_service import decode_vector, normalize_rows, top_k_indices
+
+_NUMPY = None
+
+_KMEANS_ITERATIONS = 10
+_KMEANS_MAX_SAMPLE = 100_000
+_SYNC_BATCH_SIZE = 5_000
+# Rows committed slightly out of updated_at order are picked up on the next sync.
+_WATERMARK_OVERLAP = timedelta(minutes=1)
+# Shared across instances so a rebuilt or reloaded index never reuses a version.
+_VERSIONS = itertools.count(1)
+# Session.info key holding index changes that wait for the transaction to commit.
+_PENDING_KEY = "vector_index_pending"
+
+_INDEX_SOURCES = {
+    "jobs": (JobEmbedding, JobEmbedding.job_id),
+    "resumes": (ResumeEmbedding, ResumeEmbedding.resume_id),
+}
+
+
+def _get_numpy():
+    global _NUMPY
+    if _NUMPY is None:
+        import numpy as np
+
+        _NUMPY = np
+    return _NUMPY
+
+
+class IVFIndex:
+    def __init__(self, nprobe: int = 16, min_train_size: int = 2048) -> None:
+        self.nprobe = nprobe
+        self.min_train_size = min_train_size
+        self.ids: list[str] = []
+        self.centroids = None
+        self.trained_size = 0
+        self.version = next(_VERSIONS)
+        self._positions: dict[str, int] = {}
+        self._vectors = None
+        self._assignments = None
+        self._lists: list[list[int]] = []
+        self._list_arrays: dict[int, object] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dim(self) -> int | None:
+        return None if self._vectors is None else self._vectors.shape[1]
+
+    @property
+    def vectors(self):
+        np = _get_numpy()
+        if self._vectors is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._vectors[: len(self.ids)]
+
+    def add(self, ids: Sequence[str], vectors) -> None:
+        ids = list(ids)
+        if not ids:
+            return
+        matrix = normalize_rows(vectors)
+        if matrix.shape[0] != len(ids):
+            raise ValueError("ids and vectors must have the same length")
+        # Later duplicates win, matching upsert semantics.
+        pending = dict(zip(ids, matrix, strict=True))
+        if self._vectors is None:
+            self._allocate(matrix.shape[1], len(ids))
+        elif matrix.shape[1] != self._vectors.shape[1]:
+            raise ValueError("vector dimension does not match index")
+
+        rows: list[int] = []
+        for item_id, vector in pending.items():
+            row = self._positions.get(item_id)
+            if row is None:
+                row = len(self.ids)
+                self._ensure_capacity(row + 1)
+                self.ids.append(item_id)
+                self._positions[item_id] = row
+            elif self.centroids is not None:
+                self._unlink(row)
+            self._vectors[row] = vector
+            rows.append(row)
+
+        self.version = next(_VERSIONS)
+        # Training is left to the caller (see needs_training) so adds stay cheap.
+        if self.centroids is not None:
+            self._assign(_as_rows(rows))
+
+    def remove(self, ids: Sequence[str]) -> None:
+        for item_id in ids:
+            row = self._positions.pop(item_id, None)
+            if row is None:
+                continue
+            self.version = next(_VERSIONS)
+            if self.centroids is not None:
+                self._unlink(row)
+
+            last = len(self.ids) - 1
+            if row != last:
+                moved_id = self.ids[last]
+                self._vectors[row] = self._vectors[last]
+                self.ids[row] = moved_id
+                self._positions[moved_id] = row
+                if self.centroids is not None:
+                    cluster = int(self._assignments[last])
+                    members = self._lists[cluster]
+                    members[members.index(last)] = row
+                    self._assignments[row] = cluster
+                    self._list_arrays.pop(cluster, None)
+            self.ids.pop()
+
+    def train(self, nlist: int | None = None) -> None:
+        np = _get_numpy()
+        count = len(self.ids)
+        self.version = next(_VERSIONS)
+        if count == 0:
+            self.centroids = None
+            self.trained_size = 0
+            return
+
+        nlist = max(1, min(nlist or int(np.sqrt(count)), count))
+        data = self.vectors
+        rng = np.random.default_rng(0)
+        sample = data
+        if count > _KMEANS_MAX_SAMPLE:
+            sample = data[rng.choice(count, _KMEANS_MAX_SAMPLE, replace=False)]
+
+        centroids = sample[rng.choice(sample.shape[0], nlist, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            labels = _nearest_centroids(sample, centroids)
+            counts = np.bincount(labels, minlength=nlist)
+            empty = counts == 0
+            grouped = sample[np.argsort(labels, kind="stable")]
+            bounds = np.concatenate(([0], np.cumsum(counts)))
+            sums = np.zeros_like(centroids)
+            for cluster in np.flatnonzero(~empty):
+                sums[cluster] = grouped[bounds[cluster] : bounds[cluster + 1]].sum(axis=0)
+            if empty.any():
+                sums[empty] = sample[rng.choice(sample.shape[0], int(empty.sum()), replace=False)]
+            centroids = normalize_rows(sums)
+
+        self.centroids = centroids
+        self.trained_size = count
+        self._lists = [[] for _ in range(nlist)]
+        self._list_arrays = {}
+        self._assign(np.arange(count))
+
+    def search(self, query, k: int, nprobe: int | None = None) -> list[tuple[str, float]]:
+        np = _get_numpy()
+        if not self.ids or k <= 0:
+            return []
+
+        q = normalize_rows(query)[0]
+        if self.centroids is None:
+            rows = np.arange(len(self.ids))
+        else:
+            nprobe = nprobe or self.nprobe
+            parts = []
+            found = 0
+            for probed, cluster in enumerate(np.argsort(-(self.centroids @ q))):
+                members = self._list_array(int(cluster))
+                if members.size:
+                    parts.append(members)
+                    found += members.size
+                # Keep probing past nprobe until there are enough candidates for k.
+                if probed + 1 >= nprobe and found >= k:
+                    break
+            rows = np.concatenate(parts)
+
+        scores = self._vectors[rows] @ q
+        return [(self.ids[rows[i]], float(scores[i])) for i in top_k_indices(scores, k)]
+
+    def snapshot(self) -> dict:
+        np = _get_numpy()
+        count = len(self.ids)
+        trained = self.centroids is not None
+        return {
+            "ids": np.array(self.ids, dtype=str),
+            "vectors": self.vectors.copy(),
+            "assignments": self._assignments[:count].copy() if trained else np.empty(0, dtype=np.int32),
+            "centroids": self.centroids.copy() if trained else np.empty((0, 0), dtype=np.float32),
+            "trained_size": self.trained_size,
+        }
+
+    def save(self, path: Path, meta: dict) -> None:
+        _write_snapshot(path, self.snapshot(), meta)
+
+    @classmethod
+    def load(cls, path: Path, nprobe: int = 16, min_train_size: int = 2048) -> tuple[IVFIndex, dict]:
+        np = _get_numpy()
+        index = cls(nprobe=nprobe, min_train_size=min_train_size)
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            ids = [str(item) for item in data["ids"]]
+            if ids:
+                vectors = data["vectors"]
+                index._allocate(vectors.shape[1], len(ids))
+                index._vectors[: len(ids)] = vectors
+                index.ids = ids
+                index._positions = {item_id: row for row, item_id in enumerate(ids)}
+            if data["centroids"].size and ids:
+                index.centroids = data["centroids"]
+                index.trained_size = int(meta.get("trained_size") or len(ids))
+                index._lists = [[] for _ in range(index.centroids.shape[0])]
+                index._assignments[: len(ids)] = data["assignments"]
+                for row, cluster in enumerate(index._assignments[: len(ids)].tolist()):
+                    index._lists[cluster].append(row)
+        return index, meta
+
+    def needs_training(self) -> bool:
+        if self.centroids is None:
+            return len(self.ids) >= self.min_train_size
+        # Centroids drift as the catalog grows; retrain once it has doubled.
+        return len(self.ids) >= 2 * self.trained_size
+
+    def _allocate(self, dim: int, capacity: int) -> None:
+        np = _get_numpy()
+        self._vectors = np.zeros((max(capacity, 16), dim), dtype=np.float32)
+        self._assignments = np.zeros(max(capacity, 16), dtype=np.int32)
+
+    def _ensure_capacity(self, size: int) -> None:
+        np = _get_numpy()
+        capacity = self._vectors.shape[0]
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2)
+        vectors = np.zeros((capacity, self._vectors.shape[1]), dtype=np.float32)
+        vectors[: len(self.ids)] = self._vectors[: len(self.ids)]
+        assignments = np.zeros(capacity, dtype=np.int32)
+        assignments[: len(self.ids)] = self._assignments[: len(self.ids)]
+        self._vectors = vectors
+        self._assignments = assignments
+
+    def _assign(self, rows) -> None:
+        labels = _nearest_centroids(self._vectors[rows], self.centroids)
+        for row, cluster in zip(rows.tolist(), labels.tolist(), strict=True):
+            self._assignments[row] = cluster
+            self._lists[cluster].append(row)
+            self._list_arrays.pop(cluster, None)
+
+    def _unlink(self, row: int) -> None:
+        cluster = int(self._assignments[row])
+        self._lists[cluster].remove(row)
+        self._list_arrays.pop(cluster, None)
+
+    def _list_array(self, cluster: int):
+        cached = self._list_arrays.get(cluster)
+        if cached is None:
+            cached = _as_rows(self._lists[cluster])
+            self._list_arrays[cluster] = cached
+        return cached
+
+
+def _as_rows(rows: list[int]):
+    np = _get_numpy()
+    return np.asarray(rows, dtype=np.int64)
+
+
+def _write_snapshot(path: Path, snapshot: dict, meta: dict) -> None:
+    np = _get_numpy()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("wb") as handle:
+        np.savez(
+            handle,
+            ids=snapshot["ids"],
+            vectors=snapshot["vectors"],
+            assignments=snapshot["assignments"],
+            centroids=snapshot["centroids"],
+            meta=np.array(json.dumps({**meta, "trained_size": snapshot["trained_size"]})),
+        )
+    os.replace(tmp_path, path)
+
+
+def _nearest_centroids(vectors, centroids, chunk_size: int = 8192):
+    np = _get_numpy()
+    labels = np.empty(vectors.shape[0], dtype=np.int64)
+    for start in range(0, vectors.shape[0], chunk_size):
+        labels[start : start + chunk_size] = np.argmax(vectors[start : start + chunk_size] @ centroids.T, axis=1)
+    return labels
+
+
+def _trained_index(ids: list[str], vectors, nprobe: int, min_train_size: int) -> IVFIndex:
+    index = IVFIndex(nprobe=nprobe, min_train_size=min_train_size)
+    index.add(ids, vectors)
+    index.train()
+    return index
+
+
+class _IndexState:
+    def __init__(self, kind: str, model_name: str, index: IVFIndex, watermark: datetime | None) -> None:
+        self.kind = kind
+        self.model_name = model_name
+        self.index = index
+        self.watermark = watermark
+        self.synced_at = 0.0
+        # asyncio locks bind to one event loop, and Celery tasks each run in a
+        # fresh one (run_task), so syncs are serialised per running loop.
+        self.locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = weakref.WeakKeyDictionary()
+        self.training: threading.Thread | None = None
+        self.trained: tuple[IVFIndex, datetime | None] | None = None
+
+    def lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        lock = self.locks.get(loop)
+        if lock is None:
+            lock = self.locks[loop] = asyncio.Lock()
+        return lock
+
+
+_STATES: dict[str, _IndexState] = {}
+
+
+def _index_path(kind: str, model_name: str) -> Path:
+    safe_model = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in model_name)
+    return Path(get_settings().vector_index_dir) / f"{kind}-{safe_model}.npz"
+
+
+def _new_index() -> IVFIndex:
+    settings = get_settings()
+    return IVFIndex(nprobe=settings.vector_index_nprobe, min_train_size=settings.vector_index_min_train_size)
+
+
+def _load_state(kind: str, model_name: str) -> _IndexState:
+    settings = get_settings()
+    path = _index_path(kind, model_name)
+    if path.exists():
+        try:
+            index, meta = IVFIndex.load(
+                path,
+                nprobe=settings.vector_index_nprobe,
+                min_train_size=settings.vector_index_min_train_size,
+            )
+            watermark = datetime.fromisoformat(meta["watermark"]) if meta.get("watermark") else None
+            return _IndexState(kind, model_name, index, watermark)
+        except Exception:
+            # A corrupt or outdated file is rebuilt from the database.
+            pass
+    return _IndexState(kind, model_name, _new_index(), None)
+
+
+def _get_state(kind: str) -> _IndexState:
+    model_name = get_settings().embedding_model
+    state = _STATES.get(kind)
+    if state is None or state.model_name != model_name:
+        state = _load_state(kind, model_name)
+        _STATES[kind] = state
+    return state
+
+
+def _state_meta(state: _IndexState) -> dict:
+    return {"watermark": state.watermark.isoformat() if state.watermark else None}
+
+
+async def get_vector_index(kind: str, db: AsyncSession) -> IVFIndex:
+    state = _get_state(kind)
+    if time.monotonic() - state.synced_at >= get_settings().vector_index_sync_seconds:
+        async with state.lock():
+            if time.monotonic() - state.synced_at >= get_settings().vector_index_sync_seconds:
+                await _sync_state(state, db)
+    return state.index
+
+
+def index_upsert(db: AsyncSession, kind: str, ids: Sequence[str], vectors) -> None:
+    # Applied once the surrounding transaction commits, so a rollback never leaves phantom ids.
+    db.info.setdefault(_PENDING_KEY, []).append((kind, list(ids), vectors))
+
+
+def index_remove(db: AsyncSession, kind: str, ids: Sequence[str]) -> None:
+    db.info.setdefault(_PENDING_KEY, []).append((kind, list(ids), None))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session: Session) -> None:
+    model_name = get_settings().embedding_model
+    for kind, ids, vectors in session.info.pop(_PENDING_KEY, []):
+        state = _STATES.get(kind)
+        if state is None:
+            continue
+        if vectors is None:
+            state.index.remove(ids)
+        elif state.model_name == model_name:
+            state.index.add(ids, vectors)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def load_vector_indexes() -> None:
+    for kind in _INDEX_SOURCES:
+        _get_state(kind)
+
+
+def persist_vector_indexes() -> None:
+    for state in _STATES.values():
+        if state.watermark is not None:
+            state.index.save(_index_path(state.kind, state.model_name), _state_meta(state))
+
+
+async def _sync_state(state: _IndexState, db: AsyncSession) -> None:
+    model, id_column = _INDEX_SOURCES[state.kind]
+    scope = model.model_name == state.model_name
+    initial = state.watermark is None
+    changed = 0
+
+    adopted = state.trained is not None
+    if adopted:
+        # Rows synced or committed while training ran are replayed from the
+        # rewound watermark below; deletions are caught by the count check.
+        (state.index, state.watermark), state.trained = state.trained, None
+
+    count, latest = (await db.execute(select(func.count(), func.max(model.updated_at)).where(scope))).one()
+    if latest is not None and (state.watermark is None or latest > state.watermark):
+        stmt = select(id_column, model.vector).where(scope)
+        if state.watermark is not None:
+            stmt = stmt.where(model.updated_at >= state.watermark - _WATERMARK_OVERLAP)
+        changed += await _stream_into_index(state.index, db, stmt)
+        state.watermark = latest
+
+    if count != len(state.index):
+        live_ids = set((await db.scalars(select(id_column).where(scope))).all())
+        stale = [item_id for item_id in state.index.ids if item_id not in live_ids]
+        state.index.remove(stale)
+        changed += len(stale)
+        missing = sorted(live_ids.difference(state.index.ids))
+        # Chunked to stay well under the driver's bind-parameter limit.
+        for start in range(0, len(missing), _SYNC_BATCH_SIZE):
+            chunk = missing[start : start + _SYNC_BATCH_SIZE]
+            stmt = select(id_column, model.vector).where(scope, id_column.in_(chunk))
+            changed += await _stream_into_index(state.index, db, stmt)
+
+    state.synced_at = time.monotonic()
+    if state.index.needs_training() and state.training is None and state.trained is None:
+        # k-means over the whole catalog takes seconds; searches keep using the
+        # current index until the next sync adopts the trained one. A plain thread
+        # outlives the short event loops Celery tasks run in.
+        state.training = threading.Thread(
+            target=_retrain,
+            args=(state, list(state.index.ids), state.index.vectors.copy(), state.watermark),
+            name=f"ann-retrain-{state.kind}",
+            daemon=True,
+        )
+        state.training.start()
+    elif adopted or (changed and (initial or changed >= _SYNC_BATCH_SIZE)):
+        snapshot = state.index.snapshot()
+        await asyncio.to_thread(
+            _write_snapshot,
+            _index_path(state.kind, state.model_name),
+            snapshot,
+            _state_meta(state),
+        )
+
+
+def _retrain(state: _IndexState, ids: list[str], vectors, watermark: datetime | None) -> None:
+    try:
+        trained = _trained_index(ids, vectors, state.index.nprobe, state.index.min_train_size)
+        state.trained = (trained, watermark)
+        state.synced_at = 0.0
+    finally:
+        state.training = None
+
+
+async def _stream_into_index(index: IVFIndex, db: AsyncSession, stmt) -> int:
+    np = _get_numpy()
+    applied = 0
+    result = await db.stream(stmt.execution_options(yield_per=_SYNC_BATCH_SIZE))
+    async for partition in result.partitions():
+        index.add([row[0] for row in partition], np.vstack([decode_vector(row[1]) for row in partition]))
+        applied += len(partition)
+    return applied
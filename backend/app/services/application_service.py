@@ -1,7 +1,11 @@
+from collections.abc import AsyncIterator
+
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import AsyncSessionLocal
+from app.core.pagination import keyset_order, next_cursor, wants_total
 from app.models.application_model import Application
 from app.models.cover_letter_model import CoverLetter
 from app.models.job_model import Job
@@ -9,11 +13,14 @@ from app.models.resume_model import Resume
 from app.models.user_model import User
 from app.schemas.application_schema import (
     ApplicationCreateRequest,
+    ApplicationListResponse,
     ApplicationResponse,
     ApplicationStatus,
 )
 from app.tasks import enqueue_email_notification
 
+_EXPORT_BATCH_SIZE = 500
+
 
 async def create_application(payload: ApplicationCreateRequest, current_user: User, db: AsyncSession) -> ApplicationResponse:
     if payload.user_id != current_user.id and current_user.role != "admin":
@@ -125,13 +132,12 @@ async def update_application_status(
     )
 
 
-async def list_applications(
+def _applications_query(
     current_user: User,
-    db: AsyncSession,
     status_filter: ApplicationStatus | None = None,
     job_id: str | None = None,
     user_id: str | None = None,
-) -> list[ApplicationResponse]:
+) -> Select:
     stmt = (
         select(Application, Job.title, User.name, User.username)
         .join(Job, Job.id == Application.job_id)
@@ -152,24 +158,88 @@ async def list_applications(
         stmt = stmt.where(Application.status == status_filter.value)
     if job_id:
         stmt = stmt.where(Application.job_id == job_id)
+    return stmt
 
-    rows = (await db.execute(stmt.order_by(Application.created_at.desc()))).all()
-    return [
-        ApplicationResponse(
-            id=app_entity.id,
-            job_id=app_entity.job_id,
-            job_title=job_title,
-            user_id=app_entity.user_id,
-            applicant_name=applicant_name,
-            applicant_username=applicant_username,
-            resume_id=app_entity.resume_id,
-            cover_letter_id=app_entity.cover_letter_id,
-            status=ApplicationStatus(app_entity.status),
-            created_at=app_entity.created_at,
-            updated_at=app_entity.updated_at,
-        )
-        for app_entity, job_title, applicant_name, applicant_username in rows
-    ]
+
+def _application_response(row) -> ApplicationResponse:
+    app_entity, job_title, applicant_name, applicant_username = row
+    return ApplicationResponse(
+        id=app_entity.id,
+        job_id=app_entity.job_id,
+        job_title=job_title,
+        user_id=app_entity.user_id,
+        applicant_name=applicant_name,
+        applicant_username=applicant_username,
+        resume_id=app_entity.resume_id,
+        cover_letter_id=app_entity.cover_letter_id,
+        status=ApplicationStatus(app_entity.status),
+        created_at=app_entity.created_at,
+        updated_at=app_entity.updated_at,
+    )
+
+
+async def list_applications(
+    current_user: User,
+    db: AsyncSession,
+    status_filter: ApplicationStatus | None = None,
+    job_id: str | None = None,
+    user_id: str | None = None,
+    limit: int = 500,
+    cursor: str | None = None,
+) -> tuple[list[ApplicationResponse], str | None]:
+    # The plain-list shape kept for existing clients, bounded like /page; the cursor
+    # for the next slice is returned separately so the body stays a bare list.
+    stmt = _applications_query(current_user, status_filter=status_filter, job_id=job_id, user_id=user_id)
+    rows, cursor_out = next_cursor(
+        (await db.execute(keyset_order(stmt, Application.created_at, Application.id, cursor).limit(limit + 1))).all(),
+        limit,
+        lambda row: (row[0].created_at, row[0].id),
+    )
+    return [_application_response(row) for row in rows], cursor_out
+
+
+async def list_applications_page(
+    current_user: User,
+    db: AsyncSession,
+    size: int = 20,
+    cursor: str | None = None,
+    include_total: bool | None = None,
+    status_filter: ApplicationStatus | None = None,
+    job_id: str | None = None,
+    user_id: str | None = None,
+) -> ApplicationListResponse:
+    stmt = _applications_query(current_user, status_filter=status_filter, job_id=job_id, user_id=user_id)
+    total = None
+    if wants_total(cursor, include_total):
+        total = int((await db.scalar(select(func.count()).select_from(stmt.subquery()))) or 0)
+
+    rows, cursor_out = next_cursor(
+        (await db.execute(keyset_order(stmt, Application.created_at, Application.id, cursor).limit(size + 1))).all(),
+        size,
+        lambda row: (row[0].created_at, row[0].id),
+    )
+    return ApplicationListResponse(
+        size=size,
+        total=total,
+        next_cursor=cursor_out,
+        items=[_application_response(row) for row in rows],
+    )
+
+
+async def stream_applications(
+    current_user: User,
+    status_filter: ApplicationStatus | None = None,
+    job_id: str | None = None,
+    user_id: str | None = None,
+) -> AsyncIterator[bytes]:
+    # The export outlives the request-scoped session, so it opens its own and reads
+    # through a server-side cursor; memory stays at one batch however many rows match.
+    stmt = _applications_query(current_user, status_filter=status_filter, job_id=job_id, user_id=user_id)
+    stmt = stmt.order_by(Application.created_at.desc(), Application.id.desc())
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(stmt.execution_options(yield_per=_EXPORT_BATCH_SIZE))
+        async for partition in result.partitions():
+            yield b"".join(_application_response(row).model_dump_json().encode() + b"\n" for row in partition)
 
 
 def _enqueue_application_email(to_email: str, subject: str, body: str) -> None:
@@ -1,6 +1,7 @@
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import keyset_order, next_cursor, wants_total
 from app.models.audit_log_model import AuditLog
 from app.schemas.audit_log_schema import AuditLogListResponse
 
@@ -12,6 +13,8 @@ async def list_audit_logs(
     user_id: str | None = None,
     method: str | None = None,
     status_code: int | None = None,
+    cursor: str | None = None,
+    include_total: bool | None = None,
 ) -> AuditLogListResponse:
     filters = []
     if user_id:
@@ -21,15 +24,23 @@ async def list_audit_logs(
     if status_code is not None:
         filters.append(AuditLog.status_code == status_code)
 
-    total_stmt = select(func.count()).select_from(AuditLog)
-    if filters:
-        total_stmt = total_stmt.where(and_(*filters))
-    total = (await db.execute(total_stmt)).scalar_one()
+    total = None
+    if wants_total(cursor, include_total):
+        total_stmt = select(func.count()).select_from(AuditLog)
+        if filters:
+            total_stmt = total_stmt.where(and_(*filters))
+        total = (await db.execute(total_stmt)).scalar_one()
 
     stmt = select(AuditLog)
     if filters:
         stmt = stmt.where(and_(*filters))
-    stmt = stmt.order_by(AuditLog.created_at.desc()).offset((page - 1) * size).limit(size)
+    stmt = keyset_order(stmt, AuditLog.created_at, AuditLog.id, cursor)
+    if not cursor:
+        stmt = stmt.offset((page - 1) * size)
 
-    logs = (await db.scalars(stmt)).all()
-    return AuditLogListResponse(page=page, size=size, total=total, items=logs)
+    logs, cursor_out = next_cursor(
+        list((await db.scalars(stmt.limit(size + 1))).all()),
+        size,
+        lambda log: (log.created_at, log.id),
+    )
+    return AuditLogListResponse(page=page, size=size, total=total, next_cursor=cursor_out, items=logs)
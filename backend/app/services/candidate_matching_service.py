@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.job_candidate_match_model import JobCandidateMatch
+from app.models.job_model import Job
+from app.models.resume_model import Resume
+from app.models.user_model import User
+from app.models.user_notification_settings_model import UserNotificationSettings
+from app.services.ann_index_service import get_vector_index
+from app.services.job_embedding_service import load_job_vectors
+from app.services.pgvector_service import nearest_vectors, pgvector_ready, supports_query
+from app.services.similarity_service import normalize_rows, top_k_indices
+from app.tasks import enqueue_bulk_email_notification
+
+# Users often have several resumes; over-fetch so the per-user dedupe still fills top N.
+_CANDIDATE_OVERFETCH = 4
+
+
+async def match_job_to_candidates(job_id: str, db: AsyncSession) -> dict[str, str | int]:
+    job = await db.scalar(select(Job).where(Job.id == job_id))
+    if not job:
+        return {"job_id": job_id, "status": "not_found"}
+
+    settings = get_settings()
+    job_vec = (await load_job_vectors([job], db))[0]
+    ranking = await _rank_resumes(job_vec, settings.candidate_match_top_n * _CANDIDATE_OVERFETCH, db)
+    ranking = [(resume_id, score) for resume_id, score in ranking if score >= settings.candidate_match_min_score]
+    if not ranking:
+        return {"job_id": job_id, "status": "matched", "candidates": 0, "notified": 0}
+
+    owners = dict(
+        (await db.execute(select(Resume.id, Resume.user_id).where(Resume.id.in_([rid for rid, _ in ranking])))).all()
+    )
+    best_per_user: dict[str, tuple[str, float]] = {}
+    for resume_id, score in ranking:
+        user_id = owners.get(resume_id)
+        if user_id and user_id != job.recruiter_id and user_id not in best_per_user:
+            best_per_user[user_id] = (resume_id, score)
+    candidates = list(best_per_user.items())[: settings.candidate_match_top_n]
+    if not candidates:
+        return {"job_id": job_id, "status": "matched", "candidates": 0, "notified": 0}
+
+    stmt = pg_insert(JobCandidateMatch).values(
+        [
+            {
+                "id": str(uuid4()),
+                "job_id": job.id,
+                "resume_id": resume_id,
+                "user_id": user_id,
+                "model_name": settings.embedding_model,
+                "similarity_score": score,
+                "rank": idx,
+                "created_at": datetime.utcnow(),
+            }
+            for idx, (user_id, (resume_id, score)) in enumerate(candidates, start=1)
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_job_candidate_match_job_resume",
+        set_={
+            "model_name": stmt.excluded.model_name,
+            "similarity_score": stmt.excluded.similarity_score,
+            "rank": stmt.excluded.rank,
+        },
+    )
+    await db.execute(stmt)
+
+    notified = await _notify_candidates(job, [user_id for user_id, _ in candidates], db)
+    return {"job_id": job_id, "status": "matched", "candidates": len(candidates), "notified": notified}
+
+
+async def _rank_resumes(job_vec, limit: int, db: AsyncSession) -> list[tuple[str, float]]:
+    if await pgvector_ready(db) and supports_query(job_vec):
+        return await nearest_vectors("resumes", db, job_vec, limit)
+
+    # Exact scores over every stored resume vector in one matrix-vector product;
+    # the index rows are already normalised, so only the query is.
+    index = await get_vector_index("resumes", db)
+    if not len(index) or index.dim != len(job_vec):
+        return []
+    scores = index.vectors @ normalize_rows(job_vec)[0]
+    return [(index.ids[i], float(scores[i])) for i in top_k_indices(scores, limit)]
+
+
+async def _notify_candidates(job: Job, user_ids: list[str], db: AsyncSession) -> int:
+    # Users without a settings row get the model default, which is opted in.
+    rows = (
+        await db.execute(
+            select(User.id, User.email)
+            .distinct()
+            .join(JobCandidateMatch, JobCandidateMatch.user_id == User.id)
+            .outerjoin(UserNotificationSettings, UserNotificationSettings.user_id == User.id)
+            .where(
+                JobCandidateMatch.job_id == job.id,
+                JobCandidateMatch.user_id.in_(user_ids),
+                JobCandidateMatch.notified_at.is_(None),
+                UserNotificationSettings.email_job_matches.is_not(False),
+            )
+        )
+    ).all()
+    if not rows:
+        return 0
+
+    subject = f"New job match: {job.title}"
+    body = (
+        f"Hi,\n\nA new job posting matches your resume.\n"
+        f"{job.title} ({job.location})\n\n"
+        "Check your dashboard for details.\n"
+    )
+    # One task per job: the worker sends every candidate's message over a single SMTP connection.
+    enqueue_bulk_email_notification(to_emails=[email for _, email in rows], subject=subject, body=body)
+
+    await db.execute(
+        update(JobCandidateMatch)
+        .where(JobCandidateMatch.job_id == job.id, JobCandidateMatch.user_id.in_([user_id for user_id, _ in rows]))
+        .values(notified_at=datetime.utcnow())
+    )
+    return len(rows)
@@ -7,18 +7,42 @@ settings = get_settings()
 
 
 def send_email_smtp(to_email: str, subject: str, body: str) -> None:
-    if not settings.smtp_host or not settings.smtp_from_email:
-        raise RuntimeError("SMTP is not configured")
+    with _smtp_connection() as server:
+        server.send_message(_build_message(to_email, subject, body))
+
+
+def send_bulk_email_smtp(to_emails: list[str], subject: str, body: str) -> list[str]:
+    # One connection and login for the whole batch; each recipient still gets their own message.
+    failed: list[str] = []
+    with _smtp_connection() as server:
+        for to_email in to_emails:
+            try:
+                server.send_message(_build_message(to_email, subject, body))
+            except smtplib.SMTPRecipientsRefused:
+                failed.append(to_email)
+    return failed
+
 
+def _build_message(to_email: str, subject: str, body: str) -> EmailMessage:
     msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"] = settings.smtp_from_email
     msg["To"] = to_email
     msg.set_content(body)
+    return msg
+
+
+def _smtp_connection() -> smtplib.SMTP:
+    if not settings.smtp_host or not settings.smtp_from_email:
+        raise RuntimeError("SMTP is not configured")
 
-    with smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=15) as server:
+    server = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=15)
+    try:
         if settings.smtp_use_tls:
             server.starttls()
         if settings.smtp_username and settings.smtp_password:
             server.login(settings.smtp_username, settings.smtp_password)
-        server.send_message(msg)
+    except BaseException:
+        server.close()
+        raise
+    return server
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.core.config import get_settings
+
+_NUMPY = None
+_REDIS_RETRY_SECONDS = 30.0
+
+_stats = {"memory_hits": 0, "redis_hits": 0, "misses": 0, "redis_errors": 0}
+
+
+def _get_numpy():
+    global _NUMPY
+    if _NUMPY is None:
+        import numpy as np
+
+        _NUMPY = np
+    return _NUMPY
+
+
+class LRUBytesCache:
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size_bytes -= len(previous)
+        self._entries[key] = value
+        self.size_bytes += len(value)
+        while self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted)
+
+
+_memory: LRUBytesCache | None = None
+_redis = None
+_redis_loop: asyncio.AbstractEventLoop | None = None
+_redis_disabled_until = 0.0
+
+
+def _get_memory() -> LRUBytesCache:
+    global _memory
+    if _memory is None:
+        _memory = LRUBytesCache(get_settings().embedding_cache_memory_bytes)
+    return _memory
+
+
+async def _get_redis():
+    global _redis, _redis_loop
+    settings = get_settings()
+    if not settings.embedding_cache_redis_url or time.monotonic() < _redis_disabled_until:
+        return None
+
+    loop = asyncio.get_running_loop()
+    if _redis is not None and _redis_loop is not loop:
+        # Connections are bound to the loop that opened them; release the old pool first.
+        await close_embedding_cache()
+    if _redis is None:
+        from redis.asyncio import Redis
+
+        _redis = Redis.from_url(
+            settings.embedding_cache_redis_url,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+        _redis_loop = loop
+    return _redis
+
+
+async def close_embedding_cache() -> None:
+    global _redis, _redis_loop
+    client, _redis, _redis_loop = _redis, None, None
+    if client is not None:
+        try:
+            await client.aclose()
+        except Exception:
+            # Transports of a closed loop cannot be shut down cleanly; drop them.
+            pass
+
+
+def _disable_redis() -> None:
+    # Back off instead of paying a connect timeout on every lookup when Redis is down.
+    global _redis_disabled_until
+    _stats["redis_errors"] += 1
+    _redis_disabled_until = time.monotonic() + _REDIS_RETRY_SECONDS
+
+
+def cache_key(model_name: str, text: str) -> str:
+    return f"emb:{model_name}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+
+async def get_cached_embeddings(model_name: str, texts: list[str]) -> list[list[float] | None]:
+    np = _get_numpy()
+    settings = get_settings()
+    if not settings.embedding_cache_enabled:
+        return [None] * len(texts)
+
+    memory = _get_memory()
+    keys = [cache_key(model_name, text) for text in texts]
+    found: list[bytes | None] = [memory.get(key) for key in keys]
+    _stats["memory_hits"] += sum(1 for value in found if value is not None)
+
+    pending = [idx for idx, value in enumerate(found) if value is None]
+    redis = await _get_redis() if pending else None
+    if redis is not None:
+        try:
+            values = await redis.mget([keys[idx] for idx in pending])
+        except Exception:
+            _disable_redis()
+            values = [None] * len(pending)
+        for idx, value in zip(pending, values, strict=True):
+            if value is not None:
+                found[idx] = value
+                memory.set(keys[idx], value)
+                _stats["redis_hits"] += 1
+
+    _stats["misses"] += sum(1 for value in found if value is None)
+    return [None if value is None else np.frombuffer(value, dtype=np.float32).tolist() for value in found]
+
+
+async def store_embeddings(model_name: str, texts: list[str], vectors: list[list[float]]) -> None:
+    np = _get_numpy()
+    settings = get_settings()
+    if not settings.embedding_cache_enabled or not texts:
+        return
+
+    memory = _get_memory()
+    entries = {
+        cache_key(model_name, text): np.asarray(vector, dtype=np.float32).tobytes()
+        for text, vector in zip(texts, vectors, strict=True)
+    }
+    for key, value in entries.items():
+        memory.set(key, value)
+
+    redis = await _get_redis()
+    if redis is None:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for key, value in entries.items():
+                pipe.set(key, value, ex=settings.embedding_cache_redis_ttl_seconds)
+            await pipe.execute()
+    except Exception:
+        _disable_redis()
+
+
+def get_embedding_cache_metrics() -> dict[str, Any]:
+    lookups = _stats["memory_hits"] + _stats["redis_hits"] + _stats["misses"]
+    memory = _get_memory()
+    return {
+        **_stats,
+        "hit_rate": round((lookups - _stats["misses"]) / lookups, 4) if lookups else None,
+        "memory_entries": len(memory),
+        "memory_bytes": memory.size_bytes,
+        "memory_max_bytes": memory.max_bytes,
+        "redis_available": time.monotonic() >= _redis_disabled_until,
+    }
@@ -1,11 +1,158 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Protocol
 
 import httpx
 from fastapi import HTTPException, status
 
 from app.core.config import get_settings
+from app.services.embedding_cache_service import (
+    get_cached_embeddings,
+    get_embedding_cache_metrics,
+    store_embeddings,
+)
+from app.services.local_embedding_service import HashingEmbeddingProvider
+
+_LATENCY_WINDOW = 1000
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+_latencies_ms: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+_request_stats = {"requests": 0, "retries": 0, "errors": 0, "in_flight": 0, "max_in_flight": 0}
+
+
+class EmbeddingProvider(Protocol):
+    name: str
+    cacheable: bool
+
+    async def embed(self, texts: list[str]) -> list[list[float]]: ...
+
+
+class HTTPEmbeddingProvider:
+    name = "http"
+    cacheable = True
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        if not get_settings().embedding_api_key:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Embedding API key is not configured",
+            )
+        return await _embed_texts(texts)
+
+
+_provider: EmbeddingProvider | None = None
+
+
+def get_embedding_provider() -> EmbeddingProvider:
+    global _provider
+    if _provider is None:
+        settings = get_settings()
+        if settings.embedding_provider == "local":
+            _provider = HashingEmbeddingProvider(settings.embedding_dimensions)
+        else:
+            _provider = HTTPEmbeddingProvider()
+    return _provider
+
+
+def _build_client() -> httpx.AsyncClient:
+    settings = get_settings()
+    limits = httpx.Limits(
+        max_connections=settings.embedding_http_max_connections,
+        max_keepalive_connections=settings.embedding_http_max_keepalive_connections,
+        keepalive_expiry=settings.embedding_http_keepalive_expiry_seconds,
+    )
+    timeout = httpx.Timeout(settings.embedding_timeout_seconds)
+    if settings.embedding_http2:
+        try:
+            return httpx.AsyncClient(limits=limits, timeout=timeout, http2=True)
+        except ImportError:
+            # HTTP/2 needs the optional 'h2' package; fall back to HTTP/1.1 keep-alive.
+            pass
+    return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+
+def start_embedding_client() -> None:
+    global _client, _client_loop
+    if _client is None:
+        _client = _build_client()
+        _client_loop = asyncio.get_running_loop()
+
+
+async def close_embedding_client() -> None:
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None:
+        await client.aclose()
+
+
+async def _get_client() -> httpx.AsyncClient:
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    # Pooled connections are bound to the loop that opened them. Celery tasks close
+    # their client through run_task; anything else left from an ended loop is closed
+    # here before a new pool is opened.
+    if _client is not None and _client_loop is not loop:
+        stale, _client, _client_loop = _client, None, None
+        try:
+            await stale.aclose()
+        except Exception:
+            # Transports of a closed loop cannot be shut down cleanly; drop them.
+            pass
+    if _client is None:
+        _client = _build_client()
+        _client_loop = loop
+    return _client
+
+
+def _pool_metrics() -> dict[str, Any]:
+    settings = get_settings()
+    if _client is None:
+        return {"open": False}
+    metrics: dict[str, Any] = {
+        "open": True,
+        "max_connections": settings.embedding_http_max_connections,
+        "max_keepalive_connections": settings.embedding_http_max_keepalive_connections,
+    }
+    # httpx has no public pool stats; the httpcore pool is read when it has the
+    # expected shape and left out otherwise.
+    try:
+        connections = list(_client._transport._pool.connections)
+        metrics["connections"] = len(connections)
+        metrics["idle_connections"] = sum(1 for connection in connections if connection.is_idle())
+    except Exception:
+        pass
+    return metrics
+
+
+def get_embedding_client_metrics() -> dict[str, Any]:
+    latencies = sorted(_latencies_ms)
+    latency: dict[str, float | int | None] = {
+        "samples": len(latencies),
+        "avg": None,
+        "p50": None,
+        "p95": None,
+        "max": None,
+    }
+    if latencies:
+        latency.update(
+            avg=round(sum(latencies) / len(latencies), 2),
+            p50=round(latencies[len(latencies) // 2], 2),
+            p95=round(latencies[max(int(len(latencies) * 0.95) - 1, 0)], 2),
+            max=round(latencies[-1], 2),
+        )
+    return {
+        "provider": get_embedding_provider().name,
+        **_request_stats,
+        "pool": _pool_metrics(),
+        "latency_ms": latency,
+        "cache": get_embedding_cache_metrics(),
+    }
 
 
 async def generate_embeddings(texts: list[str]) -> list[list[float]]:
@@ -13,36 +160,92 @@ async def generate_embeddings(texts: list[str]) -> list[list[float]]:
     if not cleaned:
         return []
 
+    provider = get_embedding_provider()
+    if not provider.cacheable:
+        return await provider.embed(cleaned)
+
     settings = get_settings()
-    if not settings.embedding_api_key:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Embedding API key is not configured",
-        )
+    unique = list(dict.fromkeys(cleaned))
+    cached = await get_cached_embeddings(settings.embedding_model, unique)
+    vectors = dict(zip(unique, cached, strict=True))
+    missing = [text for text in unique if vectors[text] is None]
+
+    if missing:
+        fresh = await provider.embed(missing)
+        vectors.update(zip(missing, fresh, strict=True))
+        await store_embeddings(settings.embedding_model, missing, fresh)
+
+    return [vectors[text] for text in cleaned]
+
 
+async def _embed_texts(texts: list[str]) -> list[list[float]]:
+    settings = get_settings()
+    batches = _split_batches(texts, settings.embedding_batch_size, settings.embedding_batch_max_tokens)
+    if len(batches) == 1:
+        return await _embed_batch(batches[0])
+
+    semaphore = asyncio.Semaphore(settings.embedding_max_concurrency)
+
+    async def run(batch: list[str]) -> list[list[float]]:
+        async with semaphore:
+            return await _embed_batch(batch)
+
+    # gather preserves batch order, so the flattened vectors line up with the input.
+    results = await asyncio.gather(*(run(batch) for batch in batches))
+    return [vector for batch_vectors in results for vector in batch_vectors]
+
+
+def _approx_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def _split_batches(texts: list[str], max_items: int, max_tokens: int) -> list[list[str]]:
+    batches: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
+    for text in texts:
+        tokens = _approx_tokens(text)
+        if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None) -> float:
+    settings = get_settings()
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), settings.embedding_retry_max_seconds)
+        except ValueError:
+            pass
+    # Full jitter keeps concurrent batches from retrying in lockstep.
+    ceiling = min(settings.embedding_retry_base_seconds * (2**attempt), settings.embedding_retry_max_seconds)
+    return random.uniform(0, ceiling)
+
+
+async def _embed_batch(batch: list[str]) -> list[list[float]]:
+    settings = get_settings()
     headers = {
         "Authorization": f"Bearer {settings.embedding_api_key}",
         "Content-Type": "application/json",
     }
     payload: dict[str, Any] = {
         "model": settings.embedding_model,
-        "input": cleaned,
+        "input": batch,
     }
 
-    try:
-        async with httpx.AsyncClient(timeout=settings.embedding_timeout_seconds) as client:
-            response = await client.post(settings.embedding_api_url, headers=headers, json=payload)
-            response.raise_for_status()
-    except httpx.HTTPStatusError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Embedding API error: {exc.response.status_code}",
-        ) from exc
-    except httpx.RequestError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Embedding API unavailable",
-        ) from exc
+    for attempt in range(settings.embedding_max_retries + 1):
+        # The final attempt raises instead of returning a retryable result.
+        response = await _post_embeddings(headers, payload, final=attempt == settings.embedding_max_retries)
+        if response is not None and response.status_code not in _RETRY_STATUS_CODES:
+            break
+        _request_stats["retries"] += 1
+        await asyncio.sleep(_retry_delay(attempt, response))
 
     data = response.json()
     items = data.get("data")
@@ -60,7 +263,7 @@ async def generate_embeddings(texts: list[str]) -> list[list[float]]:
             detail="Invalid embedding API response payload",
         ) from exc
 
-    if len(vectors) != len(cleaned):
+    if len(vectors) != len(batch):
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Embedding API returned unexpected number of vectors",
@@ -69,6 +272,38 @@ async def generate_embeddings(texts: list[str]) -> list[list[float]]:
     return vectors
 
 
+async def _post_embeddings(headers: dict[str, str], payload: dict[str, Any], final: bool) -> httpx.Response | None:
+    # None or a 429/5xx response means the caller should back off and retry.
+    client = await _get_client()
+    started = time.perf_counter()
+    _request_stats["requests"] += 1
+    _request_stats["in_flight"] += 1
+    _request_stats["max_in_flight"] = max(_request_stats["max_in_flight"], _request_stats["in_flight"])
+    try:
+        response = await client.post(get_settings().embedding_api_url, headers=headers, json=payload)
+        if response.status_code in _RETRY_STATUS_CODES and not final:
+            return response
+        response.raise_for_status()
+        return response
+    except httpx.HTTPStatusError as exc:
+        _request_stats["errors"] += 1
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Embedding API error: {exc.response.status_code}",
+        ) from exc
+    except httpx.RequestError as exc:
+        if not final:
+            return None
+        _request_stats["errors"] += 1
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Embedding API unavailable",
+        ) from exc
+    finally:
+        _request_stats["in_flight"] -= 1
+        _latencies_ms.append((time.perf_counter() - started) * 1000)
+
+
 async def generate_embedding(text: str) -> list[float]:
     vectors = await generate_embeddings([text])
     if not vectors:
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from app.services.skill_taxonomy_service import build_trie_pattern
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_YEAR = r"(?:19|20)\d{2}"
+_DATE = rf"(?:{_MONTH}\s+{_YEAR}|\d{{1,2}}/{_YEAR}|{_YEAR})"
+_OPEN_END = r"(?:present|current|now|today)"
+
+JOB_TITLES = (
+    "software engineer",
+    "software developer",
+    "backend developer",
+    "backend engineer",
+    "frontend developer",
+    "frontend engineer",
+    "full stack developer",
+    "full stack engineer",
+    "fullstack developer",
+    "web developer",
+    "mobile developer",
+    "data scientist",
+    "data engineer",
+    "data analyst",
+    "machine learning engineer",
+    "ml engineer",
+    "devops engineer",
+    "site reliability engineer",
+    "cloud engineer",
+    "qa engineer",
+    "test engineer",
+    "security engineer",
+    "solutions architect",
+    "software architect",
+    "engineering manager",
+    "product manager",
+    "project manager",
+    "technical lead",
+    "tech lead",
+)
+
+# Order matters where alternatives can start at the same position: a date range
+# must win over the bare year it begins with.
+PATTERN_REGISTRY: dict[str, str] = {
+    # Digits or dashes on either side mean a phone or ID number, not a date range.
+    "date_range": rf"(?<![\w/-]){_DATE}\s*(?:-|–|—|to|until)\s*(?:{_DATE}|{_OPEN_END})(?![\w/-])",
+    "years": r"\b\d{1,2}(?:\.\d)?\+?\s*(?:years?|yrs?)\b(?:\s+of\s+(?:professional\s+)?experience\b)?",
+    "title": r"\b(?:(?:senior|sr\.?|junior|jr\.?|lead|principal|staff)\s+)?"
+    + build_trie_pattern(JOB_TITLES)
+    + r"s?\b",
+}
+
+EXPERIENCE_PATTERN = re.compile(
+    "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in PATTERN_REGISTRY.items()),
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ExperienceSpan:
+    kind: str
+    text: str
+    start: int
+    end: int
+
+
+def extract_experience_spans(text: str) -> list[ExperienceSpan]:
+    # Single pass: every registered pattern is one named branch of the same compiled regex.
+    return [
+        ExperienceSpan(kind=match.lastgroup, text=match.group(), start=match.start(), end=match.end())
+        for match in EXPERIENCE_PATTERN.finditer(text)
+    ]
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import and_, event, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.job_embedding_model import JobEmbedding
+from app.models.job_model import Job
+from app.services.ann_index_service import index_remove, index_upsert
+from app.services.embedding_service import generate_embeddings
+from app.services.pgvector_service import store_vectors
+from app.services.similarity_service import decode_vector, encode_vector
+from app.tasks import enqueue_job_embedding_refresh
+
+_NUMPY = None
+_BACKFILL_BATCH_SIZE = 256
+_last_backfill_at = 0.0
+_REFRESH_KEY = "pending_job_embedding_refreshes"
+
+
+def _get_numpy():
+    global _NUMPY
+    if _NUMPY is None:
+        import numpy as np
+
+        _NUMPY = np
+    return _NUMPY
+
+
+def build_job_text(job: Job) -> str:
+    skills = ", ".join(job.skills or [])
+    return f"Title: {job.title}\nDescription: {job.description}\nSkills: {skills}\nLocation: {job.location}"
+
+
+def job_content_hash(job: Job) -> str:
+    return hashlib.sha256(build_job_text(job).encode("utf-8")).hexdigest()
+
+
+async def refresh_job_embedding(job: Job, db: AsyncSession) -> None:
+    model_name = get_settings().embedding_model
+    content_hash = job_content_hash(job)
+
+    existing = await db.scalar(
+        select(JobEmbedding).where(JobEmbedding.job_id == job.id, JobEmbedding.model_name == model_name)
+    )
+    if existing and existing.content_hash == content_hash:
+        return
+
+    try:
+        vectors = await generate_embeddings([build_job_text(job)])
+    except HTTPException:
+        # Drop the stale vector; load_job_vectors rebuilds it on the next match.
+        if existing:
+            await db.delete(existing)
+            await db.flush()
+            index_remove(db, "jobs", [job.id])
+        return
+
+    await _upsert_embeddings(db, model_name, [(job.id, content_hash, vectors[0])])
+
+
+def queue_job_embedding_refresh(db: AsyncSession, job_id: str) -> None:
+    # Embedding is a remote call, so it runs in a worker once the request's
+    # transaction has committed rather than inside it; a rollback drops it.
+    db.info.setdefault(_REFRESH_KEY, []).append(job_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _enqueue_refreshes(session: Session) -> None:
+    for job_id in dict.fromkeys(session.info.pop(_REFRESH_KEY, [])):
+        enqueue_job_embedding_refresh(job_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_refreshes(session: Session) -> None:
+    session.info.pop(_REFRESH_KEY, None)
+
+
+async def load_job_vectors(jobs: list[Job], db: AsyncSession):
+    np = _get_numpy()
+    model_name = get_settings().embedding_model
+    job_ids = [job.id for job in jobs]
+
+    rows = (
+        await db.scalars(
+            select(JobEmbedding).where(JobEmbedding.job_id.in_(job_ids), JobEmbedding.model_name == model_name)
+        )
+    ).all()
+    stored = {row.job_id: row for row in rows}
+
+    hashes = {job.id: job_content_hash(job) for job in jobs}
+    vectors: dict[str, object] = {}
+    stale: list[Job] = []
+    for job in jobs:
+        row = stored.get(job.id)
+        if row and row.content_hash == hashes[job.id]:
+            vectors[job.id] = decode_vector(row.vector)
+        else:
+            stale.append(job)
+
+    if stale:
+        fresh = await generate_embeddings([build_job_text(job) for job in stale])
+        await _upsert_embeddings(
+            db,
+            model_name,
+            [(job.id, hashes[job.id], vector) for job, vector in zip(stale, fresh, strict=True)],
+        )
+        for job, vector in zip(stale, fresh, strict=True):
+            vectors[job.id] = np.asarray(vector, dtype=np.float32)
+
+    return np.vstack([vectors[job_id] for job_id in job_ids])
+
+
+async def backfill_job_embeddings(db: AsyncSession) -> None:
+    global _last_backfill_at
+    settings = get_settings()
+    if time.monotonic() - _last_backfill_at < settings.vector_index_sync_seconds:
+        return
+    _last_backfill_at = time.monotonic()
+
+    missing = (
+        await db.scalars(
+            select(Job)
+            .outerjoin(
+                JobEmbedding,
+                and_(JobEmbedding.job_id == Job.id, JobEmbedding.model_name == settings.embedding_model),
+            )
+            .where(JobEmbedding.id.is_(None))
+            .limit(_BACKFILL_BATCH_SIZE)
+        )
+    ).all()
+    if not missing:
+        return
+
+    try:
+        vectors = await generate_embeddings([build_job_text(job) for job in missing])
+    except HTTPException:
+        return
+
+    await _upsert_embeddings(
+        db,
+        settings.embedding_model,
+        [(job.id, job_content_hash(job), vector) for job, vector in zip(missing, vectors, strict=True)],
+    )
+
+
+async def _upsert_embeddings(
+    db: AsyncSession,
+    model_name: str,
+    entries: list[tuple[str, str, list[float]]],
+) -> None:
+    now = datetime.utcnow()
+    values = [
+        {
+            "id": str(uuid4()),
+            "job_id": job_id,
+            "model_name": model_name,
+            "content_hash": content_hash,
+            "dimensions": len(vector),
+            "vector": encode_vector(vector),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for job_id, content_hash, vector in entries
+    ]
+    stmt = pg_insert(JobEmbedding).values(values)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_job_embeddings_job_model",
+        set_={
+            "content_hash": stmt.excluded.content_hash,
+            "dimensions": stmt.excluded.dimensions,
+            "vector": stmt.excluded.vector,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await db.execute(stmt)
+    await store_vectors("jobs", db, model_name, [(entry[0], entry[2]) for entry in entries])
+    index_upsert(db, "jobs", [entry[0] for entry in entries], [entry[2] for entry in entries])
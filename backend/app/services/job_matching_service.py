@@ -1,39 +1,34 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
+from app.models.job_embedding_model import JobEmbedding
 from app.models.job_match_model import JobMatchResult
 from app.models.job_model import Job
 from app.models.resume_model import Resume
 from app.models.resume_parse_model import ResumeParseResult
 from app.models.user_model import User
 from app.schemas.job_match_schema import JobMatchItem, JobMatchRequest, JobMatchResponse
-from app.services.embedding_service import generate_embeddings
+from app.services.embedding_service import generate_embedding
+from app.services.job_embedding_service import backfill_job_embeddings, load_job_vectors
+from app.services.pgvector_service import nearest_vectors, pgvector_ready, supports_query
+from app.services.resume_embedding_service import build_resume_text, resume_content_hash
+from app.services.similarity_service import SimilarityMatrix, decode_vector
 from app.tasks import enqueue_email_notification
 
-_NUMPY = None
-
-
-def _get_numpy():
-    global _NUMPY
-    if _NUMPY is None:
-        import numpy as np
-
-        _NUMPY = np
-    return _NUMPY
-
-
-def _cosine_similarity(a, b) -> float:
-    np = _get_numpy()
-    denom = np.linalg.norm(a) * np.linalg.norm(b)
-    if denom == 0:
-        return 0.0
-    return float(np.dot(a, b) / denom)
+# Matches are stored to the largest top_k JobMatchRequest allows, so any request
+# can be answered from the stored list.
+MATCH_RESULT_DEPTH = 20
+_MAX_INCREMENTAL_JOBS = 5_000
+# Embeddings committed slightly out of updated_at order are rescored on the next merge.
+_CATALOG_OVERLAP = timedelta(minutes=1)
 
 
 async def match_resume_to_jobs(payload: JobMatchRequest, current_user: User, db: AsyncSession) -> JobMatchResponse:
@@ -45,75 +40,194 @@ async def match_resume_to_jobs(payload: JobMatchRequest, current_user: User, db:
     if not parsed:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume parse result not found yet")
 
-    jobs = (await db.scalars(select(Job).order_by(Job.created_at.desc()))).all()
-    if not jobs:
+    model_name = get_settings().embedding_model
+    if not await db.scalar(select(Job.id).limit(1)):
         return JobMatchResponse(
             resume_id=resume.id,
-            model_name=get_settings().embedding_model,
+            model_name=model_name,
             generated_at=datetime.now(timezone.utc),
             matches=[],
         )
 
-    resume_text = _build_resume_text(parsed)
-    job_texts = [_build_job_text(job) for job in jobs]
-
-    np = _get_numpy()
-    vectors = await generate_embeddings([resume_text, *job_texts])
-    resume_vec = np.array(vectors[0], dtype=np.float32)
-    job_vecs = np.array(vectors[1:], dtype=np.float32)
-
-    scored: list[tuple[Job, float]] = []
-    for job, vec in zip(jobs, job_vecs, strict=False):
-        score = _cosine_similarity(resume_vec, vec)
-        scored.append((job, score))
-
-    scored.sort(key=lambda item: item[1], reverse=True)
-    top = scored[: payload.top_k]
-
-    await db.execute(delete(JobMatchResult).where(JobMatchResult.resume_id == resume.id))
+    await backfill_job_embeddings(db)
+    resume_hash = resume_content_hash(parsed)
+    catalog_count, catalog_version = (
+        await db.execute(
+            select(func.count(), func.max(JobEmbedding.updated_at)).where(JobEmbedding.model_name == model_name)
+        )
+    ).one()
 
-    matches: list[JobMatchItem] = []
-    for idx, (job, score) in enumerate(top, start=1):
-        db.add(
-            JobMatchResult(
-                resume_id=resume.id,
-                job_id=job.id,
-                similarity_score=score,
-                rank=idx,
-            )
+    stored = (
+        await db.scalars(
+            select(JobMatchResult).where(JobMatchResult.resume_id == resume.id).order_by(JobMatchResult.rank)
         )
-        matches.append(
-            JobMatchItem(
-                job_id=job.id,
-                title=job.title,
-                location=job.location,
-                skills=job.skills,
-                similarity_score=round(score, 4),
-                rank=idx,
-            )
+    ).all()
+    previous = [(row.job_id, row.similarity_score) for row in stored]
+    stored_version = _stored_version(stored, model_name, resume_hash)
+
+    ranking = None
+    unchanged = stored_version is not None and catalog_version is not None and stored_version >= catalog_version
+    if unchanged:
+        ranking = previous
+    elif stored_version is not None and catalog_version is not None:
+        ranking = await _merge_changed_jobs(previous, stored_version, catalog_count, parsed, db)
+
+    if ranking is None or len(ranking) < min(payload.top_k, catalog_count):
+        unchanged = False
+        resume_vec = await generate_embedding(build_resume_text(parsed))
+        ranking = await _rank_jobs(resume_vec, MATCH_RESULT_DEPTH, db)
+
+    if not unchanged:
+        await _store_matches(resume.id, ranking, model_name, resume_hash, catalog_version, db)
+
+    top = ranking[: payload.top_k]
+    jobs_by_id = {
+        job.id: job for job in (await db.scalars(select(Job).where(Job.id.in_([job_id for job_id, _ in top])))).all()
+    }
+    live = [(jobs_by_id[job_id], score) for job_id, score in top if job_id in jobs_by_id]
+    matches = [
+        JobMatchItem(
+            job_id=job.id,
+            title=job.title,
+            location=job.location,
+            skills=job.skills,
+            similarity_score=round(score, 4),
+            rank=idx,
         )
+        for idx, (job, score) in enumerate(live, start=1)
+    ]
 
-    await db.flush()
     _enqueue_match_email(current_user=current_user, matches=matches)
 
+    generated_at = datetime.now(timezone.utc)
+    if unchanged:
+        generated_at = max(row.updated_at for row in stored).replace(tzinfo=timezone.utc)
     return JobMatchResponse(
         resume_id=resume.id,
-        model_name=get_settings().embedding_model,
-        generated_at=datetime.now(timezone.utc),
+        model_name=model_name,
+        generated_at=generated_at,
         matches=matches,
     )
 
 
-def _build_resume_text(parsed: ResumeParseResult) -> str:
-    skills = ", ".join(parsed.skills or [])
-    experience = "; ".join(parsed.experience or [])
-    education = "; ".join(parsed.education or [])
-    return f"Skills: {skills}\nExperience: {experience}\nEducation: {education}"
+def _stored_version(stored: list[JobMatchResult], model_name: str, resume_hash: str) -> datetime | None:
+    if not stored:
+        return None
+    versions = {(row.model_name, row.resume_content_hash, row.catalog_version) for row in stored}
+    if len(versions) != 1:
+        return None
+    stored_model, stored_hash, stored_version = versions.pop()
+    if stored_model != model_name or stored_hash != resume_hash:
+        return None
+    return stored_version
+
+
+async def _merge_changed_jobs(
+    previous: list[tuple[str, float]],
+    since: datetime,
+    catalog_count: int,
+    parsed: ResumeParseResult,
+    db: AsyncSession,
+) -> list[tuple[str, float]] | None:
+    changed = (
+        await db.execute(
+            select(JobEmbedding.job_id, JobEmbedding.vector)
+            .where(
+                JobEmbedding.model_name == get_settings().embedding_model,
+                JobEmbedding.updated_at >= since - _CATALOG_OVERLAP,
+            )
+            .limit(_MAX_INCREMENTAL_JOBS + 1)
+        )
+    ).all()
+    if len(changed) > _MAX_INCREMENTAL_JOBS:
+        return None
+
+    changed_ids = {job_id for job_id, _ in changed}
+    kept = [(job_id, score) for job_id, score in previous if job_id not in changed_ids]
+    scored: list[tuple[str, float]] = []
+    if changed:
+        resume_vec = await generate_embedding(build_resume_text(parsed))
+        scored = SimilarityMatrix(
+            [job_id for job_id, _ in changed],
+            [decode_vector(raw) for _, raw in changed],
+        ).top_k(resume_vec, len(changed))
+
+    merged = sorted(kept + scored, key=lambda item: item[1], reverse=True)
+    # Unchanged jobs missing from the stored list scored no higher than its last
+    # entry, so the merge is only exact down to that score.
+    if previous and len(kept) < catalog_count - len(changed_ids):
+        merged = [item for item in merged if item[1] >= previous[-1][1]]
+    return merged[:MATCH_RESULT_DEPTH]
+
+
+async def _rank_jobs(resume_vec: list[float], top_k: int, db: AsyncSession) -> list[tuple[str, float]]:
+    if await pgvector_ready(db) and supports_query(resume_vec):
+        # Let Postgres rank through the vector index instead of loading every job.
+        ranking = await nearest_vectors("jobs", db, resume_vec, top_k)
+        live_ids = set(
+            (await db.scalars(select(Job.id).where(Job.id.in_([job_id for job_id, _ in ranking])))).all()
+        )
+        return [(job_id, score) for job_id, score in ranking if job_id in live_ids]
+
+    jobs = (await db.scalars(select(Job).order_by(Job.created_at.desc()))).all()
+    job_vecs = await load_job_vectors(list(jobs), db)
+    return SimilarityMatrix([job.id for job in jobs], job_vecs).top_k(resume_vec, top_k)
+
+
+async def _store_matches(
+    resume_id: str,
+    ranking: list[tuple[str, float]],
+    model_name: str,
+    resume_hash: str,
+    catalog_version: datetime | None,
+    db: AsyncSession,
+) -> None:
+    # Upsert in place and drop only the rows that fell out of the top list.
+    await db.execute(
+        delete(JobMatchResult).where(
+            JobMatchResult.resume_id == resume_id,
+            JobMatchResult.job_id.not_in([job_id for job_id, _ in ranking]),
+        )
+    )
+    if not ranking:
+        return
+
+    now = datetime.utcnow()
+    await upsert_match_rows(
+        db,
+        [
+            {
+                "id": str(uuid4()),
+                "resume_id": resume_id,
+                "job_id": job_id,
+                "similarity_score": score,
+                "rank": idx,
+                "model_name": model_name,
+                "resume_content_hash": resume_hash,
+                "catalog_version": catalog_version,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for idx, (job_id, score) in enumerate(ranking, start=1)
+        ],
+    )
 
 
-def _build_job_text(job: Job) -> str:
-    skills = ", ".join(job.skills or [])
-    return f"Title: {job.title}\nDescription: {job.description}\nSkills: {skills}\nLocation: {job.location}"
+async def upsert_match_rows(db: AsyncSession, rows: list[dict]) -> None:
+    stmt = pg_insert(JobMatchResult)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_job_match_resume_job",
+        set_={
+            "similarity_score": stmt.excluded.similarity_score,
+            "rank": stmt.excluded.rank,
+            "model_name": stmt.excluded.model_name,
+            "resume_content_hash": stmt.excluded.resume_content_hash,
+            "catalog_version": stmt.excluded.catalog_version,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    # executemany lets SQLAlchemy batch this into multi-row INSERTs under the bind-parameter limit.
+    await db.execute(stmt, rows)
 
 
 def _enqueue_match_email(current_user: User, matches: list[JobMatchItem]) -> None:
@@ -2,9 +2,14 @@ from fastapi import HTTPException, status
 from sqlalchemy import String, cast, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import keyset_order, next_cursor, wants_total
 from app.models.job_model import Job
 from app.models.user_model import User
 from app.schemas.job_schema import JobCreateRequest, JobListResponse, JobResponse, JobUpdateRequest
+from app.services.ann_index_service import index_remove
+from app.services.job_embedding_service import queue_job_embedding_refresh
+from app.services.skill_filter_service import SkillMatch, normalize_skill_terms, skill_filter
+from app.tasks import enqueue_job_candidate_matching
 
 
 async def create_job_posting(payload: JobCreateRequest, current_user: User, db: AsyncSession) -> JobResponse:
@@ -35,6 +40,8 @@ async def create_job_posting(payload: JobCreateRequest, current_user: User, db:
     )
     db.add(job)
     await db.flush()
+    queue_job_embedding_refresh(db, job.id)
+    enqueue_job_candidate_matching(job.id)
 
     return JobResponse(
         id=job.id,
@@ -72,9 +79,12 @@ async def list_jobs(
     current_user: User,
     page: int = 1,
     size: int = 10,
-    skill: str | None = None,
+    skill: list[str] | None = None,
+    skill_match: SkillMatch = "all",
     location: str | None = None,
     q: str | None = None,
+    cursor: str | None = None,
+    include_total: bool | None = None,
 ) -> JobListResponse:
     return await _list_jobs_internal(
         db=db,
@@ -82,8 +92,11 @@ async def list_jobs(
         page=page,
         size=size,
         skill=skill,
+        skill_match=skill_match,
         location=location,
         q=q,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -91,9 +104,12 @@ async def list_public_jobs(
     db: AsyncSession,
     page: int = 1,
     size: int = 10,
-    skill: str | None = None,
+    skill: list[str] | None = None,
+    skill_match: SkillMatch = "all",
     location: str | None = None,
     q: str | None = None,
+    cursor: str | None = None,
+    include_total: bool | None = None,
 ) -> JobListResponse:
     return await _list_jobs_internal(
         db=db,
@@ -101,8 +117,11 @@ async def list_public_jobs(
         page=page,
         size=size,
         skill=skill,
+        skill_match=skill_match,
         location=location,
         q=q,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -137,6 +156,7 @@ async def update_job_posting(
         setattr(job, key, value)
 
     await db.flush()
+    queue_job_embedding_refresh(db, job.id)
 
     recruiter = await db.scalar(select(User).where(User.id == job.recruiter_id))
     return JobResponse(
@@ -168,6 +188,7 @@ async def delete_job_posting(
 
     await db.delete(job)
     await db.flush()
+    index_remove(db, "jobs", [job_id])
     return {"message": "Job deleted"}
 
 
@@ -176,9 +197,12 @@ async def _list_jobs_internal(
     recruiter_id: str | None,
     page: int = 1,
     size: int = 10,
-    skill: str | None = None,
+    skill: list[str] | None = None,
+    skill_match: SkillMatch = "all",
     location: str | None = None,
     q: str | None = None,
+    cursor: str | None = None,
+    include_total: bool | None = None,
 ) -> JobListResponse:
     filters = []
     if recruiter_id:
@@ -186,9 +210,9 @@ async def _list_jobs_internal(
 
     if location:
         filters.append(func.lower(Job.location).contains(location.strip().lower()))
-    if skill:
-        # JSONB text search fallback to keep implementation simple.
-        filters.append(cast(Job.skills, String).ilike(f"%{skill.strip()}%"))
+    skill_terms = normalize_skill_terms(skill)
+    if skill_terms:
+        filters.append(skill_filter(Job.skills_normalized, skill_terms, skill_match))
     if q:
         needle = f"%{q.strip()}%"
         filters.append(
@@ -205,24 +229,29 @@ async def _list_jobs_internal(
         for condition in filters:
             base = base.where(condition)
 
-    total_stmt = select(func.count()).select_from(base.subquery())
-    total = int((await db.scalar(total_stmt)) or 0)
-
-    offset = (page - 1) * size
-    rows = (
-        await db.execute(
-            base.join(User, User.id == Job.recruiter_id)
-            .add_columns(User.name, User.username)
-            .order_by(Job.created_at.desc())
-            .offset(offset)
-            .limit(size)
-        )
-    ).all()
+    total = None
+    if wants_total(cursor, include_total):
+        total = int((await db.scalar(select(func.count()).select_from(base.subquery()))) or 0)
+
+    stmt = keyset_order(
+        base.join(User, User.id == Job.recruiter_id).add_columns(User.name, User.username),
+        Job.created_at,
+        Job.id,
+        cursor,
+    )
+    if not cursor:
+        stmt = stmt.offset((page - 1) * size)
+    rows, cursor_out = next_cursor(
+        (await db.execute(stmt.limit(size + 1))).all(),
+        size,
+        lambda row: (row[0].created_at, row[0].id),
+    )
 
     return JobListResponse(
         page=page,
         size=size,
         total=total,
+        next_cursor=cursor_out,
         items=[
             JobResponse(
                 id=job.id,
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+import zlib
+from collections import Counter
+
+from app.services.similarity_service import normalize_rows
+
+_NUMPY = None
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+_SIGN_SEED = 0x9E3779B9
+_BIGRAM_WEIGHT = 0.5
+# Batches above this size are hashed off the event loop.
+_THREAD_THRESHOLD = 32
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or our the this to was we were will with you your".split()
+)
+
+
+def _get_numpy():
+    global _NUMPY
+    if _NUMPY is None:
+        import numpy as np
+
+        _NUMPY = np
+    return _NUMPY
+
+
+def _tokenize(text: str) -> list[str]:
+    tokens = (token.rstrip(".") for token in _TOKEN_PATTERN.findall(text.lower()))
+    return [token for token in tokens if token and token not in _STOPWORDS]
+
+
+class HashingEmbeddingProvider:
+    name = "local"
+    # Hashing is cheaper than a cache lookup, so results are not cached.
+    cacheable = False
+
+    def __init__(self, dimensions: int) -> None:
+        self.dimensions = dimensions
+
+    def embed_sync(self, texts: list[str]):
+        np = _get_numpy()
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = _tokenize(text)
+            features = Counter(tokens)
+            for left, right in zip(tokens, tokens[1:]):
+                features[f"{left} {right}"] += _BIGRAM_WEIGHT
+            if not features:
+                continue
+
+            buckets = np.empty(len(features), dtype=np.int64)
+            weights = np.empty(len(features), dtype=np.float32)
+            for idx, (feature, count) in enumerate(features.items()):
+                encoded = feature.encode("utf-8")
+                buckets[idx] = zlib.crc32(encoded) % self.dimensions
+                # Sublinear term frequency; a second hash picks the sign so collisions cancel out on average.
+                weight = 1.0 + math.log(count) if count >= 1 else count
+                weights[idx] = weight if zlib.crc32(encoded, _SIGN_SEED) & 1 else -weight
+            matrix[row] = np.bincount(buckets, weights=weights, minlength=self.dimensions)
+        return normalize_rows(matrix)
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        if len(texts) > _THREAD_THRESHOLD:
+            return (await asyncio.to_thread(self.embed_sync, texts)).tolist()
+        return self.embed_sync(texts).tolist()
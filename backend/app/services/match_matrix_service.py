@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import resource
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.job_embedding_model import JobEmbedding
+from app.models.job_match_model import JobMatchResult
+from app.models.resume_embedding_model import ResumeEmbedding
+from app.services.job_matching_service import MATCH_RESULT_DEPTH, upsert_match_rows
+from app.services.similarity_service import blocked_top_k, decode_vector, normalize_rows
+
+_NUMPY = None
+
+
+def _get_numpy():
+    global _NUMPY
+    if _NUMPY is None:
+        import numpy as np
+
+        _NUMPY = np
+    return _NUMPY
+
+
+async def precompute_match_matrix(db: AsyncSession) -> dict[str, str | int | float]:
+    settings = get_settings()
+    model_name = settings.embedding_model
+    started = time.perf_counter()
+    run_at = datetime.utcnow()
+
+    catalog_version, dimensions = (
+        await db.execute(
+            select(func.max(JobEmbedding.updated_at), func.max(JobEmbedding.dimensions)).where(
+                JobEmbedding.model_name == model_name
+            )
+        )
+    ).one()
+    if catalog_version is None:
+        return {"status": "skipped", "detail": "No job vectors for the current model"}
+
+    tracemalloc.start()
+    resumes = rows = 0
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            job_ids, job_matrix = await _spool_job_vectors(
+                db, model_name, dimensions, catalog_version, Path(tmp) / "jobs.npy"
+            )
+            if not job_ids:
+                return {"status": "skipped", "detail": "No job vectors for the current model"}
+
+            last_resume_id = ""
+            while True:
+                block = (
+                    await db.execute(
+                        select(ResumeEmbedding.resume_id, ResumeEmbedding.content_hash, ResumeEmbedding.vector)
+                        .where(
+                            ResumeEmbedding.model_name == model_name,
+                            ResumeEmbedding.dimensions == dimensions,
+                            ResumeEmbedding.resume_id > last_resume_id,
+                        )
+                        .order_by(ResumeEmbedding.resume_id)
+                        .limit(settings.match_matrix_resume_block_size)
+                    )
+                ).all()
+                if not block:
+                    break
+                last_resume_id = block[-1][0]
+
+                queries = normalize_rows([decode_vector(raw) for _, _, raw in block])
+                top_idx, top_scores = blocked_top_k(
+                    queries, job_matrix, MATCH_RESULT_DEPTH, settings.match_matrix_job_block_size
+                )
+                rows += await _write_block(db, block, job_ids, top_idx, top_scores, model_name, catalog_version, run_at)
+                resumes += len(block)
+                # Commit per block so the nightly run never holds one huge transaction.
+                await db.commit()
+        _, peak_traced = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "status": "completed",
+        "resumes": resumes,
+        "jobs": len(job_ids),
+        "rows": rows,
+        "seconds": round(elapsed, 2),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else 0.0,
+        "peak_traced_mb": round(peak_traced / 2**20, 1),
+        # ru_maxrss is reported in KiB on Linux.
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+async def _spool_job_vectors(
+    db: AsyncSession,
+    model_name: str,
+    dimensions: int,
+    catalog_version: datetime,
+    path: Path,
+):
+    # Job vectors go to a memory-mapped file so the catalog never has to fit in RAM.
+    np = _get_numpy()
+    settings = get_settings()
+    scope = (
+        JobEmbedding.model_name == model_name,
+        JobEmbedding.dimensions == dimensions,
+        JobEmbedding.updated_at <= catalog_version,
+    )
+    count = await db.scalar(select(func.count()).select_from(JobEmbedding).where(*scope))
+    matrix = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=(max(count, 1), dimensions))
+
+    job_ids: list[str] = []
+    result = await db.stream(
+        select(JobEmbedding.job_id, JobEmbedding.vector)
+        .where(*scope)
+        .execution_options(yield_per=settings.match_matrix_job_block_size)
+    )
+    async for partition in result.partitions():
+        partition = partition[: count - len(job_ids)]
+        if not partition:
+            break
+        matrix[len(job_ids) : len(job_ids) + len(partition)] = normalize_rows(
+            [decode_vector(raw) for _, raw in partition]
+        )
+        job_ids.extend(job_id for job_id, _ in partition)
+    await result.close()
+    matrix.flush()
+    return job_ids, matrix[: len(job_ids)]
+
+
+async def _write_block(
+    db: AsyncSession,
+    block,
+    job_ids: list[str],
+    top_idx,
+    top_scores,
+    model_name: str,
+    catalog_version: datetime,
+    run_at: datetime,
+) -> int:
+    rows = [
+        {
+            "id": str(uuid4()),
+            "resume_id": resume_id,
+            "job_id": job_ids[job_idx],
+            "similarity_score": float(score),
+            "rank": rank,
+            "model_name": model_name,
+            "resume_content_hash": content_hash,
+            "catalog_version": catalog_version,
+            "created_at": run_at,
+            "updated_at": run_at,
+        }
+        for (resume_id, content_hash, _), indices, scores in zip(block, top_idx.tolist(), top_scores.tolist(), strict=True)
+        for rank, (job_idx, score) in enumerate(zip(indices, scores, strict=True), start=1)
+    ]
+    await upsert_match_rows(db, rows)
+    # Rows this run did not rewrite have dropped out of the resume's top list.
+    await db.execute(
+        delete(JobMatchResult).where(
+            JobMatchResult.resume_id.in_([resume_id for resume_id, _, _ in block]),
+            JobMatchResult.updated_at < run_at,
+        )
+    )
+    return len(rows)
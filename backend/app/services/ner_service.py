@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Protocol
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_NUMPY = None
+
+
+def _get_numpy():
+    global _NUMPY
+    if _NUMPY is None:
+        import numpy as np
+
+        _NUMPY = np
+    return _NUMPY
+
+
+class NERBackend(Protocol):
+    name: str
+
+    # None marks a text the backend could not process; callers fall back to heuristics for it.
+    def extract_batch(self, texts: list[str]) -> list[list[dict] | None]: ...
+
+
+class RemoteNERBackend:
+    name = "huggingface"
+
+    def __init__(
+        self, token: str, model: str, window_chars: int, overlap_chars: int, timeout: float, concurrency: int
+    ) -> None:
+        from huggingface_hub import InferenceClient
+
+        # One client per process so its HTTP session is reused across resumes.
+        self.client = InferenceClient(token=token, timeout=timeout)
+        self.model = model
+        self.window_chars = window_chars
+        self.overlap_chars = overlap_chars
+        self.concurrency = concurrency
+
+    def extract_batch(self, texts: list[str]) -> list[list[dict] | None]:
+        # Every window of every text in the batch is one HTTP call; they run concurrently
+        # so a long resume costs roughly one round trip instead of one per window.
+        windows = [
+            (text_idx, offset, window)
+            for text_idx, text in enumerate(texts)
+            for offset, window in _char_windows(text, self.window_chars, self.overlap_chars)
+        ]
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(windows) or 1)) as executor:
+            outcomes = list(executor.map(self._classify, windows))
+
+        entities: list[list[dict] | None] = [[] for _ in texts]
+        for (text_idx, _, _), outcome in zip(windows, outcomes, strict=True):
+            if outcome is None:
+                entities[text_idx] = None
+            elif entities[text_idx] is not None:
+                entities[text_idx].extend(outcome)
+        return [None if items is None else _merge_overlapping(items) for items in entities]
+
+    def _classify(self, window: tuple[int, int, str]) -> list[dict] | None:
+        text_idx, offset, text = window
+        try:
+            items = self.client.token_classification(text=text, model=self.model)
+        except Exception:
+            logger.warning("Remote NER failed for text %d at offset %d", text_idx, offset, exc_info=True)
+            return None
+        entities = []
+        for item in items:
+            start, end = getattr(item, "start", None), getattr(item, "end", None)
+            entities.append(
+                {
+                    "label": getattr(item, "entity_group", None) or getattr(item, "entity", ""),
+                    "word": getattr(item, "word", ""),
+                    "score": float(getattr(item, "score", 0.0)),
+                    "start": offset + start if start is not None else None,
+                    "end": offset + end if end is not None else None,
+                }
+            )
+        return entities
+
+
+class OnnxNERBackend:
+    name = "onnx"
+
+    def __init__(self, model_path: str, max_tokens: int, stride_tokens: int, batch_size: int, num_threads: int) -> None:
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as exc:
+            raise RuntimeError("NER_BACKEND=onnx requires the onnxruntime and tokenizers packages") from exc
+
+        # Expects the layout of a Hugging Face token-classification export:
+        # model.onnx, tokenizer.json and config.json (for id2label).
+        path = Path(model_path)
+        self.tokenizer = Tokenizer.from_file(str(path / "tokenizer.json"))
+        self.tokenizer.no_truncation()
+        self.tokenizer.no_padding()
+        config = json.loads((path / "config.json").read_text(encoding="utf-8"))
+        self.labels = {int(idx): label for idx, label in config["id2label"].items()}
+
+        options = ort.SessionOptions()
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(str(path / "model.onnx"), options, providers=["CPUExecutionProvider"])
+        self.input_names = {item.name for item in self.session.get_inputs()}
+        self.cls_id = _special_token_id(self.tokenizer, "[CLS]", "<s>")
+        self.sep_id = _special_token_id(self.tokenizer, "[SEP]", "</s>")
+        self.pad_id = _special_token_id(self.tokenizer, "[PAD]", "<pad>", default=0)
+        self.window = max_tokens - 2
+        self.stride = stride_tokens
+        self.batch_size = batch_size
+
+    def extract_batch(self, texts: list[str]) -> list[list[dict] | None]:
+        np = _get_numpy()
+        # A text that fails to tokenize, run or decode gets None; the rest of the batch is unaffected.
+        encodings = self._encode(texts)
+        failed = {text_idx for text_idx, encoding in enumerate(encodings) if encoding is None}
+        windows = [
+            (text_idx, start, encoding.ids[start : start + self.window])
+            for text_idx, encoding in enumerate(encodings)
+            if encoding is not None
+            for start in _token_windows(len(encoding.ids), self.window, self.stride)
+        ]
+        # Per token: predicted label, its probability, and how far the deciding window's
+        # edge was. Overlapping windows resolve each token from the window where it sits
+        # most centrally, so no prediction is made from a truncated context.
+        best = {
+            text_idx: (
+                np.zeros(len(enc.ids), dtype=np.int64),
+                np.zeros(len(enc.ids), dtype=np.float32),
+                np.full(len(enc.ids), -1, dtype=np.int64),
+            )
+            for text_idx, enc in enumerate(encodings)
+            if enc is not None
+        }
+
+        # Windows from every resume in the batch share forward passes; sorting by length keeps padding small.
+        order = sorted(range(len(windows)), key=lambda idx: len(windows[idx][2]))
+        for chunk_start in range(0, len(order), self.batch_size):
+            chunk = order[chunk_start : chunk_start + self.batch_size]
+            try:
+                runs = [(chunk, self._forward([windows[idx][2] for idx in chunk]))]
+            except Exception:
+                # Rerun the chunk one window at a time so only the texts that really fail are dropped.
+                runs = []
+                for idx in chunk:
+                    try:
+                        runs.append(([idx], self._forward([windows[idx][2]])))
+                    except Exception:
+                        logger.warning("ONNX NER failed for text %d", windows[idx][0], exc_info=True)
+                        failed.add(windows[idx][0])
+            for run, probs in runs:
+                for row, idx in enumerate(run):
+                    text_idx, start, ids = windows[idx]
+                    token_probs = probs[row, 1 : len(ids) + 1]
+                    positions = np.arange(start, start + len(ids))
+                    margins = np.minimum(positions - start, start + len(ids) - 1 - positions)
+                    labels, scores, best_margins = best[text_idx]
+                    take = margins > best_margins[positions]
+                    labels[positions[take]] = token_probs.argmax(axis=-1)[take]
+                    scores[positions[take]] = token_probs.max(axis=-1)[take]
+                    best_margins[positions[take]] = margins[take]
+
+        results: list[list[dict] | None] = []
+        for text_idx, (text, encoding) in enumerate(zip(texts, encodings, strict=True)):
+            if text_idx in failed:
+                results.append(None)
+                continue
+            try:
+                results.append(self._decode(text, encoding.offsets, *best[text_idx][:2]))
+            except Exception:
+                logger.warning("ONNX NER could not decode text %d", text_idx, exc_info=True)
+                results.append(None)
+        return results
+
+    def _encode(self, texts: list[str]) -> list:
+        try:
+            return self.tokenizer.encode_batch(texts, add_special_tokens=False)
+        except Exception:
+            pass
+        encodings = []
+        for text_idx, text in enumerate(texts):
+            try:
+                encodings.append(self.tokenizer.encode(text, add_special_tokens=False))
+            except Exception:
+                logger.warning("ONNX NER could not tokenize text %d", text_idx, exc_info=True)
+                encodings.append(None)
+        return encodings
+
+    def _forward(self, batch: list[list[int]]):
+        np = _get_numpy()
+        length = max(len(ids) for ids in batch) + 2
+        input_ids = np.full((len(batch), length), self.pad_id, dtype=np.int64)
+        attention_mask = np.zeros((len(batch), length), dtype=np.int64)
+        for row, ids in enumerate(batch):
+            input_ids[row, : len(ids) + 2] = [self.cls_id, *ids, self.sep_id]
+            attention_mask[row, : len(ids) + 2] = 1
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+        logits = self.session.run(None, feeds)[0]
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=-1, keepdims=True)
+
+    def _decode(self, text: str, offsets: list[tuple[int, int]], labels, scores) -> list[dict]:
+        entities: list[dict] = []
+        current: dict | None = None
+        for (start, end), label_id, score in zip(offsets, labels.tolist(), scores.tolist(), strict=True):
+            label = self.labels.get(label_id, "O")
+            if label == "O":
+                current = None
+                continue
+            prefix, _, kind = label.rpartition("-")
+            kind = kind or label
+            # Subword pieces glued to the previous token extend it even when tagged B-.
+            continues = current is not None and current["label"] == kind and (prefix != "B" or start == current["end"])
+            if continues:
+                current["end"] = end
+                current["_scores"].append(score)
+            else:
+                current = {"label": kind, "start": start, "end": end, "_scores": [score]}
+                entities.append(current)
+        for entity in entities:
+            entity_scores = entity.pop("_scores")
+            entity["word"] = text[entity["start"] : entity["end"]]
+            entity["score"] = float(sum(entity_scores) / len(entity_scores))
+        return entities
+
+
+def _special_token_id(tokenizer, *tokens: str, default: int | None = None) -> int:
+    for token in tokens:
+        token_id = tokenizer.token_to_id(token)
+        if token_id is not None:
+            return token_id
+    if default is None:
+        raise RuntimeError(f"NER tokenizer defines none of {tokens}")
+    return default
+
+
+def _token_windows(length: int, window: int, stride: int) -> list[int]:
+    if length <= window:
+        return [0] if length else []
+    starts = list(range(0, length - window + 1, window - stride))
+    if starts[-1] + window < length:
+        starts.append(length - window)
+    return starts
+
+
+def _char_windows(text: str, window: int, overlap: int) -> list[tuple[int, str]]:
+    if len(text) <= window:
+        return [(0, text)]
+    return [(start, text[start : start + window]) for start in range(0, len(text) - overlap, window - overlap)]
+
+
+def _merge_overlapping(entities: list[dict]) -> list[dict]:
+    # The same entity seen in two overlapping windows is kept once, preferring the higher score.
+    kept: list[dict] = []
+    seen_words: set[tuple[str, str]] = set()
+    for entity in sorted(entities, key=lambda item: -item["score"]):
+        if entity["start"] is None:
+            key = (entity["label"], entity["word"].lower())
+            if key not in seen_words:
+                seen_words.add(key)
+                kept.append(entity)
+            continue
+        if not any(
+            other["start"] is not None and other["start"] < entity["end"] and entity["start"] < other["end"]
+            for other in kept
+        ):
+            kept.append(entity)
+    return sorted(kept, key=lambda item: item["start"] if item["start"] is not None else -1)
+
+
+_backend: NERBackend | None = None
+_backend_loaded = False
+
+
+def get_ner_backend() -> NERBackend | None:
+    # Loaded once per process (web parse-pool worker or Celery worker) and reused for every resume.
+    global _backend, _backend_loaded
+    if not _backend_loaded:
+        # Set before loading: a backend that fails to load (missing package or model
+        # files) is not retried on every parse; resumes fall back to heuristics.
+        _backend_loaded = True
+        settings = get_settings()
+        try:
+            if settings.ner_backend == "onnx":
+                _backend = OnnxNERBackend(
+                    settings.ner_model_path,
+                    settings.ner_max_tokens,
+                    settings.ner_stride_tokens,
+                    settings.ner_batch_size,
+                    settings.ner_num_threads,
+                )
+            elif settings.ner_backend == "huggingface":
+                if not settings.ai_api_key:
+                    logger.warning("NER_BACKEND=huggingface without AI_API_KEY; resumes are parsed heuristically")
+                else:
+                    _backend = RemoteNERBackend(
+                        settings.ai_api_key,
+                        settings.ner_model,
+                        settings.ner_remote_window_chars,
+                        settings.ner_remote_overlap_chars,
+                        settings.ner_timeout_seconds,
+                        settings.ner_remote_concurrency,
+                    )
+        except Exception:
+            logger.exception("Could not load NER backend %r; resumes are parsed heuristically", settings.ner_backend)
+            _backend = None
+    return _backend
+
+
+def extract_entities_batch(texts: list[str]) -> list[tuple[list[dict], str]]:
+    backend = get_ner_backend()
+    if backend is None or not texts:
+        return [([], "heuristic") for _ in texts]
+    try:
+        results = backend.extract_batch(texts)
+    except Exception:
+        logger.exception("NER backend %s failed for a batch of %d texts", backend.name, len(texts))
+        results = [None] * len(texts)
+    # parser_source records "heuristic" for every text that fell back, so fallbacks are countable per resume.
+    return [([], "heuristic") if entities is None else (entities, backend.name) for entities in results]
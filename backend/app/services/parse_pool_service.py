@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import signal
+from collections.abc import Coroutine
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from app.core.config import get_settings
+from app.services.resume_parser_service import disable_page_fan_out, parse_resume_file, shutdown_page_pool
+
+_POOL: ProcessPoolExecutor | None = None
+_SLOTS: asyncio.Semaphore | None = None
+_BACKGROUND: set[asyncio.Task] = set()
+_METRICS = {
+    "in_flight": 0,
+    "submitted": 0,
+    "completed": 0,
+    "failed": 0,
+    "timeouts": 0,
+    "rejected": 0,
+    "recycled": 0,
+}
+# Extra time a worker gets, after its own deadline, before the pool is recycled.
+_STUCK_GRACE_SECONDS = 5.0
+
+
+class ParsePoolSaturated(Exception):
+    pass
+
+
+def _parse_with_deadline(file_path: str, timeout: float) -> dict:
+    # Runs in the worker. The alarm interrupts a parse stuck in Python code (pypdf is
+    # pure Python), so the worker and its queue slot are freed instead of hanging.
+    def expire(signum, frame):
+        raise TimeoutError(f"Resume parsing exceeded {timeout:g}s")
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return parse_resume_file(file_path)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _create_pool() -> ProcessPoolExecutor:
+    # spawn keeps workers free of the event loop, DB pool and HTTP client state that fork would copy.
+    return ProcessPoolExecutor(
+        max_workers=max(1, get_settings().resume_parse_workers),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=disable_page_fan_out,
+    )
+
+
+def start_parse_pool() -> None:
+    global _POOL, _SLOTS
+    if _POOL is None:
+        _POOL = _create_pool()
+        _SLOTS = asyncio.Semaphore(max(1, get_settings().resume_parse_max_pending))
+
+
+async def shutdown_parse_pool() -> None:
+    global _POOL, _SLOTS
+    for task in list(_BACKGROUND):
+        task.cancel()
+    if _BACKGROUND:
+        await asyncio.gather(*_BACKGROUND, return_exceptions=True)
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
+    _POOL = None
+    _SLOTS = None
+    shutdown_page_pool()
+
+
+async def parse_resume_off_loop(file_path: str, wait: bool = False) -> dict:
+    # Outside the app lifespan (scripts, Celery) there is no pool; a thread still keeps the loop free.
+    timeout = get_settings().resume_parse_timeout_seconds
+    if _POOL is None or _SLOTS is None:
+        return await asyncio.wait_for(asyncio.to_thread(parse_resume_file, file_path), timeout)
+
+    if _SLOTS.locked() and not wait:
+        _METRICS["rejected"] += 1
+        raise ParsePoolSaturated
+    await _SLOTS.acquire()
+    _METRICS["in_flight"] += 1
+
+    pool = _POOL
+    try:
+        future = pool.submit(_parse_with_deadline, file_path, timeout)
+    except BaseException as exc:
+        _release_slot(_SLOTS)
+        if isinstance(exc, BrokenProcessPool):
+            _reset_pool(pool)
+        raise
+    _METRICS["submitted"] += 1
+    # The slot is held until the worker really finishes, not until the caller gives up,
+    # so timed-out jobs still count against the queue depth.
+    loop = asyncio.get_running_loop()
+    slots = _SLOTS
+    future.add_done_callback(lambda _: _release_threadsafe(loop, slots))
+
+    try:
+        parsed = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+    except TimeoutError:
+        _METRICS["timeouts"] += 1
+        _watch_stuck(loop, pool, future, timeout)
+        raise
+    except BrokenProcessPool:
+        _METRICS["failed"] += 1
+        _reset_pool(pool)
+        raise
+    except Exception:
+        _METRICS["failed"] += 1
+        raise
+    _METRICS["completed"] += 1
+    return parsed
+
+
+def _release_slot(slots: asyncio.Semaphore) -> None:
+    _METRICS["in_flight"] -= 1
+    slots.release()
+
+
+def _release_threadsafe(loop: asyncio.AbstractEventLoop, slots: asyncio.Semaphore) -> None:
+    try:
+        loop.call_soon_threadsafe(_release_slot, slots)
+    except RuntimeError:
+        pass
+
+
+def _watch_stuck(loop: asyncio.AbstractEventLoop, pool: ProcessPoolExecutor, future, timeout: float) -> None:
+    # A job still queued is dropped. One already handed to a worker finishes or hits
+    # its own alarm within another timeout; if it has not by then, the worker is
+    # blocked in native code and only killing it gets the slot back.
+    if future.cancel():
+        return
+    loop.call_later(timeout + _STUCK_GRACE_SECONDS, _recycle_if_stuck, pool, future)
+
+
+def _recycle_if_stuck(pool: ProcessPoolExecutor, future) -> None:
+    if future.done():
+        return
+    _METRICS["recycled"] += 1
+    # Killing the workers breaks the executor, which fails every outstanding future
+    # and so releases their slots. terminate_workers is public from Python 3.14.
+    terminate = getattr(pool, "terminate_workers", None)
+    if terminate is not None:
+        terminate()
+    else:
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+    _reset_pool(pool)
+
+
+def _reset_pool(pool: ProcessPoolExecutor) -> None:
+    # A worker that died (OOM, segfault in a native parser) breaks the whole executor.
+    # Only the pool that broke is replaced; callers failing on it later leave its successor alone.
+    global _POOL
+    pool.shutdown(wait=False, cancel_futures=True)
+    if _POOL is pool:
+        _POOL = _create_pool()
+
+
+def spawn_background(coro: Coroutine) -> None:
+    task = asyncio.create_task(coro)
+    _BACKGROUND.add(task)
+    task.add_done_callback(_BACKGROUND.discard)
+
+
+def get_parse_pool_metrics() -> dict[str, int | bool]:
+    return {"running": _POOL is not None, "background": len(_BACKGROUND), **_METRICS}
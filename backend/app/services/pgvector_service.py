@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+
+_TABLES = {
+    "jobs": ("job_embeddings", "job_id"),
+    "resumes": ("resume_embeddings", "resume_id"),
+}
+# An HNSW scan returns at most ef_search rows, so results past this rank are
+# unreachable; callers clamp totals and page depth to it.
+MAX_SEARCH_DEPTH = 1000
+
+_dimensions: int | None = None
+_checked = False
+
+
+async def vector_column_dimensions(db: AsyncSession) -> int | None:
+    global _dimensions, _checked
+    if not _checked:
+        # The column only exists when the migration found the extension installed;
+        # atttypmod of a vector(n) column is n.
+        dimensions = await db.scalar(
+            text(
+                "SELECT atttypmod FROM pg_attribute "
+                "WHERE attrelid = to_regclass('job_embeddings') AND attname = 'embedding' AND NOT attisdropped"
+            )
+        )
+        _dimensions = dimensions if dimensions and dimensions > 0 else None
+        _checked = True
+    return _dimensions
+
+
+async def pgvector_ready(db: AsyncSession) -> bool:
+    if get_settings().vector_backend != "pgvector":
+        return False
+    return await vector_column_dimensions(db) is not None
+
+
+def to_vector_literal(vector: Sequence[float]) -> str:
+    return "[" + ",".join(f"{float(value):.7g}" for value in vector) + "]"
+
+
+async def store_vectors(
+    kind: str,
+    db: AsyncSession,
+    model_name: str,
+    entries: Sequence[tuple[str, Sequence[float]]],
+) -> None:
+    # Written whenever the column exists, whatever VECTOR_BACKEND is, so switching
+    # backends never finds the column missing vectors the bytea column has.
+    dimensions = await vector_column_dimensions(db)
+    if dimensions is None:
+        return
+    params = [
+        {"item_id": item_id, "model_name": model_name, "embedding": to_vector_literal(vector)}
+        for item_id, vector in entries
+        if len(vector) == dimensions
+    ]
+    if not params:
+        return
+
+    table, id_column = _TABLES[kind]
+    await db.execute(
+        text(
+            f"UPDATE {table} SET embedding = CAST(:embedding AS vector) "
+            f"WHERE {id_column} = :item_id AND model_name = :model_name"
+        ),
+        params,
+    )
+
+
+def supports_query(query_vector: Sequence[float]) -> bool:
+    return len(query_vector) == _dimensions
+
+
+async def vector_stats(kind: str, db: AsyncSession) -> tuple[int, datetime | None]:
+    table, _ = _TABLES[kind]
+    count, latest = (
+        await db.execute(
+            text(
+                f"SELECT count(*), max(updated_at) FROM {table} "
+                "WHERE model_name = :model_name AND embedding IS NOT NULL"
+            ),
+            {"model_name": get_settings().embedding_model},
+        )
+    ).one()
+    return int(count or 0), latest
+
+
+async def nearest_vectors(
+    kind: str,
+    db: AsyncSession,
+    query_vector: Sequence[float],
+    limit: int,
+    offset: int = 0,
+) -> list[tuple[str, float]]:
+    settings = get_settings()
+    table, id_column = _TABLES[kind]
+
+    limit = min(limit, MAX_SEARCH_DEPTH - offset)
+    if limit <= 0:
+        return []
+
+    # The model filter is applied after the index scan, so widen the scan to
+    # cover the requested window.
+    ef_search = max(offset + limit, 40)
+    await db.execute(text("SELECT set_config('hnsw.ef_search', :value, true)"), {"value": str(ef_search)})
+
+    rows = await db.execute(
+        text(
+            f"SELECT {id_column}, 1 - (embedding <=> CAST(:query AS vector)) AS score "
+            f"FROM {table} "
+            "WHERE model_name = :model_name AND embedding IS NOT NULL "
+            "ORDER BY embedding <=> CAST(:query AS vector) "
+            "LIMIT :limit OFFSET :offset"
+        ),
+        {
+            "query": to_vector_literal(query_vector),
+            "model_name": settings.embedding_model,
+            "limit": limit,
+            "offset": offset,
+        },
+    )
+    return [(item_id, float(score)) for item_id, score in rows.all()]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import and_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.resume_embedding_model import ResumeEmbedding
+from app.models.resume_parse_model import ResumeParseResult
+from app.services.ann_index_service import index_remove, index_upsert
+from app.services.embedding_service import generate_embeddings
+from app.services.pgvector_service import store_vectors
+from app.services.similarity_service import encode_vector
+
+_BACKFILL_BATCH_SIZE = 256
+_last_backfill_at = 0.0
+
+
+def build_resume_text(parsed: ResumeParseResult) -> str:
+    skills = ", ".join(parsed.skills or [])
+    experience = "; ".join(parsed.experience or [])
+    education = "; ".join(parsed.education or [])
+    return f"Skills: {skills}\nExperience: {experience}\nEducation: {education}"
+
+
+def resume_content_hash(parsed: ResumeParseResult) -> str:
+    return hashlib.sha256(build_resume_text(parsed).encode("utf-8")).hexdigest()
+
+
+async def refresh_resume_embedding(parsed: ResumeParseResult, db: AsyncSession) -> None:
+    model_name = get_settings().embedding_model
+    content_hash = resume_content_hash(parsed)
+
+    existing = await db.scalar(
+        select(ResumeEmbedding).where(
+            ResumeEmbedding.resume_id == parsed.resume_id,
+            ResumeEmbedding.model_name == model_name,
+        )
+    )
+    if existing and existing.content_hash == content_hash:
+        return
+
+    try:
+        vectors = await generate_embeddings([build_resume_text(parsed)])
+    except HTTPException:
+        # Drop the stale vector; backfill_resume_embeddings rebuilds it later.
+        if existing:
+            await db.delete(existing)
+            await db.flush()
+            index_remove(db, "resumes", [parsed.resume_id])
+        return
+
+    await _upsert_embeddings(db, model_name, [(parsed.resume_id, content_hash, vectors[0])])
+
+
+async def backfill_resume_embeddings(db: AsyncSession) -> None:
+    global _last_backfill_at
+    settings = get_settings()
+    if time.monotonic() - _last_backfill_at < settings.vector_index_sync_seconds:
+        return
+    _last_backfill_at = time.monotonic()
+
+    missing = (
+        await db.scalars(
+            select(ResumeParseResult)
+            .outerjoin(
+                ResumeEmbedding,
+                and_(
+                    ResumeEmbedding.resume_id == ResumeParseResult.resume_id,
+                    ResumeEmbedding.model_name == settings.embedding_model,
+                ),
+            )
+            .where(ResumeEmbedding.id.is_(None))
+            .limit(_BACKFILL_BATCH_SIZE)
+        )
+    ).all()
+    if not missing:
+        return
+
+    try:
+        vectors = await generate_embeddings([build_resume_text(parsed) for parsed in missing])
+    except HTTPException:
+        return
+
+    await _upsert_embeddings(
+        db,
+        settings.embedding_model,
+        [
+            (parsed.resume_id, resume_content_hash(parsed), vector)
+            for parsed, vector in zip(missing, vectors, strict=True)
+        ],
+    )
+
+
+async def _upsert_embeddings(
+    db: AsyncSession,
+    model_name: str,
+    entries: list[tuple[str, str, list[float]]],
+) -> None:
+    now = datetime.utcnow()
+    values = [
+        {
+            "id": str(uuid4()),
+            "resume_id": resume_id,
+            "model_name": model_name,
+            "content_hash": content_hash,
+            "dimensions": len(vector),
+            "vector": encode_vector(vector),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for resume_id, content_hash, vector in entries
+    ]
+    stmt = pg_insert(ResumeEmbedding).values(values)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_resume_embeddings_resume_model",
+        set_={
+            "content_hash": stmt.excluded.content_hash,
+            "dimensions": stmt.excluded.dimensions,
+            "vector": stmt.excluded.vector,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await db.execute(stmt)
+    await store_vectors("resumes", db, model_name, [(entry[0], entry[2]) for entry in entries])
+    index_upsert(db, "resumes", [entry[0] for entry in entries], [entry[2] for entry in entries])
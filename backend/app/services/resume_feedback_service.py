@@ -10,7 +10,8 @@ from app.models.resume_model import Resume
 from app.models.resume_parse_model import ResumeParseResult
 from app.models.user_model import User
 from app.schemas.resume_feedback_schema import ResumeFeedbackResponse
-from app.services.resume_parser_service import parse_resume_file
+from app.services.parse_pool_service import ParsePoolSaturated, parse_resume_off_loop
+from app.services.resume_service import ResumeParsePending, defer_resume_parse
 
 settings = get_settings()
 
@@ -73,7 +74,12 @@ async def _parse_resume_on_demand(resume: Resume, db: AsyncSession) -> ResumePar
         return existing
 
     try:
-        parsed_payload = parse_resume_file(resume.file_path)
+        parsed_payload = await parse_resume_off_loop(resume.file_path)
+    except ParsePoolSaturated:
+        defer_resume_parse(resume, db)
+        raise ResumeParsePending(resume) from None
+    except TimeoutError:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail="Resume parsing timed out")
     except Exception:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to parse resume")
 
@@ -1,36 +1,23 @@
 from __future__ import annotations
 
+import multiprocessing
 import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 
 from app.core.config import get_settings
+from app.services.experience_pattern_service import extract_experience_spans
+from app.services.ner_service import extract_entities_batch
+from app.services.skill_taxonomy_service import load_skill_matcher
 
 settings = get_settings()
+_PAGE_POOL: ProcessPoolExecutor | None = None
+_fan_out_allowed = True
 
-KNOWN_SKILLS = {
-    "python",
-    "java",
-    "javascript",
-    "typescript",
-    "sql",
-    "postgresql",
-    "mysql",
-    "fastapi",
-    "django",
-    "flask",
-    "react",
-    "node",
-    "docker",
-    "kubernetes",
-    "aws",
-    "git",
-    "linux",
-    "pandas",
-    "numpy",
-    "tensorflow",
-    "pytorch",
-    "scikit-learn",
-}
+# Built once per process: one trie-compiled regex over every skill name and alias.
+SKILL_MATCHER = load_skill_matcher(settings.skills_taxonomy_path)
 
 EDUCATION_KEYWORDS = (
     "bachelor",
@@ -43,42 +30,49 @@ EDUCATION_KEYWORDS = (
     "degree",
 )
 
-EXPERIENCE_PATTERNS = (
-    r"\\b\\d+\\+?\\s+years?\\b",
-    r"\\b\\d+\\s+yrs?\\b",
-    r"\\bsoftware engineer\\b",
-    r"\\bbackend developer\\b",
-    r"\\bfrontend developer\\b",
-    r"\\bdata scientist\\b",
+# Bounded on both sides so "mastery" or "bachelorette" do not count; a trailing "s" covers plurals.
+EDUCATION_PATTERN = re.compile(
+    r"(?<![\w.])(?:" + "|".join(re.escape(keyword) for keyword in EDUCATION_KEYWORDS) + r")s?\b"
 )
 
 
 def parse_resume_file(file_path: str) -> dict:
-    text = _extract_text(file_path)
-    if not text.strip():
-        return {
-            "skills": [],
-            "experience": [],
-            "education": [],
-            "entities": [],
-            "parser_source": "empty",
-        }
-
-    entities, parser_source = _extract_entities_with_hf(text)
-    skills = _extract_skills(text)
-    education = _extract_education(text)
-    experience = _extract_experience(text)
-
-    return {
-        "skills": skills,
-        "experience": experience,
-        "education": education,
-        "entities": entities,
-        "parser_source": parser_source,
-    }
-
-
-def _extract_text(file_path: str) -> str:
+    return parse_resume_texts([extract_resume_text(file_path)])[0]
+
+
+def parse_resume_texts(texts: list[str]) -> list[dict]:
+    # NER runs once over the whole batch so a local model can pack many resumes per forward pass.
+    nonempty = [idx for idx, text in enumerate(texts) if text.strip()]
+    ner_results = dict(zip(nonempty, extract_entities_batch([texts[idx] for idx in nonempty]), strict=True))
+
+    results: list[dict] = []
+    for idx, text in enumerate(texts):
+        if idx not in ner_results:
+            results.append(
+                {
+                    "skills": [],
+                    "experience": [],
+                    "education": [],
+                    "entities": [],
+                    "parser_source": "empty",
+                }
+            )
+            continue
+
+        entities, parser_source = ner_results[idx]
+        results.append(
+            {
+                "skills": _extract_skills(text),
+                "experience": _extract_experience(text),
+                "education": _extract_education(text),
+                "entities": entities,
+                "parser_source": parser_source,
+            }
+        )
+    return results
+
+
+def extract_resume_text(file_path: str) -> str:
     path = Path(file_path)
     suffix = path.suffix.lower()
 
@@ -96,68 +90,110 @@ def _extract_text(file_path: str) -> str:
 def _extract_text_from_pdf(path: Path) -> str:
     from pypdf import PdfReader
 
+    # PdfReader only reads the xref up front; each page is parsed when it is accessed.
     reader = PdfReader(str(path))
-    chunks: list[str] = []
-    for page in reader.pages:
-        chunks.append(page.extract_text() or "")
-    return "\n".join(chunks)
+    page_count = len(reader.pages)
+    budget = settings.resume_text_char_budget
+    if page_count >= settings.resume_pdf_parallel_min_pages and _can_fan_out():
+        return _join_within_budget(_iter_pdf_pages_parallel(path, page_count), budget)
+    return _join_within_budget(_iter_pdf_pages(reader, 0, page_count), budget)
 
 
-def _extract_text_from_docx(path: Path) -> str:
-    from docx import Document
+def _iter_pdf_pages(reader, start: int, stop: int) -> Iterator[str]:
+    for index in range(start, stop):
+        yield reader.pages[index].extract_text() or ""
 
-    doc = Document(str(path))
-    return "\n".join(paragraph.text for paragraph in doc.paragraphs)
+
+def _join_within_budget(pages: Iterable[str], budget: int) -> str:
+    # Stop pulling pages once the budget is met; the rest of a long PDF is never parsed.
+    chunks: list[str] = []
+    size = 0
+    for text in pages:
+        chunks.append(text)
+        size += len(text) + 1
+        if budget > 0 and size >= budget:
+            break
+    joined = "\n".join(chunks)
+    return joined[:budget] if budget > 0 else joined
+
+
+def disable_page_fan_out() -> None:
+    # Called in parse-pool workers: each would otherwise start its own page pool.
+    global _fan_out_allowed
+    _fan_out_allowed = False
+
+
+def shutdown_page_pool() -> None:
+    global _PAGE_POOL
+    if _PAGE_POOL is not None:
+        _PAGE_POOL.shutdown(wait=False, cancel_futures=True)
+        _PAGE_POOL = None
+
+
+def _can_fan_out() -> bool:
+    # Off by default: with the character budget, serial extraction stops early and
+    # beat the page pool in bench_pdf_extraction. Daemonic processes (e.g. Celery
+    # prefork children) may not start their own workers.
+    return (
+        _fan_out_allowed
+        and settings.resume_pdf_page_workers > 1
+        and not multiprocessing.current_process().daemon
+    )
+
+
+def _iter_pdf_pages_parallel(path: Path, page_count: int) -> Iterator[str]:
+    global _PAGE_POOL
+    if _PAGE_POOL is None:
+        _PAGE_POOL = ProcessPoolExecutor(
+            max_workers=settings.resume_pdf_page_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    step = max(1, settings.resume_pdf_pages_per_task)
+    starts = iter(range(0, page_count, step))
+    pending: deque[Future] = deque()
+
+    def submit_next() -> None:
+        start = next(starts, None)
+        if start is not None:
+            pending.append(_PAGE_POOL.submit(_extract_pdf_page_range, str(path), start, min(start + step, page_count)))
+
+    # Only one page range per worker is in flight, so hitting the budget stops the rest
+    # of the document from being parsed; results are consumed in page order.
+    for _ in range(settings.resume_pdf_page_workers):
+        submit_next()
+    try:
+        while pending:
+            pages = pending.popleft().result()
+            submit_next()
+            yield from pages
+    finally:
+        for future in pending:
+            future.cancel()
 
 
-def _extract_entities_with_hf(text: str) -> tuple[list[dict], str]:
-    hf_token = settings.ai_api_key
-    if not hf_token:
-        return [], "heuristic"
+def _extract_pdf_page_range(file_path: str, start: int, stop: int) -> list[str]:
+    from pypdf import PdfReader
 
-    try:
-        from huggingface_hub import InferenceClient
+    return list(_iter_pdf_pages(PdfReader(file_path), start, stop))
 
-        client = InferenceClient(token=hf_token)
-        # Limit size for remote inference latency/cost.
-        ner_result = client.token_classification(
-            text=text[:4000],
-            model="dslim/bert-base-NER",
-        )
 
-        entities: list[dict] = []
-        for item in ner_result:
-            entities.append(
-                {
-                    "label": getattr(item, "entity_group", None) or getattr(item, "entity", ""),
-                    "word": getattr(item, "word", ""),
-                    "score": float(getattr(item, "score", 0.0)),
-                }
-            )
+def _extract_text_from_docx(path: Path) -> str:
+    from docx import Document
 
-        return entities, "huggingface"
-    except Exception:
-        return [], "heuristic"
+    doc = Document(str(path))
+    return "\n".join(paragraph.text for paragraph in doc.paragraphs)
 
 
 def _extract_skills(text: str) -> list[str]:
-    text_lower = text.lower()
-    found = [skill for skill in KNOWN_SKILLS if skill in text_lower]
-    return sorted(set(found))
+    return SKILL_MATCHER.extract(text)
 
 
 def _extract_education(text: str) -> list[str]:
     lines = [line.strip() for line in text.splitlines() if line.strip()]
-    matches = [line for line in lines if any(keyword in line.lower() for keyword in EDUCATION_KEYWORDS)]
+    matches = [line for line in lines if EDUCATION_PATTERN.search(line.lower())]
     return matches[:10]
 
 
 def _extract_experience(text: str) -> list[str]:
-    text_lower = text.lower()
-    matches: list[str] = []
-
-    for pattern in EXPERIENCE_PATTERNS:
-        for found in re.findall(pattern, text_lower):
-            matches.append(found)
-
-    return sorted(set(matches))[:15]
+    matches = {" ".join(span.text.lower().split()) for span in extract_experience_spans(text)}
+    return sorted(matches)[:15]
@@ -2,19 +2,34 @@ from pathlib import Path
 from uuid import uuid4
 
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import select
+from fastapi.responses import JSONResponse
+from sqlalchemy import event, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
 from app.models.resume_model import Resume
 from app.models.resume_parse_model import ResumeParseResult
 from app.models.user_model import User
 from app.schemas.resume_parse_schema import ResumeParseResultResponse
-from app.schemas.resume_schema import ResumeUploadResponse
-from app.services.resume_parser_service import parse_resume_file
-from app.tasks import enqueue_resume_processing
+from app.schemas.resume_schema import ReparseStatus, ResumeUploadResponse
+from app.services.parse_pool_service import ParsePoolSaturated, parse_resume_off_loop, spawn_background
+from app.services.resume_embedding_service import refresh_resume_embedding
+from app.tasks import enqueue_resume_batch_processing, enqueue_resume_processing
 
 settings = get_settings()
+# Resumes per Celery batch task; their NER windows are packed into shared forward passes.
+_REPARSE_BATCH_SIZE = 32
+# Session.info key holding parses that start once the request's transaction commits.
+_DEFERRED_KEY = "deferred_resume_parses"
+
+
+class ResumeParsePending(Exception):
+    # Raised when an on-demand parse was deferred; routes answer with parse_pending_response.
+    def __init__(self, resume: Resume) -> None:
+        super().__init__(resume.id)
+        self.resume = resume
 
 
 async def upload_resume(file: UploadFile, current_user: User, db: AsyncSession) -> ResumeUploadResponse:
@@ -65,10 +80,64 @@ async def upload_resume(file: UploadFile, current_user: User, db: AsyncSession)
         resume.processing_task_id = task_id
     else:
         # Fallback path for environments without Celery/Redis.
-        await _parse_resume_now(resume, db)
+        try:
+            await _parse_resume_now(resume, db)
+        except ParsePoolSaturated:
+            defer_resume_parse(resume, db)
 
     await db.flush()
 
+    return _upload_response(resume)
+
+
+async def get_my_resume_status(
+    resume_id: str,
+    current_user: User,
+    db: AsyncSession,
+) -> ResumeUploadResponse:
+    resume = await db.scalar(select(Resume).where(Resume.id == resume_id, Resume.user_id == current_user.id))
+    if not resume:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
+    return _upload_response(resume)
+
+
+async def requeue_resume_parsing(
+    db: AsyncSession,
+    processing_status: ReparseStatus = "failed",
+    limit: int = 500,
+) -> dict:
+    resume_ids = list(
+        (
+            await db.scalars(
+                select(Resume.id)
+                .where(Resume.processing_status == processing_status)
+                .order_by(Resume.created_at)
+                .limit(limit)
+            )
+        ).all()
+    )
+    task_ids: list[str] = []
+    for start in range(0, len(resume_ids), _REPARSE_BATCH_SIZE):
+        batch = resume_ids[start : start + _REPARSE_BATCH_SIZE]
+        task_id = enqueue_resume_batch_processing(batch)
+        if not task_id:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Task queue is unavailable")
+        await db.execute(update(Resume).where(Resume.id.in_(batch)).values(processing_status="queued"))
+        # Commit per batch so resumes already handed to Celery stay marked if a later enqueue fails.
+        await db.commit()
+        task_ids.append(task_id)
+    return {"queued": len(resume_ids), "task_ids": task_ids}
+
+
+def parse_pending_response(resume: Resume) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=_upload_response(resume).model_dump(mode="json"),
+        headers={"Location": f"/resume/{resume.id}/status"},
+    )
+
+
+def _upload_response(resume: Resume) -> ResumeUploadResponse:
     return ResumeUploadResponse(
         id=resume.id,
         original_filename=resume.original_filename,
@@ -123,29 +192,62 @@ async def get_my_latest_resume(
     if not resume:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No resume uploaded")
 
-    return ResumeUploadResponse(
-        id=resume.id,
-        original_filename=resume.original_filename,
-        file_path=resume.file_path,
-        storage_backend=resume.storage_backend,
-        content_type=resume.content_type,
-        file_size=resume.file_size,
-        processing_status=resume.processing_status,
-        processing_task_id=resume.processing_task_id,
-    )
+    return _upload_response(resume)
 
 
 async def _parse_resume_now(resume: Resume, db: AsyncSession) -> None:
     try:
         resume.processing_status = "processing"
-        parsed = parse_resume_file(resume.file_path)
-        resume.processing_status = "parsed"
-        resume.processing_task_id = None
+        parsed = await parse_resume_off_loop(resume.file_path)
+    except ParsePoolSaturated:
+        raise
     except Exception:
         resume.processing_status = "failed"
         resume.processing_task_id = None
         return
+    await _store_parse_result(resume, parsed, db)
+
+
+def defer_resume_parse(resume: Resume, db: AsyncSession) -> None:
+    # The background parse uses its own session, so it only starts once the request's
+    # transaction commits and the resume row is visible; a rollback drops it.
+    resume.processing_status = "pending"
+    resume.processing_task_id = None
+    db.info.setdefault(_DEFERRED_KEY, []).append((resume.id, resume.file_path))
+
+
+@event.listens_for(Session, "after_commit")
+def _start_deferred_parses(session: Session) -> None:
+    for resume_id, file_path in session.info.pop(_DEFERRED_KEY, []):
+        spawn_background(_parse_resume_deferred(resume_id, file_path))
 
+
+@event.listens_for(Session, "after_rollback")
+def _drop_deferred_parses(session: Session) -> None:
+    session.info.pop(_DEFERRED_KEY, None)
+
+
+async def _parse_resume_deferred(resume_id: str, file_path: str) -> None:
+    # Waits for a pool slot without holding a database connection.
+    try:
+        parsed = await parse_resume_off_loop(file_path, wait=True)
+    except Exception:
+        parsed = None
+
+    async with AsyncSessionLocal() as db:
+        resume = await db.scalar(select(Resume).where(Resume.id == resume_id))
+        if not resume:
+            return
+        if parsed is None:
+            resume.processing_status = "failed"
+        else:
+            await _store_parse_result(resume, parsed, db)
+        await db.commit()
+
+
+async def _store_parse_result(resume: Resume, parsed: dict, db: AsyncSession) -> None:
+    resume.processing_status = "parsed"
+    resume.processing_task_id = None
     existing = await db.scalar(select(ResumeParseResult).where(ResumeParseResult.resume_id == resume.id))
     if existing:
         existing.skills = parsed["skills"]
@@ -153,10 +255,8 @@ async def _parse_resume_now(resume: Resume, db: AsyncSession) -> None:
         existing.education = parsed["education"]
         existing.entities = parsed["entities"]
         existing.parser_source = parsed["parser_source"]
-        return
-
-    db.add(
-        ResumeParseResult(
+    else:
+        existing = ResumeParseResult(
             resume_id=resume.id,
             skills=parsed["skills"],
             experience=parsed["experience"],
@@ -164,7 +264,10 @@ async def _parse_resume_now(resume: Resume, db: AsyncSession) -> None:
             entities=parsed["entities"],
             parser_source=parsed["parser_source"],
         )
-    )
+        db.add(existing)
+
+    await db.flush()
+    await refresh_resume_embedding(existing, db)
 
 
 def _store_locally(stored_filename: str, content: bytes) -> str:
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from app.core.config import get_settings
+from app.services.embedding_service import generate_embedding
+
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_query_vectors: TTLCache | None = None
+_ranked_results: TTLCache | None = None
+
+
+def _query_cache() -> TTLCache:
+    global _query_vectors
+    if _query_vectors is None:
+        settings = get_settings()
+        _query_vectors = TTLCache(settings.search_query_cache_ttl_seconds, settings.search_cache_max_entries)
+    return _query_vectors
+
+
+def _result_cache() -> TTLCache:
+    global _ranked_results
+    if _ranked_results is None:
+        settings = get_settings()
+        _ranked_results = TTLCache(settings.search_result_cache_ttl_seconds, settings.search_cache_max_entries)
+    return _ranked_results
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+async def embed_query(query: str) -> list[float]:
+    key = (get_settings().embedding_model, query)
+    vector = _query_cache().get(key)
+    if vector is None:
+        vector = await generate_embedding(query)
+        _query_cache().set(key, vector)
+    return vector
+
+
+def get_ranked_ids(key: Hashable) -> list[str] | None:
+    return _result_cache().get(key)
+
+
+def set_ranked_ids(key: Hashable, ranked_ids: list[str]) -> None:
+    _result_cache().set(key, ranked_ids)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from sqlalchemy import String, cast, func, select
+import asyncio
+import json
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, func, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.models.job_model import Job
 from app.models.resume_model import Resume
 from app.models.resume_parse_model import ResumeParseResult
@@ -12,26 +17,119 @@ from app.schemas.search_schema import (
     SearchResumeItem,
     SearchResumesResponse,
 )
-from app.services.embedding_service import generate_embeddings
+from app.services.ann_index_service import get_vector_index
+from app.services.pgvector_service import (
+    MAX_SEARCH_DEPTH,
+    nearest_vectors,
+    pgvector_ready,
+    supports_query,
+    vector_stats,
+)
+from app.services.search_cache_service import embed_query, get_ranked_ids, normalize_query, set_ranked_ids
+from app.services.skill_filter_service import SkillMatch, normalize_skill_terms, skill_filter
 
-_NUMPY = None
+_RRF_K = 60
 
 
-def _get_numpy():
-    global _NUMPY
-    if _NUMPY is None:
-        import numpy as np
+async def _semantic_page(
+    kind: str,
+    db: AsyncSession,
+    query: str,
+    page: int,
+    size: int,
+    filters: tuple = (),
+) -> tuple[int, list[str], bool]:
+    # Returns (total, page ids, total_is_capped). total is the real number of
+    # indexed items; neither backend ranks past MAX_SEARCH_DEPTH (the HNSW scan
+    # cannot return more, and it keeps the IVF search from growing with the page
+    # number), so when total exceeds it only the first MAX_SEARCH_DEPTH are pageable.
+    settings = get_settings()
+    query = normalize_query(query)
+    offset = (page - 1) * size
+    # Rank once to a fixed depth per (query, filters, index version) so later
+    # pages are slices of the cached list rather than new searches.
+    depth = min(max(settings.search_result_cache_depth, page * size), MAX_SEARCH_DEPTH)
 
-        _NUMPY = np
-    return _NUMPY
+    query_vector = None
+    if await pgvector_ready(db):
+        total, latest = await vector_stats(kind, db)
+        if not total:
+            return 0, [], False
+        capped = total > MAX_SEARCH_DEPTH
+        reachable = min(total, MAX_SEARCH_DEPTH)
+        if offset >= reachable:
+            return total, [], capped
+        key = (kind, "pgvector", settings.embedding_model, query, filters, total, latest)
+        ranked_ids = get_ranked_ids(key)
+        if ranked_ids is not None and (len(ranked_ids) >= offset + size or len(ranked_ids) >= reachable):
+            return total, ranked_ids[offset : offset + size], capped
+        query_vector = await embed_query(query)
+        if supports_query(query_vector):
+            if page * size > settings.search_result_cache_depth:
+                ranked = await nearest_vectors(kind, db, query_vector, size, offset=offset)
+                return total, [item_id for item_id, _ in ranked], capped
+            ranked_ids = [item_id for item_id, _ in await nearest_vectors(kind, db, query_vector, depth)]
+            set_ranked_ids(key, ranked_ids)
+            return total, ranked_ids[offset : offset + size], capped
 
+    # Only the top candidates are selected and sorted, never the whole index.
+    index = await get_vector_index(kind, db)
+    total = len(index)
+    if not total:
+        return 0, [], False
+    capped = total > MAX_SEARCH_DEPTH
+    reachable = min(total, MAX_SEARCH_DEPTH)
+    if offset >= reachable:
+        return total, [], capped
+    key = (kind, "ivf", settings.embedding_model, query, filters, index.version)
+    ranked_ids = get_ranked_ids(key)
+    if ranked_ids is None or (len(ranked_ids) < offset + size and len(ranked_ids) < reachable):
+        ranked = index.search(query_vector or await embed_query(query), depth)
+        ranked_ids = [item_id for item_id, _ in ranked]
+        set_ranked_ids(key, ranked_ids)
+    return total, ranked_ids[offset : offset + size], capped
 
-def _sim(a, b) -> float:
-    np = _get_numpy()
-    denom = np.linalg.norm(a) * np.linalg.norm(b)
-    if denom == 0:
-        return 0.0
-    return float(np.dot(a, b) / denom)
+
+def _job_text_search(query: str):
+    # Job.search_vector is a stored, GIN-indexed tsvector weighted title > skills > description > location.
+    tsq = func.plainto_tsquery("simple", query)
+    return Job.search_vector.op("@@")(tsq), func.ts_rank(Job.search_vector, tsq)
+
+
+def _fuse_rrf(rankings: list[list[str]], k: int = _RRF_K) -> list[str]:
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores, key=lambda item_id: scores[item_id], reverse=True)
+
+
+async def _hybrid_job_ids(db: AsyncSession, query: str, depth: int) -> tuple[list[str], bool]:
+    # Start the query embedding while Postgres runs the lexical pass; the
+    # semantic pass then reads it from the query cache.
+    embedding = asyncio.create_task(embed_query(normalize_query(query)))
+    try:
+        matches, rank = _job_text_search(query)
+        lexical_ids = list(
+            (
+                await db.scalars(
+                    select(Job.id).where(matches).order_by(rank.desc(), Job.created_at.desc()).limit(depth)
+                )
+            ).all()
+        )
+    except BaseException:
+        embedding.cancel()
+        raise
+
+    try:
+        await embedding
+        _, semantic_ids, _ = await _semantic_page("jobs", db, query, 1, depth)
+    except HTTPException:
+        # Without an embedding the fused order is just the lexical one.
+        semantic_ids = []
+    # A source that filled the whole MAX_SEARCH_DEPTH has more matches than can be fused.
+    capped = depth >= MAX_SEARCH_DEPTH and max(len(lexical_ids), len(semantic_ids)) >= depth
+    return _fuse_rrf([lexical_ids, semantic_ids]), capped
 
 
 async def search_jobs(
@@ -40,92 +138,141 @@ async def search_jobs(
     page: int = 1,
     size: int = 10,
     semantic: bool = False,
+    mode: str | None = None,
+    count: str = "exact",
 ) -> SearchJobsResponse:
+    mode = mode or ("semantic" if semantic else "lexical")
+    semantic = mode != "lexical"
     query = query.strip()
     if not query:
-        return SearchJobsResponse(query=query, semantic=semantic, page=page, size=size, total=0, items=[])
+        return SearchJobsResponse(query=query, semantic=semantic, mode=mode, page=page, size=size, total=0, items=[])
 
     if semantic:
-        jobs = (await db.scalars(select(Job).order_by(Job.created_at.desc()).limit(300))).all()
-        if not jobs:
-            return SearchJobsResponse(query=query, semantic=True, page=page, size=size, total=0, items=[])
-
-        np = _get_numpy()
-        texts = [f"{j.title} {j.description} {' '.join(j.skills)} {j.location}" for j in jobs]
-        vectors = await generate_embeddings([query, *texts])
-        qv = np.array(vectors[0], dtype=np.float32)
-        vecs = np.array(vectors[1:], dtype=np.float32)
-
-        scored = sorted(
-            ((job, _sim(qv, v)) for job, v in zip(jobs, vecs, strict=False)),
-            key=lambda x: x[1],
-            reverse=True,
-        )
-        total = len(scored)
-        chunk = scored[(page - 1) * size : (page - 1) * size + size]
+        if mode == "hybrid":
+            # Each source contributes a bounded candidate list; only their union is ranked.
+            depth = min(max(get_settings().hybrid_search_candidates, page * size), MAX_SEARCH_DEPTH)
+            fused_ids, total_is_capped = await _hybrid_job_ids(db, query, depth)
+            total, page_ids = len(fused_ids), fused_ids[(page - 1) * size : page * size]
+        else:
+            total, page_ids, total_is_capped = await _semantic_page("jobs", db, query, page, size)
+        if not page_ids:
+            return SearchJobsResponse(
+                query=query,
+                semantic=True,
+                mode=mode,
+                page=page,
+                size=size,
+                total=total,
+                total_is_capped=total_is_capped,
+                items=[],
+            )
+
+        jobs_by_id = {job.id: job for job in (await db.scalars(select(Job).where(Job.id.in_(page_ids)))).all()}
+        chunk = [jobs_by_id[job_id] for job_id in page_ids if job_id in jobs_by_id]
         items = [
             SearchJobItem(id=job.id, title=job.title, location=job.location, skills=job.skills)
-            for job, _ in chunk
+            for job in chunk
         ]
-        return SearchJobsResponse(query=query, semantic=True, page=page, size=size, total=total, items=items)
+        return SearchJobsResponse(
+            query=query,
+            semantic=True,
+            mode=mode,
+            page=page,
+            size=size,
+            total=total,
+            total_is_capped=total_is_capped,
+            items=items,
+        )
 
-    tsv = func.to_tsvector(
-        "simple",
-        func.concat_ws(" ", Job.title, Job.description, Job.location, cast(Job.skills, String)),
+    matches, rank = _job_text_search(query)
+    stmt = (
+        select(Job)
+        .where(matches)
+        .order_by(rank.desc(), Job.created_at.desc())
+        .offset((page - 1) * size)
+        .limit(size)
     )
-    tsq = func.plainto_tsquery("simple", query)
 
-    stmt = select(Job).where(tsv.op("@@")(tsq)).order_by(func.ts_rank(tsv, tsq).desc(), Job.created_at.desc())
-    total = len((await db.scalars(stmt)).all())
-    rows = (await db.scalars(stmt.offset((page - 1) * size).limit(size))).all()
+    total_estimated = False
+    total = None
+    if count == "estimated":
+        estimate = await _estimate_job_matches(db, query)
+        # Small estimates are cheap to count exactly, and the planner is least reliable there.
+        if estimate >= get_settings().search_count_estimate_threshold:
+            total, total_estimated = estimate, True
+
+    if total is None:
+        # One round trip: the window count is evaluated over all matches before LIMIT applies.
+        result = (await db.execute(stmt.add_columns(func.count().over().label("total")))).all()
+        rows = [job for job, _ in result]
+        if result:
+            total = result[0].total
+        else:
+            total = await db.scalar(select(func.count()).select_from(Job).where(matches)) if page > 1 else 0
+    else:
+        rows = (await db.scalars(stmt)).all()
 
     return SearchJobsResponse(
         query=query,
         semantic=False,
+        mode=mode,
         page=page,
         size=size,
         total=total,
+        total_estimated=total_estimated,
         items=[SearchJobItem(id=j.id, title=j.title, location=j.location, skills=j.skills) for j in rows],
     )
 
 
+async def _estimate_job_matches(db: AsyncSession, query: str) -> int:
+    plan = await db.scalar(
+        text(
+            "EXPLAIN (FORMAT JSON) SELECT 1 FROM jobs "
+            "WHERE search_vector @@ plainto_tsquery('simple', :query)"
+        ),
+        {"query": query},
+    )
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 async def search_resumes(
     db: AsyncSession,
     query: str,
     page: int = 1,
     size: int = 10,
     semantic: bool = False,
+    skill: list[str] | None = None,
+    skill_match: SkillMatch = "all",
 ) -> SearchResumesResponse:
     query = query.strip()
     if not query:
         return SearchResumesResponse(query=query, semantic=semantic, page=page, size=size, total=0, items=[])
+    skill_terms = normalize_skill_terms(skill)
+    if semantic and skill_terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Skill filters are only supported for lexical resume search",
+        )
 
-    joined = (
-        select(Resume, ResumeParseResult)
-        .join(ResumeParseResult, ResumeParseResult.resume_id == Resume.id)
-        .order_by(Resume.created_at.desc())
-    )
-
-    rows = (await db.execute(joined)).all()
-    if not rows:
-        return SearchResumesResponse(query=query, semantic=semantic, page=page, size=size, total=0, items=[])
+    joined = select(Resume, ResumeParseResult).join(ResumeParseResult, ResumeParseResult.resume_id == Resume.id)
 
     if semantic:
-        np = _get_numpy()
-        texts = [
-            f"skills: {' '.join((p.skills or []))}; experience: {' '.join((p.experience or []))}; education: {' '.join((p.education or []))}"
-            for _, p in rows
-        ]
-        vectors = await generate_embeddings([query, *texts])
-        qv = np.array(vectors[0], dtype=np.float32)
-        vecs = np.array(vectors[1:], dtype=np.float32)
-        scored = sorted(
-            ((pair, _sim(qv, v)) for pair, v in zip(rows, vecs, strict=False)),
-            key=lambda x: x[1],
-            reverse=True,
-        )
-        total = len(scored)
-        chunk = scored[(page - 1) * size : (page - 1) * size + size]
+        total, page_ids, total_is_capped = await _semantic_page("resumes", db, query, page, size)
+        if not page_ids:
+            return SearchResumesResponse(
+                query=query,
+                semantic=True,
+                page=page,
+                size=size,
+                total=total,
+                total_is_capped=total_is_capped,
+                items=[],
+            )
+
+        pairs_by_id = {r.id: (r, p) for r, p in (await db.execute(joined.where(Resume.id.in_(page_ids)))).all()}
+        chunk = [pairs_by_id[resume_id] for resume_id in page_ids if resume_id in pairs_by_id]
         items = [
             SearchResumeItem(
                 resume_id=r.id,
@@ -134,19 +281,40 @@ async def search_resumes(
                 experience=p.experience or [],
                 education=p.education or [],
             )
-            for (r, p), _ in chunk
+            for r, p in chunk
         ]
-        return SearchResumesResponse(query=query, semantic=True, page=page, size=size, total=total, items=items)
+        return SearchResumesResponse(
+            query=query,
+            semantic=True,
+            page=page,
+            size=size,
+            total=total,
+            total_is_capped=total_is_capped,
+            items=items,
+        )
 
-    filtered = []
-    ql = query.lower()
-    for r, p in rows:
-        blob = " ".join((p.skills or []) + (p.experience or []) + (p.education or [])).lower()
-        if ql in blob:
-            filtered.append((r, p))
+    tsq = func.plainto_tsquery("simple", query)
+    needle = "%" + query.replace("/", "//").replace("%", "/%").replace("_", "/_") + "%"
+    matches = or_(
+        ResumeParseResult.search_vector.op("@@")(tsq),
+        ResumeParseResult.search_text.ilike(needle, escape="/"),
+    )
+    if skill_terms:
+        matches = and_(matches, skill_filter(ResumeParseResult.skills_normalized, skill_terms, skill_match))
+    result = (
+        await db.execute(
+            joined.add_columns(func.count().over().label("total"))
+            .where(matches)
+            .order_by(func.ts_rank(ResumeParseResult.search_vector, tsq).desc(), Resume.created_at.desc())
+            .offset((page - 1) * size)
+            .limit(size)
+        )
+    ).all()
+    if result:
+        total = result[0].total
+    else:
+        total = await db.scalar(select(func.count()).select_from(ResumeParseResult).where(matches)) if page > 1 else 0
 
-    total = len(filtered)
-    chunk = filtered[(page - 1) * size : (page - 1) * size + size]
     items = [
         SearchResumeItem(
             resume_id=r.id,
@@ -155,7 +323,7 @@ async def search_resumes(
             experience=p.experience or [],
             education=p.education or [],
         )
-        for r, p in chunk
+        for r, p, _ in result
     ]
 
     return SearchResumesResponse(query=query, semantic=False, page=page, size=size, total=total, items=items)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+_NUMPY = None
+
+
+def _get_numpy():
+    global _NUMPY
+    if _NUMPY is None:
+        import numpy as np
+
+        _NUMPY = np
+    return _NUMPY
+
+
+def encode_vector(vector) -> bytes:
+    np = _get_numpy()
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def decode_vector(raw: bytes):
+    np = _get_numpy()
+    return np.frombuffer(raw, dtype=np.float32)
+
+
+def normalize_rows(vectors):
+    np = _get_numpy()
+    matrix = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    # Zero vectors stay zero so they score 0.0 instead of NaN.
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def top_k_indices(scores, k: int):
+    np = _get_numpy()
+    if k <= 0 or scores.shape[-1] == 0:
+        return np.empty(scores.shape[:-1] + (0,), dtype=np.int64)
+
+    k = min(k, scores.shape[-1])
+    if k < scores.shape[-1]:
+        candidates = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    else:
+        candidates = np.broadcast_to(np.arange(k), scores.shape[:-1] + (k,))
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=-1), axis=-1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=-1)
+
+
+def blocked_top_k(queries, matrix, k: int, block_size: int = 8192):
+    # Rows of both inputs must already be normalised. Only a queries x block_size
+    # score tile plus the running top-k is held at once, so matrix may be a memmap.
+    np = _get_numpy()
+    rows = queries.shape[0]
+    best_idx = np.empty((rows, 0), dtype=np.int64)
+    best_scores = np.empty((rows, 0), dtype=np.float32)
+    for start in range(0, matrix.shape[0], block_size):
+        block = np.asarray(matrix[start : start + block_size])
+        scores = np.concatenate((best_scores, queries @ block.T), axis=1)
+        indices = np.concatenate(
+            (best_idx, np.broadcast_to(np.arange(start, start + block.shape[0]), (rows, block.shape[0]))),
+            axis=1,
+        )
+        keep = top_k_indices(scores, k)
+        best_idx = np.take_along_axis(indices, keep, axis=1)
+        best_scores = np.take_along_axis(scores, keep, axis=1)
+    return best_idx, best_scores
+
+
+class SimilarityMatrix:
+    def __init__(self, ids: Sequence[str], vectors) -> None:
+        np = _get_numpy()
+        self.ids = list(ids)
+        if self.ids:
+            self.matrix = normalize_rows(vectors)
+        else:
+            self.matrix = np.empty((0, 0), dtype=np.float32)
+        if self.matrix.shape[0] != len(self.ids):
+            raise ValueError("ids and vectors must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def scores(self, query):
+        np = _get_numpy()
+        if not self.ids:
+            return np.empty(0, dtype=np.float32)
+        return self.matrix @ normalize_rows(query)[0]
+
+    def top_k(self, query, k: int) -> list[tuple[str, float]]:
+        if not self.ids:
+            return []
+        scores = self.scores(query)
+        return [(self.ids[i], float(scores[i])) for i in top_k_indices(scores, k)]
+
+    def top_k_batch(self, queries, k: int) -> list[list[tuple[str, float]]]:
+        np = _get_numpy()
+        queries = normalize_rows(queries)
+        if not self.ids:
+            return [[] for _ in range(queries.shape[0])]
+
+        scores = queries @ self.matrix.T
+        indices = top_k_indices(scores, k)
+        picked = np.take_along_axis(scores, indices, axis=-1)
+        return [
+            [(self.ids[i], float(score)) for i, score in zip(row_idx, row_scores, strict=True)]
+            for row_idx, row_scores in zip(indices, picked, strict=True)
+        ]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from sqlalchemy import ColumnElement, Text, cast
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+SkillMatch = Literal["all", "any"]
+
+
+def normalize_skill_terms(skills: list[str] | None) -> list[str]:
+    terms: list[str] = []
+    for skill in skills or []:
+        # Accept both repeated ?skill= params and comma-separated values.
+        for part in skill.split(","):
+            term = part.strip().lower()
+            if term and term not in terms:
+                terms.append(term)
+    return terms
+
+
+def skill_filter(column, terms: list[str], match: SkillMatch = "all") -> ColumnElement[bool]:
+    # column is a lowercased JSONB array behind a GIN index; @> and ?| both use it.
+    if match == "any":
+        return column.op("?|")(cast(terms, ARRAY(Text)))
+    return column.op("@>")(cast(terms, JSONB))
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parents[1] / "data" / "skills_taxonomy.json"
+
+# Skills may contain symbols ("c++", "c#", ".net", "node.js"), so boundaries are
+# spelled out instead of relying on \b, which never matches next to "+" or "#".
+_BEFORE = r"(?<![\w.+#-])"
+_AFTER = r"(?![\w+#])"
+
+
+class SkillMatcher:
+    def __init__(self, terms: Mapping[str, str]) -> None:
+        # terms maps each lowercase surface form (name or alias) to its canonical skill.
+        self.terms = {_normalize_term(term): skill for term, skill in terms.items() if _normalize_term(term)}
+        self.pattern = re.compile(_BEFORE + build_trie_pattern(self.terms) + _AFTER) if self.terms else None
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def extract(self, text: str) -> list[str]:
+        if self.pattern is None:
+            return []
+        # One left-to-right scan; the trie makes the longest surface form win at each position.
+        found = {self.terms.get(_normalize_term(match.group())) for match in self.pattern.finditer(text.lower())}
+        found.discard(None)
+        return sorted(found)
+
+
+def build_trie_pattern(terms: Iterable[str]) -> str:
+    # A flat "a|b|c" alternation retries every term at every position; a prefix trie
+    # lets the regex engine drop a branch as soon as one character disagrees.
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _render(trie)
+
+
+def _render(node: dict) -> str:
+    optional = "" in node
+    leaves = sorted(char for char, child in node.items() if char and set(child) == {""})
+    branches = [_char(char) + _render(child) for char, child in sorted(node.items()) if char and char not in leaves]
+    if len(leaves) == 1:
+        branches.append(_char(leaves[0]))
+    elif leaves:
+        branches.append("[" + "".join(re.escape(char) for char in leaves if char != " ") + "]")
+        if " " in leaves:
+            branches.append(r"\s+")
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if optional:
+        return f"(?:{body})?" if len(branches) > 1 or len(body) > 1 else f"{body}?"
+    return body
+
+
+def _char(char: str) -> str:
+    # Multi-word skills tolerate any run of whitespace, including line breaks.
+    return r"\s+" if char == " " else re.escape(char)
+
+
+def _normalize_term(term: str) -> str:
+    return " ".join(term.lower().split())
+
+
+def load_skill_matcher(path: str | Path = DEFAULT_TAXONOMY_PATH) -> SkillMatcher:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    terms: dict[str, str] = {}
+    for entry in payload["skills"]:
+        name = _normalize_term(entry["name"])
+        # Ambiguous short names ("go", "r", "c") are only matched through their aliases.
+        if entry.get("match_name", True):
+            terms.setdefault(name, name)
+        for alias in entry.get("aliases", []):
+            terms.setdefault(_normalize_term(alias), name)
+    return SkillMatcher(terms)
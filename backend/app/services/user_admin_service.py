@@ -2,6 +2,7 @@ from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from app.core.pagination import keyset_order, next_cursor, wants_total
 from app.models.user_model import User
 from app.schemas.user_admin_schema import UserListResponse, UserUpdateRequest, UserUpdateResponse
 
@@ -13,6 +14,8 @@ async def list_users(
     role: str | None = None,
     is_active: bool | None = None,
     q: str | None = None,
+    cursor: str | None = None,
+    include_total: bool | None = None,
 ) -> UserListResponse:
     filters = []
     if role:
@@ -30,18 +33,26 @@ async def list_users(
             )
         )
 
-    total_stmt = select(func.count()).select_from(User)
-    if filters:
-        total_stmt = total_stmt.where(*filters)
-    total = (await db.execute(total_stmt)).scalar_one()
+    total = None
+    if wants_total(cursor, include_total):
+        total_stmt = select(func.count()).select_from(User)
+        if filters:
+            total_stmt = total_stmt.where(*filters)
+        total = (await db.execute(total_stmt)).scalar_one()
 
     stmt = select(User)
     if filters:
         stmt = stmt.where(*filters)
-    stmt = stmt.order_by(User.created_at.desc()).offset((page - 1) * size).limit(size)
+    stmt = keyset_order(stmt, User.created_at, User.id, cursor)
+    if not cursor:
+        stmt = stmt.offset((page - 1) * size)
 
-    users = (await db.scalars(stmt)).all()
-    return UserListResponse(page=page, size=size, total=total, items=users)
+    users, cursor_out = next_cursor(
+        list((await db.scalars(stmt.limit(size + 1))).all()),
+        size,
+        lambda user: (user.created_at, user.id),
+    )
+    return UserListResponse(page=page, size=size, total=total, next_cursor=cursor_out, items=users)
 
 
 async def update_user(
@@ -8,6 +8,16 @@ def enqueue_resume_processing(resume_id: str) -> str | None:
         return None
 
 
+def enqueue_resume_batch_processing(resume_ids: list[str]) -> str | None:
+    try:
+        from app.tasks.resume_tasks import process_resume_batch
+
+        task = process_resume_batch.delay(resume_ids)
+        return task.id
+    except Exception:
+        return None
+
+
 def enqueue_resume_feedback_generation(resume_id: str, user_id: str) -> str | None:
     try:
         from app.tasks.feedback_tasks import generate_resume_feedback_task
@@ -18,6 +28,26 @@ def enqueue_resume_feedback_generation(resume_id: str, user_id: str) -> str | No
         return None
 
 
+def enqueue_job_candidate_matching(job_id: str) -> str | None:
+    try:
+        from app.tasks.matching_tasks import match_job_candidates_task
+
+        task = match_job_candidates_task.delay(job_id)
+        return task.id
+    except Exception:
+        return None
+
+
+def enqueue_job_embedding_refresh(job_id: str) -> str | None:
+    try:
+        from app.tasks.embedding_tasks import refresh_job_embedding_task
+
+        task = refresh_job_embedding_task.delay(job_id)
+        return task.id
+    except Exception:
+        return None
+
+
 def enqueue_email_notification(to_email: str, subject: str, body: str) -> str | None:
     try:
         from app.tasks.email_tasks import send_email_task
@@ -28,6 +58,16 @@ def enqueue_email_notification(to_email: str, subject: str, body: str) -> str |
         return None
 
 
+def enqueue_bulk_email_notification(to_emails: list[str], subject: str, body: str) -> str | None:
+    try:
+        from app.tasks.email_tasks import send_bulk_email_task
+
+        task = send_bulk_email_task.delay(to_emails, subject, body)
+        return task.id
+    except Exception:
+        return None
+
+
 def get_task_status(task_id: str) -> dict:
     from app.tasks.celery_app import celery_app
 
@@ -1,6 +1,15 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
 from celery import Celery
+from celery.schedules import crontab
 
 from app.core.config import get_settings
+from app.services.embedding_cache_service import close_embedding_cache
+from app.services.embedding_service import close_embedding_client
+
+T = TypeVar("T")
 
 settings = get_settings()
 
@@ -8,6 +17,14 @@ celery_app = Celery(
     "talent_intelligence",
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend,
+    include=[
+        "app.tasks.resume_tasks",
+        "app.tasks.feedback_tasks",
+        "app.tasks.email_tasks",
+        "app.tasks.matching_tasks",
+        "app.tasks.match_matrix_tasks",
+        "app.tasks.embedding_tasks",
+    ],
 )
 
 # Fail fast when broker is unavailable (common in local dev without Redis)
@@ -17,3 +34,26 @@ celery_app.conf.update(
     task_ignore_result=False,
     task_track_started=True,
 )
+
+celery_app.conf.beat_schedule = {
+    "precompute-match-matrix": {
+        "task": "app.tasks.match_matrix_tasks.precompute_match_matrix_task",
+        "schedule": crontab(hour=settings.match_matrix_schedule_hour, minute=0),
+    },
+    "backfill-embeddings": {
+        "task": "app.tasks.embedding_tasks.backfill_embeddings_task",
+        "schedule": settings.embedding_backfill_seconds,
+    },
+}
+
+
+def run_task(coro: Coroutine[Any, Any, T]) -> T:
+    # Each task runs in a fresh event loop; clients bound to it are closed before it ends.
+    async def scoped() -> T:
+        try:
+            return await coro
+        finally:
+            await close_embedding_client()
+            await close_embedding_cache()
+
+    return asyncio.run(scoped())
@@ -1,4 +1,4 @@
-from app.services.email_service import send_email_smtp
+from app.services.email_service import send_bulk_email_smtp, send_email_smtp
 from app.tasks.celery_app import celery_app
 
 
@@ -9,3 +9,12 @@ def send_email_task(to_email: str, subject: str, body: str) -> dict[str, str]:
         return {"status": "sent", "to": to_email}
     except Exception as exc:
         return {"status": "failed", "error": str(exc), "to": to_email}
+
+
+@celery_app.task(name="app.tasks.email_tasks.send_bulk_email_task")
+def send_bulk_email_task(to_emails: list[str], subject: str, body: str) -> dict[str, str | int | list[str]]:
+    try:
+        failed = send_bulk_email_smtp(to_emails=to_emails, subject=subject, body=body)
+        return {"status": "sent", "sent": len(to_emails) - len(failed), "failed": failed}
+    except Exception as exc:
+        return {"status": "failed", "error": str(exc), "sent": 0, "failed": to_emails}
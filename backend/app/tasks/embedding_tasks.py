@@ -0,0 +1,36 @@
+from sqlalchemy import select
+
+from app.core.database import AsyncSessionLocal
+from app.models.job_model import Job
+from app.services.job_embedding_service import backfill_job_embeddings, refresh_job_embedding
+from app.services.resume_embedding_service import backfill_resume_embeddings
+from app.tasks.celery_app import celery_app, run_task
+
+
+async def _refresh_job_embedding_async(job_id: str) -> dict[str, str]:
+    async with AsyncSessionLocal() as session:
+        job = await session.scalar(select(Job).where(Job.id == job_id))
+        if not job:
+            return {"job_id": job_id, "status": "not_found"}
+        await refresh_job_embedding(job, session)
+        await session.commit()
+        return {"job_id": job_id, "status": "refreshed"}
+
+
+async def _backfill_embeddings_async() -> dict[str, str]:
+    async with AsyncSessionLocal() as session:
+        await backfill_job_embeddings(session)
+        await backfill_resume_embeddings(session)
+        await session.commit()
+        return {"status": "completed"}
+
+
+@celery_app.task(name="app.tasks.embedding_tasks.refresh_job_embedding_task")
+def refresh_job_embedding_task(job_id: str) -> dict[str, str]:
+    return run_task(_refresh_job_embedding_async(job_id))
+
+
+@celery_app.task(name="app.tasks.embedding_tasks.backfill_embeddings_task")
+def backfill_embeddings_task() -> dict[str, str]:
+    # Scheduled by beat so request handlers, searches included, never embed missing rows themselves.
+    return run_task(_backfill_embeddings_async())
@@ -1,5 +1,3 @@
-import asyncio
-
 from sqlalchemy import select
 
 from app.core.database import AsyncSessionLocal
@@ -7,7 +5,7 @@ from app.models.resume_feedback_model import ResumeFeedback
 from app.models.resume_model import Resume
 from app.models.resume_parse_model import ResumeParseResult
 from app.services.resume_feedback_service import _generate_feedback
-from app.tasks.celery_app import celery_app
+from app.tasks.celery_app import celery_app, run_task
 
 
 async def _generate_resume_feedback_async(resume_id: str, user_id: str) -> dict[str, str]:
@@ -47,4 +45,4 @@ async def _generate_resume_feedback_async(resume_id: str, user_id: str) -> dict[
 
 @celery_app.task(name="app.tasks.feedback_tasks.generate_resume_feedback_task")
 def generate_resume_feedback_task(resume_id: str, user_id: str) -> dict[str, str]:
-    return asyncio.run(_generate_resume_feedback_async(resume_id=resume_id, user_id=user_id))
+    return run_task(_generate_resume_feedback_async(resume_id=resume_id, user_id=user_id))
@@ -0,0 +1,15 @@
+from app.core.database import AsyncSessionLocal
+from app.services.match_matrix_service import precompute_match_matrix
+from app.tasks.celery_app import celery_app, run_task
+
+
+async def _precompute_match_matrix_async() -> dict[str, str | int | float]:
+    async with AsyncSessionLocal() as session:
+        result = await precompute_match_matrix(session)
+        await session.commit()
+        return result
+
+
+@celery_app.task(name="app.tasks.match_matrix_tasks.precompute_match_matrix_task")
+def precompute_match_matrix_task() -> dict[str, str | int | float]:
+    return run_task(_precompute_match_matrix_async())
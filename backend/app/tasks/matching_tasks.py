@@ -0,0 +1,30 @@
+from fastapi import HTTPException
+
+from app.core.database import AsyncSessionLocal
+from app.services.candidate_matching_service import match_job_to_candidates
+from app.tasks.celery_app import celery_app, run_task
+
+
+async def _match_job_candidates_async(job_id: str) -> dict[str, str | int]:
+    async with AsyncSessionLocal() as session:
+        try:
+            result = await match_job_to_candidates(job_id, session)
+        except HTTPException as exc:
+            await session.rollback()
+            return {"job_id": job_id, "status": "failed", "error": str(exc.detail)}
+        await session.commit()
+        return result
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.matching_tasks.match_job_candidates_task",
+    max_retries=3,
+    default_retry_delay=5,
+)
+def match_job_candidates_task(self, job_id: str) -> dict[str, str | int]:
+    result = run_task(_match_job_candidates_async(job_id))
+    # The task is queued before the request transaction commits, so the job may not be visible yet.
+    if result["status"] == "not_found" and self.request.retries < self.max_retries:
+        raise self.retry()
+    return result
@@ -1,54 +1,84 @@
-import asyncio
-
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import AsyncSessionLocal
 from app.models.resume_model import Resume
 from app.models.resume_parse_model import ResumeParseResult
-from app.services.resume_parser_service import parse_resume_file
-from app.tasks.celery_app import celery_app
+from app.services.resume_embedding_service import refresh_resume_embedding
+from app.services.resume_parser_service import extract_resume_text, parse_resume_texts
+from app.tasks.celery_app import celery_app, run_task
 
 
-async def _process_resume_async(resume_id: str) -> dict[str, str]:
+async def _process_resumes_async(resume_ids: list[str]) -> list[dict[str, str]]:
     async with AsyncSessionLocal() as session:
-        resume = await session.scalar(select(Resume).where(Resume.id == resume_id))
-        if not resume:
-            return {"resume_id": resume_id, "status": "not_found"}
+        resumes = (await session.scalars(select(Resume).where(Resume.id.in_(resume_ids)))).all()
+        results = {resume_id: {"resume_id": resume_id, "status": "not_found"} for resume_id in resume_ids}
+        for resume in resumes:
+            resume.processing_status = "processing"
+        await session.commit()
+
+        texts: dict[str, str] = {}
+        for resume in resumes:
+            try:
+                texts[resume.id] = extract_resume_text(resume.file_path)
+            except Exception as exc:
+                resume.processing_status = "failed"
+                results[resume.id] = {"resume_id": resume.id, "status": "failed", "error": str(exc)}
 
+        # Text extraction is per file; NER runs once for the whole batch.
         try:
-            resume.processing_status = "processing"
-            await session.flush()
-
-            parsed = parse_resume_file(resume.file_path)
-
-            existing = await session.scalar(select(ResumeParseResult).where(ResumeParseResult.resume_id == resume.id))
-            if existing:
-                existing.skills = parsed["skills"]
-                existing.experience = parsed["experience"]
-                existing.education = parsed["education"]
-                existing.entities = parsed["entities"]
-                existing.parser_source = parsed["parser_source"]
-            else:
-                session.add(
-                    ResumeParseResult(
-                        resume_id=resume.id,
-                        skills=parsed["skills"],
-                        experience=parsed["experience"],
-                        education=parsed["education"],
-                        entities=parsed["entities"],
-                        parser_source=parsed["parser_source"],
-                    )
-                )
-
-            resume.processing_status = "parsed"
-            await session.commit()
-            return {"resume_id": resume_id, "status": "parsed"}
+            parsed_batch = parse_resume_texts(list(texts.values()))
         except Exception as exc:
-            resume.processing_status = "failed"
+            for resume in resumes:
+                if resume.id in texts:
+                    resume.processing_status = "failed"
+                    results[resume.id] = {"resume_id": resume.id, "status": "failed", "error": str(exc)}
             await session.commit()
-            return {"resume_id": resume_id, "status": "failed", "error": str(exc)}
+            return [results[resume_id] for resume_id in resume_ids]
+
+        resumes_by_id = {resume.id: resume for resume in resumes}
+        for resume_id, parsed in zip(texts, parsed_batch, strict=True):
+            resume = resumes_by_id[resume_id]
+            try:
+                async with session.begin_nested():
+                    await _store_parsed(session, resume, parsed)
+                resume.processing_status = "parsed"
+                results[resume_id] = {"resume_id": resume_id, "status": "parsed"}
+            except Exception as exc:
+                resume.processing_status = "failed"
+                results[resume_id] = {"resume_id": resume_id, "status": "failed", "error": str(exc)}
+        await session.commit()
+        return [results[resume_id] for resume_id in resume_ids]
+
+
+async def _store_parsed(session: AsyncSession, resume: Resume, parsed: dict) -> None:
+    existing = await session.scalar(select(ResumeParseResult).where(ResumeParseResult.resume_id == resume.id))
+    if existing:
+        existing.skills = parsed["skills"]
+        existing.experience = parsed["experience"]
+        existing.education = parsed["education"]
+        existing.entities = parsed["entities"]
+        existing.parser_source = parsed["parser_source"]
+    else:
+        existing = ResumeParseResult(
+            resume_id=resume.id,
+            skills=parsed["skills"],
+            experience=parsed["experience"],
+            education=parsed["education"],
+            entities=parsed["entities"],
+            parser_source=parsed["parser_source"],
+        )
+        session.add(existing)
+
+    await session.flush()
+    await refresh_resume_embedding(existing, session)
 
 
 @celery_app.task(name="app.tasks.resume_tasks.process_resume")
 def process_resume(resume_id: str) -> dict[str, str]:
-    return asyncio.run(_process_resume_async(resume_id))
+    return run_task(_process_resumes_async([resume_id]))[0]
+
+
+@celery_app.task(name="app.tasks.resume_tasks.process_resume_batch")
+def process_resume_batch(resume_ids: list[str]) -> list[dict[str, str]]:
+    return run_task(_process_resumes_async(resume_ids))
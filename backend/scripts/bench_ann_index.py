@@ -0,0 +1,65 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.ann_index_service import IVFIndex  # noqa: E402
+from app.services.similarity_service import SimilarityMatrix  # noqa: E402
+
+
+def _clustered_vectors(rng, count: int, dim: int, topics: int):
+    # Embeddings of job/resume text cluster by topic; uniform noise would be a worst case for IVF.
+    centers = rng.standard_normal((topics, dim)).astype(np.float32)
+    labels = rng.integers(0, topics, count)
+    return centers[labels] + 0.6 * rng.standard_normal((count, dim)).astype(np.float32)
+
+
+def _mean_ms(fn, queries) -> float:
+    started = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - started) * 1e3 / len(queries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="IVF recall@k vs latency against exact search")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--topics", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32, 64])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = _clustered_vectors(rng, args.size, args.dim, args.topics)
+    queries = _clustered_vectors(rng, args.queries, args.dim, args.topics)
+    ids = [str(i) for i in range(args.size)]
+
+    exact = SimilarityMatrix(ids, vectors)
+    started = time.perf_counter()
+    index = IVFIndex()
+    index.add(ids, vectors)
+    index.train()
+    build_s = time.perf_counter() - started
+    print(f"{args.size} vectors, dim {args.dim}, nlist {index.centroids.shape[0]}, build {build_s:.1f}s")
+
+    truth = [{item_id for item_id, _ in exact.top_k(query, args.k)} for query in queries]
+    exact_ms = _mean_ms(lambda query: exact.top_k(query, args.k), queries)
+    print(f"{'nprobe':>8} {'recall@' + str(args.k):>10} {'ms/query':>10} {'speedup':>8}")
+    print(f"{'exact':>8} {1.0:>10.3f} {exact_ms:>10.3f} {1.0:>7.1f}x")
+    for nprobe in args.nprobe:
+        hits = 0
+        for query, expected in zip(queries, truth, strict=True):
+            hits += len(expected.intersection(item_id for item_id, _ in index.search(query, args.k, nprobe=nprobe)))
+        latency = _mean_ms(lambda query, nprobe=nprobe: index.search(query, args.k, nprobe=nprobe), queries)
+        recall = hits / (args.k * len(queries))
+        print(f"{nprobe:>8} {recall:>10.3f} {latency:>10.3f} {exact_ms / latency:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
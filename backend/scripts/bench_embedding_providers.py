@@ -0,0 +1,99 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+_WORDS = "python django fastapi postgres aws docker kubernetes react typescript java spark kafka terraform".split()
+
+
+def _stub_handler(dim: int, latency_ms: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+            data = [
+                {"index": idx, "embedding": [((zlib.crc32(text.encode()) >> (j % 24)) & 255) / 255 for j in range(dim)]}
+                for idx, text in enumerate(body["input"])
+            ]
+            payload = json.dumps({"data": data}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    return Handler
+
+
+def _texts(count: int, words: int) -> list[str]:
+    return [
+        "Skills: " + ", ".join(_WORDS[(idx + j) % len(_WORDS)] for j in range(words)) + f"\nResume {idx}"
+        for idx in range(count)
+    ]
+
+
+async def _timed(provider, texts: list[str]) -> float:
+    started = time.perf_counter()
+    vectors = await provider.embed(texts)
+    elapsed = time.perf_counter() - started
+    if len(vectors) != len(texts):
+        raise SystemExit(f"{provider.name}: expected {len(texts)} vectors, got {len(vectors)}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP embedding provider (local stub) vs local hashing provider")
+    parser.add_argument("--texts", type=int, default=2_000)
+    parser.add_argument("--words", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="simulated per-request API latency")
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _stub_handler(args.dim, args.latency_ms))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ.update(
+        EMBEDDING_PROVIDER="http",
+        EMBEDDING_API_URL=f"http://127.0.0.1:{server.server_port}/v1/embeddings",
+        EMBEDDING_API_KEY="bench",
+        EMBEDDING_BATCH_SIZE=str(args.batch_size),
+    )
+
+    from app.services.embedding_service import HTTPEmbeddingProvider, close_embedding_client
+    from app.services.local_embedding_service import HashingEmbeddingProvider
+
+    texts = _texts(args.texts, args.words)
+
+    async def run() -> None:
+        print(f"{'provider':>10} {'texts':>7} {'total ms':>10} {'ms/text':>9} {'texts/s':>10}")
+        for provider in (HTTPEmbeddingProvider(), HashingEmbeddingProvider(args.dim)):
+            await _timed(provider, texts[:8])
+            elapsed = await _timed(provider, texts)
+            print(
+                f"{provider.name:>10} {len(texts):>7} {elapsed * 1e3:>10.1f}"
+                f" {elapsed * 1e3 / len(texts):>9.3f} {len(texts) / elapsed:>10.0f}"
+            )
+        await close_embedding_client()
+
+    try:
+        asyncio.run(run())
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
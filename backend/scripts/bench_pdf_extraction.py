@@ -0,0 +1,114 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+_WORDS = (
+    "python django fastapi postgres aws docker kubernetes react typescript java spark kafka terraform "
+    "led designed migrated reduced latency throughput platform services team customers pipeline"
+).split()
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_synthetic_pdf(path: Path, pages: int, lines_per_page: int, seed: int) -> None:
+    # Minimal hand-written PDF: one Helvetica text stream per page, so no PDF-writing dependency is needed.
+    objects: list[bytes] = [b"", b""]
+    page_ids: list[int] = []
+    font_id = 3
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for page in range(pages):
+        lines = [
+            " ".join(_WORDS[(seed + page * 7 + line * 3 + j) % len(_WORDS)] for j in range(12))
+            for line in range(lines_per_page)
+        ]
+        ops = ["BT", "/F1 9 Tf", "11 TL", "40 800 Td"]
+        ops.extend(f"({_pdf_escape(line)}) Tj T*" for line in lines)
+        ops.append("ET")
+        stream = "\n".join(ops).encode()
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents %d 0 R"
+            b" /Resources << /Font << /F1 %d 0 R >> >> >>" % (content_id, font_id)
+        )
+        page_ids.append(len(objects))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    kids = b" ".join(b"%d 0 R" % pid for pid in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(page_ids)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+def _serial_full(path: Path) -> str:
+    # The previous implementation: every page, serially, no budget.
+    from pypdf import PdfReader
+
+    return "\n".join(page.extract_text() or "" for page in PdfReader(str(path)).pages)
+
+
+def _timed(label: str, extract, paths: list[Path], pages_per_doc: int) -> None:
+    started = time.perf_counter()
+    chars = sum(len(extract(path)) for path in paths)
+    elapsed = time.perf_counter() - started
+    pages = len(paths) * pages_per_doc
+    print(f"{label:>22} {elapsed:>9.2f} {len(paths) / elapsed:>9.1f} {pages / elapsed:>11.1f} {chars:>12}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PDF text extraction throughput on a synthetic corpus")
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--lines-per-page", type=int, default=60)
+    parser.add_argument("--budget", type=int, default=50_000, help="RESUME_TEXT_CHAR_BUDGET for the new path")
+    parser.add_argument("--workers", type=int, default=4, help="RESUME_PDF_PAGE_WORKERS for the parallel path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for idx in range(args.docs):
+            path = Path(tmp) / f"doc_{idx}.pdf"
+            write_synthetic_pdf(path, args.pages, args.lines_per_page, seed=idx)
+            paths.append(path)
+
+        print(f"{args.docs} docs x {args.pages} pages, budget {args.budget} chars")
+        print(f"{'mode':>22} {'seconds':>9} {'docs/s':>9} {'pages/s':>11} {'chars':>12}")
+        _timed("serial, no budget", _serial_full, paths, args.pages)
+
+        modes = (
+            ("serial, budget", {"RESUME_PDF_PAGE_WORKERS": "1"}, args.budget),
+            ("parallel, no budget", {"RESUME_PDF_PAGE_WORKERS": str(args.workers)}, 0),
+            ("parallel, budget", {"RESUME_PDF_PAGE_WORKERS": str(args.workers)}, args.budget),
+        )
+        from app.core.config import get_settings
+        from app.services import resume_parser_service
+
+        for label, env, budget in modes:
+            os.environ.update(env, RESUME_TEXT_CHAR_BUDGET=str(budget), RESUME_PDF_PARALLEL_MIN_PAGES="2")
+            get_settings.cache_clear()
+            resume_parser_service.settings = get_settings()
+            # Warm the page pool so process start-up is not billed to the first document.
+            resume_parser_service._extract_text_from_pdf(paths[0])
+            _timed(label, resume_parser_service._extract_text_from_pdf, paths, args.pages)
+
+        if resume_parser_service._PAGE_POOL is not None:
+            resume_parser_service._PAGE_POOL.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.similarity_service import SimilarityMatrix  # noqa: E402
+
+
+def _loop_top_k(query, vectors, k: int) -> list[tuple[int, float]]:
+    # Baseline: the per-row cosine loop plus full sort used before SimilarityMatrix.
+    scored = []
+    for idx, vec in enumerate(vectors):
+        denom = np.linalg.norm(query) * np.linalg.norm(vec)
+        scored.append((idx, 0.0 if denom == 0 else float(np.dot(query, vec) / denom)))
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored[:k]
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-row cosine loop vs SimilarityMatrix top-k")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'jobs':>8} {'loop ms':>10} {'matrix ms':>10} {'batch ms/q':>11} {'build ms':>9} {'speedup':>8}")
+    for size in args.sizes:
+        vectors = rng.standard_normal((size, args.dim), dtype=np.float32)
+        queries = rng.standard_normal((args.batch, args.dim), dtype=np.float32)
+        ids = [str(i) for i in range(size)]
+
+        build = _best_of(lambda: SimilarityMatrix(ids, vectors), 1)
+        matrix = SimilarityMatrix(ids, vectors)
+
+        expected = [str(idx) for idx, _ in _loop_top_k(queries[0], vectors, args.k)]
+        actual = [job_id for job_id, _ in matrix.top_k(queries[0], args.k)]
+        if expected != actual:
+            raise SystemExit(f"top-k mismatch at {size} jobs")
+
+        loop = _best_of(lambda: _loop_top_k(queries[0], vectors, args.k), 1 if size >= 100_000 else args.repeat)
+        single = _best_of(lambda: matrix.top_k(queries[0], args.k), args.repeat)
+        batch = _best_of(lambda: matrix.top_k_batch(queries, args.k), args.repeat) / args.batch
+        print(
+            f"{size:>8} {loop * 1e3:>10.2f} {single * 1e3:>10.3f} {batch * 1e3:>11.3f}"
+            f" {build * 1e3:>9.1f} {loop / single:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.skill_taxonomy_service import SkillMatcher, load_skill_matcher  # noqa: E402
+
+_FILLER = "led designed migrated reduced latency for the platform team and shipped services to customers".split()
+
+
+def _synthetic_terms(count: int, rng: random.Random) -> dict[str, str]:
+    terms: dict[str, str] = {}
+    while len(terms) < count:
+        words = [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+            for _ in range(rng.choice((1, 1, 1, 2, 3)))
+        ]
+        name = " ".join(words)
+        terms[name] = name
+        if rng.random() < 0.3:
+            terms[name.replace(" ", "-") + rng.choice(("js", ".js", "db", "++"))] = name
+    return terms
+
+
+def _documents(count: int, words: int, vocab: list[str], rng: random.Random) -> list[str]:
+    docs = []
+    for _ in range(count):
+        tokens = [rng.choice(vocab) if rng.random() < 0.05 else rng.choice(_FILLER) for _ in range(words)]
+        docs.append(" ".join(tokens))
+    return docs
+
+
+def _naive(terms: dict[str, str], text: str) -> list[str]:
+    # The previous approach: one substring scan per vocabulary entry.
+    lowered = text.lower()
+    return sorted({skill for term, skill in terms.items() if term in lowered})
+
+
+def _timed(label: str, extract, docs: list[str]) -> None:
+    started = time.perf_counter()
+    hits = sum(len(extract(doc)) for doc in docs)
+    elapsed = time.perf_counter() - started
+    print(f"{label:>20} {elapsed * 1e3 / len(docs):>10.3f} {len(docs) / elapsed:>10.1f} {hits:>8}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Skill extraction: trie-compiled regex vs naive substring scan")
+    parser.add_argument("--vocab", type=int, default=10_000)
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--words", type=int, default=800)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    taxonomy = load_skill_matcher().terms
+    terms = {**_synthetic_terms(args.vocab - len(taxonomy), rng), **taxonomy}
+    docs = _documents(args.docs, args.words, list(terms), rng)
+
+    started = time.perf_counter()
+    matcher = SkillMatcher(terms)
+    build_ms = (time.perf_counter() - started) * 1e3
+    started = time.perf_counter()
+    alternation = "|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    flat = re.compile(r"(?<![\w.+#-])(?:" + alternation + r")(?![\w+#])")
+    flat_ms = (time.perf_counter() - started) * 1e3
+
+    print(f"{len(terms)} surface forms, {args.docs} docs x {args.words} words")
+    print(f"build: trie regex {build_ms:.1f} ms ({len(matcher.pattern.pattern)} chars), flat {flat_ms:.1f} ms")
+    print(f"{'method':>20} {'ms/doc':>10} {'docs/s':>10} {'hits':>8}")
+    _timed("trie regex", matcher.extract, docs)
+    _timed("flat alternation", lambda doc: sorted({terms[m.group()] for m in flat.finditer(doc.lower())}), docs)
+    _timed("naive substring", lambda doc: _naive(terms, doc), docs)
+
+
+if __name__ == "__main__":
+    main()
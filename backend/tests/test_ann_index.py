@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from app.services.ann_index_service import IVFIndex
+from app.services.similarity_service import normalize_rows
+
+
+def _exact(ids, vectors, query, k):
+    scores = normalize_rows(vectors) @ normalize_rows(query)[0]
+    order = np.argsort(-scores, kind="stable")[:k]
+    return [ids[idx] for idx in order]
+
+
+@pytest.fixture
+def catalog():
+    rng = np.random.default_rng(7)
+    vectors = rng.standard_normal((600, 32)).astype(np.float32)
+    return [f"item-{idx}" for idx in range(len(vectors))], vectors
+
+
+@pytest.mark.parametrize("trained", [False, True])
+def test_search_matches_exact_search(catalog, trained):
+    ids, vectors = catalog
+    index = IVFIndex(nprobe=4, min_train_size=100)
+    index.add(ids, vectors)
+    if trained:
+        index.train()
+    rng = np.random.default_rng(1)
+    for query in rng.standard_normal((5, 32)).astype(np.float32):
+        # Probing every list makes IVF search exhaustive, so it must agree with brute force.
+        nprobe = len(index.centroids) if trained else None
+        found = [item_id for item_id, _ in index.search(query[None, :], 10, nprobe=nprobe)]
+        assert found == _exact(ids, vectors, query[None, :], 10)
+
+
+def test_add_and_remove_after_training(catalog):
+    ids, vectors = catalog
+    index = IVFIndex(nprobe=4, min_train_size=100)
+    index.add(ids[:500], vectors[:500])
+    index.train()
+    index.add(ids[500:], vectors[500:])
+    removed = set(ids[::3])
+    index.remove(sorted(removed))
+    # Re-adding an id replaces its vector instead of duplicating it.
+    index.add([ids[1]], vectors[2:3])
+
+    live = [item_id for item_id in ids if item_id not in removed]
+    live_vectors = np.vstack([vectors[2] if item_id == ids[1] else vectors[ids.index(item_id)] for item_id in live])
+    assert len(index) == len(live)
+    assert sorted(index.ids) == sorted(live)
+
+    query = live_vectors[5:6]
+    found = [item_id for item_id, _ in index.search(query, 15, nprobe=len(index.centroids))]
+    assert found == _exact(live, live_vectors, query, 15)
+    assert not removed.intersection(found)
+
+
+def test_needs_training_once_large_enough(catalog):
+    ids, vectors = catalog
+    index = IVFIndex(min_train_size=100)
+    index.add(ids[:50], vectors[:50])
+    assert not index.needs_training()
+    index.add(ids[50:], vectors[50:])
+    assert index.needs_training()
+    index.train()
+    assert not index.needs_training()
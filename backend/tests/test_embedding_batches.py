@@ -0,0 +1,25 @@
+from app.services.embedding_service import _approx_tokens, _split_batches
+
+
+def test_split_batches_respects_item_limit():
+    texts = [f"text {idx}" for idx in range(7)]
+    batches = _split_batches(texts, max_items=3, max_tokens=10_000)
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert [text for batch in batches for text in batch] == texts
+
+
+def test_split_batches_respects_token_limit():
+    texts = ["a" * 40, "b" * 40, "c" * 40]
+    limit = _approx_tokens(texts[0]) * 2
+    batches = _split_batches(texts, max_items=100, max_tokens=limit)
+    assert batches == [texts[:2], texts[2:]]
+
+
+def test_oversized_text_gets_its_own_batch():
+    texts = ["short", "x" * 4000, "short"]
+    batches = _split_batches(texts, max_items=100, max_tokens=50)
+    assert batches == [["short"], ["x" * 4000], ["short"]]
+
+
+def test_split_batches_empty():
+    assert _split_batches([], max_items=10, max_tokens=100) == []
@@ -0,0 +1,16 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services.experience_pattern_service import extract_experience_spans
+
+_CORPUS = Path(__file__).resolve().parents[1] / "scripts" / "fixtures" / "experience_corpus.json"
+_RESUMES = json.loads(_CORPUS.read_text(encoding="utf-8"))["resumes"]
+
+
+@pytest.mark.parametrize("resume", _RESUMES, ids=[f"resume-{idx}" for idx in range(len(_RESUMES))])
+def test_experience_corpus(resume):
+    spans = extract_experience_spans(resume["text"])
+    assert [[span.kind, span.text] for span in spans] == resume["expected"]
+    assert all(resume["text"][span.start : span.end] == span.text for span in spans)
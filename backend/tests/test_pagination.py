@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import decode_cursor, encode_cursor, next_cursor
+
+
+@pytest.mark.parametrize(
+    "created_at",
+    [datetime(2026, 10, 18, 12, 30, 5, 123456), datetime(2026, 1, 1, tzinfo=timezone.utc)],
+)
+def test_cursor_round_trip(created_at):
+    cursor = encode_cursor(created_at, "0f3c2a9e-row")
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, "0f3c2a9e-row")
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "!!!", encode_cursor(datetime(2026, 1, 1), "id")[:-3]])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as excinfo:
+        decode_cursor(cursor)
+    assert excinfo.value.status_code == 400
+
+
+def test_next_cursor_only_when_more_rows():
+    rows = [(datetime(2026, 1, day), f"id-{day}") for day in range(3, 0, -1)]
+    page, cursor = next_cursor(rows, 3, key=lambda row: row)
+    assert page == rows and cursor is None
+
+    page, cursor = next_cursor(rows, 2, key=lambda row: row)
+    assert page == rows[:2]
+    assert decode_cursor(cursor) == rows[1]